@@ -0,0 +1,172 @@
+# Standard Library
+import json
+import time
+
+# Third-Party
+import django_rq
+from django_redis import get_redis_connection
+from rest_framework.exceptions import NotFound
+from rest_framework.permissions import AllowAny
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param
+from rest_framework.views import APIView
+
+# Django
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.urls import reverse
+
+
+# Query parameter asking for the async mode; `Prefer: respond-async` works
+# too.
+ASYNC_QUERY_PARAM = 'async'
+
+# Seconds a client should wait between polls.
+RETRY_AFTER = 2
+
+
+def wants_async(request):
+    if 'respond-async' in request.META.get('HTTP_PREFER', ''):
+        return True
+    value = request.query_params.get(ASYNC_QUERY_PARAM, '')
+    return value.lower() in ['1', 'true', 'yes']
+
+
+def run_deferred(key, func, args):
+    """Job entry point; see DeferredReport."""
+    return DeferredReport(key).run(func, args)
+
+
+class DeferredReport(object):
+    """
+    A report rendered on the `high` queue instead of in the request.
+
+    `key` names the report, e.g. its fingerprint.  Status and the URL to
+    fetch the finished file from are kept in Redis for the client to poll;
+    a pending marker keeps a report from being queued twice while it is
+    waiting or rendering.
+    """
+
+    QUEUE = 'high'
+
+    # Status outlives any render; the marker, any sane queue backlog.
+    TIMEOUT = 60 * 60
+    PENDING_TIMEOUT = 60 * 15
+
+    def __init__(self, key):
+        self.key = key
+        self.status_key = cache.make_key('deferred_report_{0}'.format(key))
+        self.pending_key = cache.make_key('deferred_report_{0}_pending'.format(key))
+        self.connection = get_redis_connection('default')
+
+    def get_status(self):
+        raw = self.connection.get(self.status_key)
+        return json.loads(raw) if raw else None
+
+    def set_status(self, **kwargs):
+        status = self.get_status() or {}
+        status.update(kwargs)
+        self.connection.set(self.status_key, json.dumps(status), ex=self.TIMEOUT)
+        return status
+
+    def enqueue(self, func, args, location):
+        """
+        Queue `func(*args)`, which must store the report, unless it is
+        already queued or rendering.  `location` is where to get the file
+        once it is stored.
+        """
+        if not self.connection.set(self.pending_key, 1, nx=True, ex=self.PENDING_TIMEOUT):
+            return self.get_status()
+        status = self.set_status(
+            status='queued',
+            location=location,
+            queued=time.time(),
+            started=None,
+            finished=None,
+        )
+        try:
+            django_rq.get_queue(self.QUEUE).enqueue_call(
+                run_deferred,
+                args=(self.key, func, args),
+            )
+        except Exception:
+            self.connection.delete(self.pending_key)
+            raise
+        return status
+
+    def run(self, func, args):
+        self.set_status(status='running', started=time.time())
+        try:
+            func(*args)
+        except Exception:
+            self.set_status(status='failed', finished=time.time())
+            raise
+        finally:
+            self.connection.delete(self.pending_key)
+        self.set_status(status='done', finished=time.time())
+        return
+
+
+class DeferredResponse(HttpResponse):
+    """202 pointing at the status resource for a deferred report."""
+    status_code = 202
+
+    def __init__(self, request, key, status, *args, **kwargs):
+        url = request.build_absolute_uri(
+            reverse('deferred-report', kwargs={'key': key})
+        )
+        body = dict(status, url=url)
+        super().__init__(
+            json.dumps(body),
+            content_type='application/json',
+            *args,
+            **kwargs
+        )
+        self['Location'] = url
+        self['Retry-After'] = str(RETRY_AFTER)
+
+
+def defer(request, key, func, *args):
+    """
+    Answer a report action in async mode.
+
+    Queues `func(*args)` on the `high` queue and returns a 202 whose
+    `Location` is the status resource, which redirects back to this action
+    (without the async flag) once the report is stored.
+    """
+    location = remove_query_param(
+        request.build_absolute_uri(),
+        ASYNC_QUERY_PARAM,
+    )
+    status = DeferredReport(key).enqueue(func, args, location)
+    return DeferredResponse(request, key, status)
+
+
+class DeferredReportView(APIView):
+    """
+    Status of a deferred report.
+
+    202 while it is queued or rendering, 303 to the report once it is
+    stored.  The report action itself checks permissions.
+    """
+    permission_classes = [AllowAny]
+    renderer_classes = [JSONRenderer]
+
+    def get(self, request, key):
+        status = DeferredReport(key).get_status()
+        if status is None:
+            raise NotFound()
+        if status['status'] == 'done':
+            return Response(
+                status,
+                status=303,
+                headers={'Location': status['location']},
+            )
+        if status['status'] == 'failed':
+            return Response(status)
+        return Response(
+            status,
+            status=202,
+            headers={'Retry-After': str(RETRY_AFTER)},
+        )
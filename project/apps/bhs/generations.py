@@ -0,0 +1,217 @@
+# Standard Library
+import hashlib
+import time
+
+# Third-Party
+from django_redis import get_redis_connection
+
+# Django
+from django.apps import apps
+from django.core.cache import cache
+from django.core.exceptions import ObjectDoesNotExist
+from django.core.exceptions import ValidationError
+from django.http import HttpResponseNotModified
+from django.utils.cache import parse_etags
+from django.utils.cache import quote_etag
+from django.utils.http import http_date
+from django.utils.http import parse_http_date_safe
+
+
+# Apps whose writes bump a generation of their own.
+SCOPES = (
+    'bhs',
+    'cmanager',
+    'smanager',
+    'rmanager',
+    'stage',
+)
+
+# How to reach the convention from each convention-owned model: the parent
+# model and the attribute holding its id.  Conventions own themselves.
+PARENTS = {
+    'cmanager.assignment': ('cmanager.convention', 'convention_id'),
+    'smanager.session': ('cmanager.convention', 'convention_id'),
+    'smanager.contest': ('smanager.session', 'session_id'),
+    'smanager.contestant': ('smanager.contest', 'contest_id'),
+    'smanager.entry': ('smanager.session', 'session_id'),
+    'rmanager.round': ('smanager.session', 'session_id'),
+    'rmanager.appearance': ('rmanager.round', 'round_id'),
+    'rmanager.panelist': ('rmanager.round', 'round_id'),
+    'rmanager.outcome': ('rmanager.round', 'round_id'),
+    'rmanager.contender': ('rmanager.outcome', 'outcome_id'),
+    'rmanager.song': ('rmanager.appearance', 'appearance_id'),
+    'rmanager.score': ('rmanager.song', 'song_id'),
+    'stage.grid': ('rmanager.round', 'round_id'),
+}
+
+# Owners never move, so the lookups can be kept a good while.
+OWNER_TIMEOUT = 60 * 60 * 24
+
+
+def get_convention_id(label, pk, instance=None):
+    """
+    The id of the convention owning `label` object `pk`, or None.
+
+    Answers from the cache where it can and otherwise walks one parent at a
+    time, caching each step, so hot writes such as scores only cost a cache
+    read once their song has been seen.
+    """
+    if pk is None:
+        return None
+    if label == 'cmanager.convention':
+        return pk
+    if label not in PARENTS:
+        return None
+    key = 'generation_owner_{0}_{1}'.format(label, pk)
+    convention_id = cache.get(key)
+    if convention_id is not None:
+        return convention_id
+    parent_label, attname = PARENTS[label]
+    if instance is not None:
+        parent_id = getattr(instance, attname)
+    else:
+        Model = apps.get_model(label)
+        parent_id = Model.objects.filter(
+            pk=pk,
+        ).values_list(attname, flat=True).first()
+    convention_id = get_convention_id(parent_label, parent_id)
+    if convention_id is not None:
+        cache.set(key, convention_id, OWNER_TIMEOUT)
+    return convention_id
+
+
+def get_scopes(instance):
+    """The generations a write to `instance` invalidates."""
+    label = instance._meta.label_lower
+    scopes = [instance._meta.app_label]
+    try:
+        convention_id = get_convention_id(label, instance.pk, instance=instance)
+    except ObjectDoesNotExist:
+        convention_id = None
+    if convention_id is not None:
+        scopes.append('convention_{0}'.format(convention_id))
+    return scopes
+
+
+class Generation(object):
+    """
+    Generation counters kept in Redis.
+
+    Every write to a model bumps the counter for its app and, where the
+    model belongs to a convention, the counter for that convention.  A
+    response is fresh for as long as the counters it was built under are
+    unchanged, which can be checked without going near Postgres.
+    """
+
+    def __init__(self):
+        self.connection = get_redis_connection('default')
+
+    @staticmethod
+    def get_key(scope):
+        return cache.make_key('generation_{0}'.format(scope))
+
+    def get(self, scopes):
+        """(counter, modified timestamp) for each scope."""
+        pipeline = self.connection.pipeline()
+        for scope in scopes:
+            pipeline.hmget(self.get_key(scope), 'count', 'modified')
+        return [
+            (int(count or 0), int(modified or 0))
+            for count, modified in pipeline.execute()
+        ]
+
+    def bump(self, scopes):
+        modified = int(time.time())
+        pipeline = self.connection.pipeline()
+        for scope in set(scopes):
+            key = self.get_key(scope)
+            pipeline.hincrby(key, 'count', 1)
+            pipeline.hset(key, 'modified', modified)
+        pipeline.execute()
+        return
+
+    def bump_instance(self, instance):
+        self.bump(get_scopes(instance))
+        return
+
+
+class ConditionalMixin(object):
+    """
+    Viewset mixin answering conditional GETs from generation counters.
+
+    List responses are versioned by the generations of the apps named in
+    `generation_scopes`; a detail response for a convention-owned object is
+    versioned by its convention alone.  The ETag also covers the path,
+    query and user, since filters and permissions shape the payload.
+    """
+
+    generation_scopes = ()
+
+    def get_generation_scopes(self):
+        lookup = self.lookup_url_kwarg or self.lookup_field
+        pk = self.kwargs.get(lookup)
+        if pk is not None:
+            model = self.queryset.model
+            try:
+                pk = model._meta.pk.to_python(pk)
+            except ValidationError:
+                return list(self.generation_scopes)
+            label = model._meta.label_lower
+            convention_id = get_convention_id(label, pk)
+            if convention_id is not None:
+                return ['convention_{0}'.format(convention_id)]
+        return list(self.generation_scopes)
+
+    def get_etag(self, request, generations):
+        parts = [
+            request.path,
+            request.META.get('QUERY_STRING', ''),
+            request.META.get('HTTP_ACCEPT', ''),
+            str(getattr(request.user, 'pk', None)),
+        ]
+        parts.extend(str(count) for count, modified in generations)
+        return quote_etag(hashlib.md5('|'.join(parts).encode()).hexdigest())
+
+    def conditional(self, view, request, *args, **kwargs):
+        generations = Generation().get(self.get_generation_scopes())
+        etag = self.get_etag(request, generations)
+        modified = max([x[1] for x in generations] or [0])
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+        if_modified_since = parse_http_date_safe(
+            request.META.get('HTTP_IF_MODIFIED_SINCE', '')
+        )
+        if if_none_match:
+            etags = parse_etags(if_none_match)
+            not_modified = etag in etags
+            if not not_modified and '*' in etags:
+                # Any copy will do, but only of an object the user may
+                # see; get_object raises the 404 or 403 first.  The view
+                # permissions have already passed.
+                lookup = self.lookup_url_kwarg or self.lookup_field
+                if lookup in self.kwargs:
+                    self.get_object()
+                not_modified = True
+        else:
+            # Timestamps are whole seconds; a write in the same second as
+            # the client's copy must not count as unmodified.
+            not_modified = bool(
+                modified and
+                if_modified_since and
+                modified < if_modified_since
+            )
+        if not_modified:
+            response = HttpResponseNotModified()
+        else:
+            response = view(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+        response['ETag'] = etag
+        if modified:
+            response['Last-Modified'] = http_date(modified)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional(super().retrieve, request, *args, **kwargs)
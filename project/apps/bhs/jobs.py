@@ -0,0 +1,116 @@
+# Standard Library
+import functools
+import logging
+from collections import namedtuple
+
+# Third-Party
+import django_rq
+
+# Django
+from django.apps import apps
+from django.core.cache import cache
+from django.db.models import Model
+
+log = logging.getLogger(__name__)
+
+
+# What a job carries instead of a pickled instance.  `version` is the
+# row's `modified` stamp when it was enqueued, or None.
+Reference = namedtuple('Reference', ['label', 'pk', 'version'])
+
+# A pending marker outlives any sane queue backlog, but not a lost job.
+PENDING_TIMEOUT = 60 * 60 * 6
+
+
+def get_version(instance):
+    modified = getattr(instance, 'modified', None)
+    return modified.isoformat() if modified else None
+
+
+def get_reference(instance):
+    return Reference(
+        instance._meta.label_lower,
+        str(instance.pk),
+        get_version(instance),
+    )
+
+
+def resolve(reference):
+    """Fetch the row a reference points at, fresh; None if it is gone."""
+    Model = apps.get_model(reference.label)
+    try:
+        instance = Model._default_manager.get(pk=reference.pk)
+    except Model.DoesNotExist:
+        return None
+    version = get_version(instance)
+    if reference.version and version and version < reference.version:
+        log.warning("Stale read of {0} {1}".format(reference.label, reference.pk))
+    return instance
+
+
+def get_pending_key(name):
+    return cache.make_key('job_pending_{0}'.format(name))
+
+
+def get_task_name(func, reference):
+    return '{0}.{1}:{2}:{3}'.format(
+        func.__module__,
+        func.__name__,
+        reference.label,
+        reference.pk,
+    )
+
+
+def coalesced_job(queue='default', timeout=None):
+    """
+    Like django_rq's `job`, but enqueued by reference and coalesced.
+
+    `.delay(instance)` enqueues a Reference rather than the pickled
+    instance, and is dropped while the same job for the same row is still
+    waiting in the queue.  The worker clears the pending marker as it
+    starts, so triggers that arrive mid-run queue one more pass, and then
+    re-fetches the row.  Each pass is its own rq job, with an id rq picks;
+    sharing one would let the running job overwrite the queued one.  Called directly, the task takes an instance, a
+    reference or whatever it took before.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(obj, *args, **kwargs):
+            if isinstance(obj, Reference):
+                name = get_task_name(func, obj)
+                django_rq.get_connection(queue).delete(get_pending_key(name))
+                instance = resolve(obj)
+                if instance is None:
+                    return "Missing: {0} {1}".format(obj.label, obj.pk)
+                obj = instance
+            return func(obj, *args, **kwargs)
+
+        def delay(obj, *args, **kwargs):
+            if isinstance(obj, Model):
+                obj = get_reference(obj)
+            if not isinstance(obj, Reference):
+                # Plain payloads, such as the nightly export dicts.
+                return django_rq.get_queue(queue).enqueue_call(
+                    wrapper,
+                    args=(obj,) + args,
+                    kwargs=kwargs,
+                    timeout=timeout,
+                )
+            key = get_pending_key(get_task_name(func, obj))
+            connection = django_rq.get_connection(queue)
+            if not connection.set(key, obj.version or '', nx=True, ex=PENDING_TIMEOUT):
+                return None
+            try:
+                return django_rq.get_queue(queue).enqueue_call(
+                    wrapper,
+                    args=(obj,) + args,
+                    kwargs=kwargs,
+                    timeout=timeout,
+                )
+            except Exception:
+                connection.delete(key)
+                raise
+
+        wrapper.delay = delay
+        return wrapper
+    return decorator
@@ -10,6 +10,7 @@ from django.utils import timezone
 from django.contrib.auth import get_user_model
 
 # First-Party
+from apps.bhs.jobs import Reference
 from apps.bhs.models import Person
 from apps.bhs.models import Group
 from apps.bhs.models import Member
@@ -83,14 +84,18 @@ class Command(BaseCommand):
             if i != t:
                 self.stdout.flush()
             self.stdout.write("Updating {0} of {1} Persons...".format(i, t), ending='\r')
-            create_or_update_person_from_human.delay(human)
+            create_or_update_person_from_human.delay(
+                Reference('bhs.human', human['id'], None)
+            )
         i = 0
         for human in humans:
             i += 1
             if i != t:
                 self.stdout.flush()
             self.stdout.write("Updating {0} of {1} Accounts...".format(i, t), ending='\r')
-            create_or_update_account_from_human.delay(human)
+            create_or_update_account_from_human.delay(
+                Reference('bhs.human', human['id'], None)
+            )
         self.stdout.write("Updated {0} Persons and Accounts.".format(t))
         # if not cursor:
         #     humans = list(Human.objects.values_list('id', flat=True))
@@ -115,7 +120,9 @@ class Command(BaseCommand):
             if i != t:
                 self.stdout.flush()
             self.stdout.write("Updating {0} of {1} Groups...".format(i, t), ending='\r')
-            create_or_update_group_from_structure.delay(structure)
+            create_or_update_group_from_structure.delay(
+                Reference('bhs.structure', structure['id'], None)
+            )
         self.stdout.write("Updated {0} Groups.".format(t))
         # if not cursor:
         #     self.stdout.write("Deleting Orphans...")
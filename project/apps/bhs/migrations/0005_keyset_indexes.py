@@ -0,0 +1,21 @@
+# Generated by Django 2.1.9 on 2019-06-29 10:12
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bhs', '0004_auto_20190625_1329'),
+    ]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name='member',
+            index_together={('modified', 'id')},
+        ),
+        migrations.AlterIndexTogether(
+            name='person',
+            index_together={('modified', 'id')},
+        ),
+    ]
@@ -3,6 +3,7 @@ import datetime
 
 # Third-Party
 from model_utils import Choices
+from model_utils import FieldTracker
 from django_fsm import FSMIntegerField
 from model_utils.models import TimeStampedModel
 from phonenumber_field.modelfields import PhoneNumberField
@@ -379,8 +380,13 @@ class Person(TimeStampedModel):
     # Internals
     objects = PersonManager()
 
+    tracker = FieldTracker(fields=['user'])
+
     class Meta:
         verbose_name_plural = 'Persons'
+        index_together = (
+            ('modified', 'id',),
+        )
 
 
     class JSONAPIMeta:
@@ -1163,11 +1169,17 @@ class Member(TimeStampedModel):
     # Internals
     objects = MemberManager()
 
+    # The fields that grant round visibility; see rmanager.signals.
+    tracker = FieldTracker(fields=['status', 'person', 'group'])
+
     class Meta:
         unique_together = (
             ('group', 'person',),
         )
         verbose_name_plural = 'Members'
+        index_together = (
+            ('modified', 'id',),
+        )
 
     class JSONAPIMeta:
         resource_name = "member"
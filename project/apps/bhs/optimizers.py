@@ -0,0 +1,150 @@
+# Third-Party
+from rest_framework.relations import ManyRelatedField
+from rest_framework.relations import RelatedField
+from rest_framework_json_api.utils import get_included_serializers
+from rest_framework_json_api.utils import get_resource_type_from_serializer
+
+# Django
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+
+
+def get_include_tree(request, serializer_class):
+    """
+    The `include` paths as a nested dict, e.g. `songs.scores` gives
+    `{'songs': {'scores': {}}}`.  Without the parameter, or with it empty,
+    the serializer's default `included_resources` apply, at the top level
+    only, as in the renderer.
+    """
+    param = request.query_params.get('include')
+    if not param:
+        meta = getattr(serializer_class, 'JSONAPIMeta', None)
+        paths = list(getattr(meta, 'included_resources', []))
+    else:
+        paths = [x for x in param.split(',') if x]
+    tree = {}
+    for path in paths:
+        node = tree
+        for part in path.replace('-', '_').split('.'):
+            node = node.setdefault(part, {})
+    return tree
+
+
+def get_rendered_fields(serializer_class, request):
+    """Serializer fields left after the `fields[<type>]` sparse fieldset."""
+    fields = list(serializer_class.Meta.fields)
+    resource = get_resource_type_from_serializer(serializer_class)
+    sparse = request.query_params.get('fields[{0}]'.format(resource))
+    if sparse is None:
+        # The permissions block is opt-in; see PermissionsMixin.
+        return [x for x in fields if x != 'permissions']
+    sparse = set(x.replace('-', '_') for x in sparse.split(','))
+    return [x for x in fields if x in sparse or x == 'id']
+
+
+def optimize(queryset, serializer_class, request, tree=None, permission_related=(), keys=()):
+    """
+    Limit `queryset` to what `serializer_class` will render for `request`.
+
+    Forward relations are read from their key where the renderer allows and
+    joined otherwise, to-many relations are prefetched (with just their
+    keys unless included) and included relations recurse with their own
+    serializer.  Plain fields are loaded with `only()`, unless a
+    rendered field is computed, in which case nothing is deferred.  `keys`
+    are extra columns to load, such as the foreign key a prefetch joins on.
+    """
+    if tree is None:
+        tree = get_include_tree(request, serializer_class)
+    model = queryset.model
+    declared = getattr(serializer_class, '_declared_fields', {})
+    included_serializers = get_included_serializers(serializer_class)
+    select = []
+    prefetch = []
+    only = set([model._meta.pk.name])
+    only.update(keys)
+    can_defer = True
+    for name in get_rendered_fields(serializer_class, request):
+        if name == 'url':
+            continue
+        if name == 'permissions':
+            # Object permissions walk up to their parents.
+            select.extend(permission_related)
+            can_defer = False
+            continue
+        field = declared.get(name)
+        if field is not None and not isinstance(field, (RelatedField, ManyRelatedField)):
+            can_defer = False
+            continue
+        try:
+            model_field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            can_defer = False
+            continue
+        if not model_field.is_relation:
+            only.add(name)
+            continue
+        related_model = model_field.related_model
+        # Columns the related rows need for Django to match them up.
+        related_keys = [related_model._meta.pk.name]
+        if hasattr(model_field, 'object_id_field_name'):
+            related_keys.extend([
+                model_field.object_id_field_name,
+                model_field.content_type_field_name,
+            ])
+        elif not model_field.concrete and model_field.one_to_many:
+            related_keys.append(model_field.field.name)
+        subtree = tree.get(name)
+        if subtree is not None and name in included_serializers:
+            subqueryset = optimize(
+                related_model._default_manager.all(),
+                included_serializers[name],
+                request,
+                tree=subtree,
+                keys=related_keys,
+            )
+        else:
+            subqueryset = None
+        if model_field.many_to_one or model_field.one_to_one:
+            if model_field.concrete:
+                only.add(name)
+            if subqueryset is not None:
+                prefetch.append(Prefetch(name, queryset=subqueryset))
+            elif name not in included_serializers:
+                # Without an included serializer the resource type is read
+                # off the related object itself.
+                select.append(name)
+            continue
+        # To-many: prefetch keys only, unless the relation is included.
+        if subqueryset is None:
+            subqueryset = related_model._default_manager.only(*related_keys)
+        prefetch.append(Prefetch(name, queryset=subqueryset))
+    queryset = queryset.select_related(*select).prefetch_related(*prefetch)
+    if can_defer:
+        queryset = queryset.only(*only)
+    return queryset
+
+
+class OptimizerMixin(object):
+    """
+    Viewset mixin building each list or detail queryset from the request.
+
+    Reads `include` and the sparse fieldsets, and loads what the response
+    renders and nothing else.  `permission_related` names the relations
+    object permissions walk, joined only when permissions are requested.
+    Other actions keep the plain queryset.
+    """
+
+    permission_related = ()
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.request is None or self.action not in ['list', 'retrieve']:
+            return queryset
+        # Drop any baked-in plan before building our own.
+        queryset = queryset.select_related(None).prefetch_related(None)
+        return optimize(
+            queryset,
+            self.get_serializer_class(),
+            self.request,
+            permission_related=self.permission_related,
+        )
@@ -0,0 +1,134 @@
+# Standard Library
+import base64
+import json
+from collections import OrderedDict
+
+# Third-Party
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param
+from rest_framework.utils.urls import replace_query_param
+from rest_framework_json_api.pagination import JsonApiPageNumberPagination
+
+# Django
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Q
+
+
+class KeysetPagination(JsonApiPageNumberPagination):
+    """
+    Keyset pagination for large collections, ordered by `(modified, id)`.
+
+    Clients opt in with `page[cursor]` (empty for the first page) and follow
+    the `next` link from there; each page is a single indexed range query,
+    with no COUNT(*) and no OFFSET.  Requests without a cursor are paged by
+    number, as before.  `page[estimate]` adds the planner's row estimate for
+    the table, which is cheap but ignores any filters.
+    """
+
+    cursor_query_param = 'page[cursor]'
+    estimate_query_param = 'page[estimate]'
+
+    # Overridden by `keyset_ordering` on the view; the last field must be
+    # unique.
+    ordering = ('modified', 'id')
+
+    invalid_cursor_message = 'Invalid cursor.'
+
+    def get_ordering(self, view):
+        return tuple(getattr(view, 'keyset_ordering', self.ordering))
+
+    def encode_cursor(self, values):
+        # DjangoJSONEncoder drops microseconds below the millisecond, which
+        # would repeat rows; keep full precision.
+        values = [
+            x.isoformat() if hasattr(x, 'isoformat') else x for x in values
+        ]
+        data = json.dumps(values, cls=DjangoJSONEncoder)
+        return base64.urlsafe_b64encode(data.encode()).decode()
+
+    def decode_cursor(self, cursor, model, ordering):
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            if len(values) != len(ordering):
+                raise ValueError
+            return [
+                model._meta.get_field(name).to_python(value)
+                for name, value in zip(ordering, values)
+            ]
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_keyset_filter(self, ordering, values):
+        """Rows strictly after `values`: (a > x) OR (a = x AND b > y) ..."""
+        q = Q()
+        for i, name in enumerate(ordering):
+            condition = Q(**{'{0}__gt'.format(name): values[i]})
+            for prior, value in zip(ordering[:i], values[:i]):
+                condition &= Q(**{prior: value})
+            q |= condition
+        return q
+
+    def get_estimate(self, queryset):
+        """Row estimate for the table from `pg_class.reltuples`."""
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        return max(row[0], 0) if row else None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param not in request.query_params:
+            self.cursor = None
+            return super().paginate_queryset(queryset, request, view=view)
+        self.request = request
+        self.cursor = request.query_params[self.cursor_query_param]
+        self.page_size = self.get_page_size(request)
+        ordering = self.get_ordering(view)
+        queryset = queryset.order_by(*ordering)
+        if self.cursor:
+            values = self.decode_cursor(self.cursor, queryset.model, ordering)
+            queryset = queryset.filter(self.get_keyset_filter(ordering, values))
+        # One extra row tells us whether there is a next page.
+        rows = list(queryset[:self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        self.next_cursor = None
+        if self.has_next:
+            last = rows[-1]
+            self.next_cursor = self.encode_cursor([
+                getattr(last, name) for name in ordering
+            ])
+        self.estimate = None
+        if request.query_params.get(self.estimate_query_param):
+            self.estimate = self.get_estimate(queryset)
+        return rows
+
+    def get_cursor_link(self, cursor):
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_paginated_response(self, data):
+        if self.cursor is None:
+            return super().get_paginated_response(data)
+        pagination = OrderedDict([
+            ('cursor', self.cursor),
+            ('next', self.next_cursor),
+        ])
+        if self.estimate is not None:
+            pagination['estimated_count'] = self.estimate
+        return Response({
+            'results': data,
+            'meta': {
+                'pagination': pagination,
+            },
+            'links': OrderedDict([
+                ('first', self.get_cursor_link('')),
+                ('next', self.get_cursor_link(self.next_cursor) if self.next_cursor else None),
+            ]),
+        })
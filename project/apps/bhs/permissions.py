@@ -0,0 +1,182 @@
+# Third-Party
+from dry_rest_permissions.generics import DRYPermissionsField
+from rest_framework_json_api.utils import get_resource_type_from_serializer
+
+# Django
+from django.apps import apps
+from django.utils.functional import cached_property
+
+
+class PermissionContext(object):
+    """
+    The requesting user's roles, loaded once per request.
+
+    DRY permission methods run for every object in a response, and each
+    used to query assignments, officers, panelists or members afresh.  The
+    context loads each of those once, on first use, and answers the rest
+    of the request from memory.
+    """
+
+    def __init__(self, user):
+        self.user = user
+        # Global (per-model) permission results, by model and method.
+        self.globals = {}
+
+    @classmethod
+    def for_request(cls, request):
+        context = getattr(request, '_permission_context', None)
+        if context is None or context.user != request.user:
+            context = cls(request.user)
+            request._permission_context = context
+        return context
+
+    @cached_property
+    def offices(self):
+        """(office, group id) pairs for the user's active officer roles."""
+        Officer = apps.get_model('bhs.officer')
+        officers = Officer.objects.filter(
+            person__user=self.user,
+            status__gt=0,
+        ).values_list(
+            'office',
+            'group',
+        )
+        return list(officers)
+
+    @cached_property
+    def assignments(self):
+        """Categories of the user's active assignments, by convention id."""
+        Assignment = apps.get_model('cmanager.assignment')
+        assignments = Assignment.objects.filter(
+            person__user=self.user,
+            status__gt=0,
+        ).values_list(
+            'convention',
+            'category',
+        )
+        result = {}
+        for convention_id, category in assignments:
+            result.setdefault(convention_id, set()).add(category)
+        return result
+
+    @cached_property
+    def officer_rounds(self):
+        """Rounds in conventions where the user is the DRCJ or a CA."""
+        Assignment = apps.get_model('cmanager.assignment')
+        Round = apps.get_model('rmanager.round')
+        convention_ids = [
+            k for k, v in self.assignments.items()
+            if any(x is not None and x <= Assignment.CATEGORY.ca for x in v)
+        ]
+        if not convention_ids:
+            return set()
+        rounds = Round.objects.filter(
+            session__convention__in=convention_ids,
+        ).values_list('id', flat=True)
+        return set(rounds)
+
+    @cached_property
+    def panelist_rounds(self):
+        Panelist = apps.get_model('rmanager.panelist')
+        panelists = Panelist.objects.filter(
+            person__user=self.user,
+            status__gt=0,
+        ).values_list('round', flat=True)
+        return set(panelists)
+
+    @cached_property
+    def memberships(self):
+        Member = apps.get_model('bhs.member')
+        members = Member.objects.filter(
+            person__user=self.user,
+            status__gt=0,
+        ).values_list('group', flat=True)
+        return set(members)
+
+    def has_global(self, model, method, request):
+        """Evaluate a global DRY permission once per model per request."""
+        key = (model._meta.label_lower, method)
+        if key not in self.globals:
+            self.globals[key] = getattr(model, method)(request)
+        return self.globals[key]
+
+    def has_office(self, below):
+        """True if the user holds any office numbered below `below`."""
+        return any(x[0] < below for x in self.offices)
+
+    def is_group_officer(self, group_id):
+        return any(x[1] == group_id for x in self.offices)
+
+    def is_assigned(self, convention_id, *categories):
+        return bool(self.assignments.get(convention_id, set()) & set(categories))
+
+    def is_officer(self, convention_id):
+        """Assigned to the convention as DRCJ or CA."""
+        Assignment = apps.get_model('cmanager.assignment')
+        return self.is_assigned(
+            convention_id,
+            Assignment.CATEGORY.drcj,
+            Assignment.CATEGORY.ca,
+        )
+
+    def is_drcj(self, convention_id):
+        Assignment = apps.get_model('cmanager.assignment')
+        return self.is_assigned(convention_id, Assignment.CATEGORY.drcj)
+
+    def is_ca(self, convention_id):
+        Assignment = apps.get_model('cmanager.assignment')
+        return self.is_assigned(convention_id, Assignment.CATEGORY.ca)
+
+    def is_officer_round(self, round_id):
+        return round_id in self.officer_rounds
+
+    def is_panelist(self, round_id):
+        return round_id in self.panelist_rounds
+
+    def is_member(self, group_id):
+        return group_id in self.memberships
+
+
+class PermissionsField(DRYPermissionsField):
+    """
+    DRYPermissionsField that evaluates global permissions once per request.
+
+    Object permissions are still per object, but answer from the request's
+    PermissionContext, so a whole page costs a handful of queries.
+    """
+
+    def to_representation(self, value):
+        request = self.context['request']
+        context = PermissionContext.for_request(request)
+        model = self.parent.Meta.model
+        results = {}
+        for action, method_names in self.action_method_map.items():
+            if not self.object_only and method_names.get('global') is not None:
+                results[action] = context.has_global(
+                    model,
+                    method_names['global'],
+                    request,
+                )
+            if not self.global_only and results.get(action, True) and method_names.get('object') is not None:
+                results[action] = getattr(value, method_names['object'])(request)
+        return results
+
+
+class PermissionsMixin(object):
+    """
+    Serializer mixin making the `permissions` field opt-in.
+
+    The field is only rendered when the request names it in the sparse
+    fieldset for the resource, e.g. `fields[appearance]=status,permissions`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        context = kwargs.get('context')
+        request = context.get('request') if context else None
+        fieldset = None
+        if request is not None:
+            param = 'fields[{0}]'.format(get_resource_type_from_serializer(self))
+            fieldset = request.query_params.get(param)
+        if not fieldset or 'permissions' not in fieldset.split(','):
+            self.fields.pop('permissions', None)
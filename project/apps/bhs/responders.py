@@ -1,7 +1,15 @@
 
 # Third-Party
+import requests
 from rest_framework.response import Response
 
+# Django
+from django.http import StreamingHttpResponse
+from django.utils.http import http_date
+from django.utils.http import parse_etags
+from django.utils.http import parse_http_date_safe
+from django.utils.http import quote_etag
+
 
 class PDFResponse(Response):
     def __init__(self, pdf, file_name, *args, **kwargs):
@@ -33,3 +41,163 @@ class XLSXResponse(Response):
             *args,
             **kwargs
         )
+
+
+class StreamingFileResponse(StreamingHttpResponse):
+    """
+    Streams a file in chunks, honoring Range and conditional requests.
+
+    Remote storage is read with ranged HTTP requests, so the whole file is
+    never held in memory.  Pass an `etag` (and/or `last_modified`) to enable
+    `304 Not Modified` and `If-Range` handling.
+    """
+    chunk_size = 64 * 1024
+    content_type = 'application/octet-stream'
+    extension = ''
+
+    def __init__(self, request, file, file_name, etag=None, last_modified=None, *args, **kwargs):
+        super().__init__(content_type=self.content_type, *args, **kwargs)
+        self['Content-Disposition'] = 'filename="{0}{1}"'.format(
+            file_name,
+            self.extension,
+        )
+        self['Accept-Ranges'] = 'bytes'
+        if etag:
+            etag = quote_etag(etag)
+            self['ETag'] = etag
+        if last_modified:
+            self['Last-Modified'] = http_date(last_modified.timestamp())
+
+        if self.is_not_modified(request, etag, last_modified):
+            self.status_code = 304
+            self.streaming_content = []
+            return
+
+        size = file.size
+        start, end = 0, size - 1
+        header = request.META.get('HTTP_RANGE')
+        if header and self.is_range_current(request, etag, last_modified):
+            byte_range = self.parse_range(header, size)
+            if byte_range is None:
+                self.status_code = 416
+                self['Content-Range'] = 'bytes */{0}'.format(size)
+                self.streaming_content = []
+                return
+            if byte_range:
+                start, end = byte_range
+                self.status_code = 206
+                self['Content-Range'] = 'bytes {0}-{1}/{2}'.format(start, end, size)
+        self['Content-Length'] = max(end - start + 1, 0)
+        self.streaming_content = self.get_chunks(file, start, end)
+
+    @staticmethod
+    def is_not_modified(request, etag, last_modified):
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+        if if_none_match:
+            etags = parse_etags(if_none_match)
+            return bool(etag) and ('*' in etags or etag in etags)
+        if_modified_since = request.META.get('HTTP_IF_MODIFIED_SINCE')
+        if if_modified_since and last_modified:
+            since = parse_http_date_safe(if_modified_since)
+            return since is not None and int(last_modified.timestamp()) <= since
+        return False
+
+    @staticmethod
+    def is_range_current(request, etag, last_modified):
+        if_range = request.META.get('HTTP_IF_RANGE')
+        if not if_range:
+            return True
+        if etag and if_range == etag:
+            return True
+        since = parse_http_date_safe(if_range)
+        if since is not None and last_modified:
+            return int(last_modified.timestamp()) == since
+        return False
+
+    @staticmethod
+    def parse_range(header, size):
+        """
+        Parse a single `bytes=` range.
+
+        Returns `(start, end)`, `False` to ignore the header (serve the whole
+        file), or `None` if the range cannot be satisfied.
+        """
+        unit, _, spec = header.partition('=')
+        if unit.strip() != 'bytes' or ',' in spec:
+            return False
+        first, _, last = spec.strip().partition('-')
+        try:
+            if not first:
+                length = int(last)
+                if length <= 0:
+                    return None
+                return max(size - length, 0), size - 1
+            start = int(first)
+            end = int(last) if last else size - 1
+        except ValueError:
+            return False
+        if start >= size or end < start:
+            return None
+        return start, min(end, size - 1)
+
+    @staticmethod
+    def get_remote_url(file):
+        storage = getattr(file, 'storage', None)
+        if storage is None:
+            return None
+        try:
+            storage.path(file.name)
+        except NotImplementedError:
+            return storage.url(file.name)
+        return None
+
+    def get_chunks(self, file, start, end):
+        url = self.get_remote_url(file)
+        if url:
+            response = requests.get(
+                url,
+                headers={'Range': 'bytes={0}-{1}'.format(start, end)},
+                stream=True,
+            )
+            response.raise_for_status()
+            # Skip ahead if the server ignored the range.
+            skip = start if response.status_code == 200 else 0
+            remaining = end - start + 1
+            try:
+                for chunk in response.iter_content(self.chunk_size):
+                    if skip:
+                        dropped = min(skip, len(chunk))
+                        chunk = chunk[dropped:]
+                        skip -= dropped
+                    if not chunk:
+                        continue
+                    chunk = chunk[:remaining]
+                    remaining -= len(chunk)
+                    yield chunk
+                    if remaining <= 0:
+                        break
+            finally:
+                response.close()
+            return
+        file.open('rb')
+        try:
+            file.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = file.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+        finally:
+            file.close()
+
+
+class StreamingPDFResponse(StreamingFileResponse):
+    content_type = 'application/pdf'
+    extension = '.pdf'
+
+
+class StreamingXLSXResponse(StreamingFileResponse):
+    content_type = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+    extension = '.xlsx'
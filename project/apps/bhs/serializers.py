@@ -1,12 +1,13 @@
 
 # Third-Party
-from dry_rest_permissions.generics import DRYPermissionsField
 from rest_framework.validators import UniqueTogetherValidator
 from rest_framework_json_api import serializers
 from rest_framework.serializers import SerializerMethodField
 
 # Local
 from .fields import TimezoneField
+from .permissions import PermissionsField
+from .permissions import PermissionsMixin
 
 from .models import Group
 from .models import Member
@@ -17,8 +18,8 @@ from .models import Chart
 from .models import Repertory
 
 
-class GroupSerializer(serializers.ModelSerializer):
-    permissions = DRYPermissionsField()
+class GroupSerializer(PermissionsMixin, serializers.ModelSerializer):
+    permissions = PermissionsField()
     included_serializers = {
         'repertories': 'apps.bhs.serializers.RepertorySerializer',
         # 'members': 'apps.bhs.serializers.MemberSerializer',
@@ -89,8 +90,8 @@ class GroupSerializer(serializers.ModelSerializer):
     #     return super().to_representation(instance)
 
 
-class MemberSerializer(serializers.ModelSerializer):
-    permissions = DRYPermissionsField()
+class MemberSerializer(PermissionsMixin, serializers.ModelSerializer):
+    permissions = PermissionsField()
 
     class Meta:
         model = Member
@@ -107,8 +108,8 @@ class MemberSerializer(serializers.ModelSerializer):
         ]
 
 
-class OfficerSerializer(serializers.ModelSerializer):
-    permissions = DRYPermissionsField()
+class OfficerSerializer(PermissionsMixin, serializers.ModelSerializer):
+    permissions = PermissionsField()
 
     class Meta:
         model = Officer
@@ -133,8 +134,8 @@ class OfficerSerializer(serializers.ModelSerializer):
         ]
 
 
-class PersonSerializer(serializers.ModelSerializer):
-    permissions = DRYPermissionsField()
+class PersonSerializer(PermissionsMixin, serializers.ModelSerializer):
+    permissions = PermissionsField()
     included_serializers = {
         # 'assignments': 'apps.cmanager.serializers.AssignmentSerializer',
         # 'members': 'apps.bhs.serializers.MemberSerializer',
@@ -204,8 +205,8 @@ class PersonSerializer(serializers.ModelSerializer):
         ]
 
 
-class ChartSerializer(serializers.ModelSerializer):
-    permissions = DRYPermissionsField()
+class ChartSerializer(PermissionsMixin, serializers.ModelSerializer):
+    permissions = PermissionsField()
     image_id = serializers.SerializerMethodField()
 
     def get_image_id(self, obj):
@@ -235,8 +236,8 @@ class ChartSerializer(serializers.ModelSerializer):
         )
 
 
-class RepertorySerializer(serializers.ModelSerializer):
-    permissions = DRYPermissionsField()
+class RepertorySerializer(PermissionsMixin, serializers.ModelSerializer):
+    permissions = PermissionsField()
 
     class Meta:
         model = Repertory
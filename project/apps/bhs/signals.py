@@ -1,7 +1,15 @@
+# Third-Party
+from django_fsm.signals import post_transition
+
 # Django
+from django.db import transaction
+from django.db.models.signals import post_delete
 from django.db.models.signals import post_save
 from django.contrib.auth import get_user_model
 # Local
+from .generations import SCOPES
+from .generations import Generation
+from .generations import get_scopes
 from .tasks import link_person_from_user
 User = get_user_model()
 
@@ -11,3 +19,19 @@ def user_post_save(sender, instance, created, **kwargs):
     return
 
 post_save.connect(user_post_save, sender=User)
+
+
+# Generations
+def bump_generations(sender, instance, **kwargs):
+    if sender._meta.app_label not in SCOPES:
+        return
+    # Resolve the owner now; after a delete commits it may be gone.
+    scopes = get_scopes(instance)
+    transaction.on_commit(
+        lambda: Generation().bump(scopes)
+    )
+    return
+
+post_save.connect(bump_generations, dispatch_uid='bump_generations_post_save')
+post_delete.connect(bump_generations, dispatch_uid='bump_generations_post_delete')
+post_transition.connect(bump_generations, dispatch_uid='bump_generations_post_transition')
@@ -0,0 +1,222 @@
+# Standard Library
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+
+# Third-Party
+import requests
+
+# Django
+from django.conf import settings
+from django.core.files.base import File
+from django.core.files.storage import Storage
+from django.utils.deconstruct import deconstructible
+from django.utils.module_loading import import_string
+
+log = logging.getLogger(__name__)
+
+
+@deconstructible
+class CachedStorage(Storage):
+    """
+    A size-bounded local disk cache in front of another storage.
+
+    Files are written through to the backend and kept locally, and files
+    read from the backend are kept too, so repeated downloads and email
+    attachments are served from disk.  A local copy is trusted for
+    `max_age` seconds after it was last checked, then checked against the
+    backend's ETag before it is used again.  The least recently used files
+    are evicted once the cache grows past `max_size` bytes.
+
+    Anything left out falls back to `settings.MEDIA_CACHE`.  `backend` is a
+    dotted path, so any storage will do, such as FileSystemStorage in tests.
+    """
+
+    def __init__(self, backend=None, location=None, max_size=None, max_age=None):
+        options = getattr(settings, 'MEDIA_CACHE', {})
+        self.backend = import_string(backend or options['BACKEND'])()
+        self.location = location or options['LOCATION']
+        self.max_size = options['MAX_SIZE'] if max_size is None else max_size
+        self.max_age = options['MAX_AGE'] if max_age is None else max_age
+
+    # Cache
+    def get_cache_path(self, name):
+        digest = hashlib.sha1(name.encode()).hexdigest()
+        return os.path.join(self.location, digest)
+
+    def get_remote_etag(self, name):
+        """The backend's ETag for `name`, or None if it doesn't exist."""
+        try:
+            path = self.backend.path(name)
+        except NotImplementedError:
+            response = requests.head(self.backend.url(name))
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+            return response.headers.get('ETag') or response.headers.get('Last-Modified')
+        if not os.path.exists(path):
+            return None
+        stat = os.stat(path)
+        return '{0}-{1}'.format(stat.st_mtime_ns, stat.st_size)
+
+    def read_meta(self, name):
+        try:
+            with open(self.get_cache_path(name) + '.json') as f:
+                meta = json.load(f)
+        except (IOError, ValueError):
+            return None
+        # Guard against a hash collision, however unlikely.
+        return meta if meta.get('name') == name else None
+
+    def write_meta(self, name, meta):
+        self.replace(self.get_cache_path(name) + '.json', [json.dumps(meta).encode()])
+
+    def replace(self, path, chunks):
+        # Readers in other workers see the old file or the new, never half.
+        os.makedirs(self.location, exist_ok=True)
+        fd, temp = tempfile.mkstemp(dir=self.location, prefix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in chunks:
+                    f.write(chunk)
+            os.replace(temp, path)
+        except Exception:
+            os.unlink(temp)
+            raise
+        return
+
+    def discard(self, name):
+        path = self.get_cache_path(name)
+        for x in [path, path + '.json']:
+            try:
+                os.unlink(x)
+            except FileNotFoundError:
+                pass
+        return
+
+    def get_cached(self, name):
+        """Metadata for a usable local copy of `name`, or None."""
+        meta = self.read_meta(name)
+        path = self.get_cache_path(name)
+        if meta is None or not os.path.exists(path):
+            return None
+        now = time.time()
+        if now - meta['validated'] >= self.max_age:
+            if self.get_remote_etag(name) != meta['etag']:
+                self.discard(name)
+                return None
+            meta['validated'] = now
+            self.write_meta(name, meta)
+        # Recently used; see evict.
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return meta
+
+    def store(self, name, content, etag):
+        if hasattr(content, 'seek'):
+            content.seek(0)
+        chunks = content.chunks() if hasattr(content, 'chunks') else [content.read()]
+        self.replace(self.get_cache_path(name), chunks)
+        meta = {
+            'name': name,
+            'etag': etag,
+            'size': os.path.getsize(self.get_cache_path(name)),
+            'validated': time.time(),
+        }
+        self.write_meta(name, meta)
+        self.evict()
+        return meta
+
+    def fetch(self, name):
+        # The ETag is read first, so a change mid-download is caught on the
+        # next check rather than cached as current.
+        etag = self.get_remote_etag(name)
+        with self.backend.open(name, 'rb') as content:
+            return self.store(name, content, etag)
+
+    def evict(self):
+        """Remove the least recently used files until under `max_size`."""
+        entries = []
+        with os.scandir(self.location) as it:
+            for entry in it:
+                if entry.name.endswith('.json') or entry.name.startswith('.tmp'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(x[1] for x in entries)
+        for mtime, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            for x in [path, path + '.json']:
+                try:
+                    os.unlink(x)
+                except FileNotFoundError:
+                    pass
+            total -= size
+        return
+
+    # Storage
+    def _open(self, name, mode='rb'):
+        if 'w' in mode or 'a' in mode or '+' in mode:
+            return self.backend.open(name, mode)
+        if self.get_cached(name) is None:
+            self.fetch(name)
+        try:
+            return File(open(self.get_cache_path(name), 'rb'), name=name)
+        except FileNotFoundError:
+            # Evicted in the meantime.
+            return self.backend.open(name, mode)
+
+    def _save(self, name, content):
+        name = self.backend._save(name, content)
+        try:
+            self.store(name, content, self.get_remote_etag(name))
+        except Exception:
+            # The backend has it; caching is best effort.
+            log.exception("Could not cache {0}".format(name))
+            self.discard(name)
+        return name
+
+    def get_valid_name(self, name):
+        return self.backend.get_valid_name(name)
+
+    def get_available_name(self, name, max_length=None):
+        return self.backend.get_available_name(name, max_length=max_length)
+
+    def generate_filename(self, filename):
+        return self.backend.generate_filename(filename)
+
+    def delete(self, name):
+        self.discard(name)
+        return self.backend.delete(name)
+
+    def exists(self, name):
+        if self.get_cached(name) is not None:
+            return True
+        return self.backend.exists(name)
+
+    def size(self, name):
+        meta = self.get_cached(name)
+        if meta is not None:
+            return meta['size']
+        return self.backend.size(name)
+
+    def url(self, name):
+        return self.backend.url(name)
+
+    def path(self, name):
+        """Path to the local copy, fetching it first if need be."""
+        if self.get_cached(name) is None:
+            self.fetch(name)
+        return self.get_cache_path(name)
+
+    def listdir(self, path):
+        return self.backend.listdir(path)
@@ -7,9 +7,10 @@ from auth0.v3.authentication import GetToken
 # from auth0.v3.exceptions import Auth0Error
 from auth0.v3.management import Auth0
 from django.utils.crypto import get_random_string
-from django_rq import job
 from django.apps import apps
 
+from .jobs import coalesced_job
+
 
 def get_auth0():
     auth0_api_access_token = cache.get('auth0_api_access_token')
@@ -39,19 +40,19 @@ def get_accounts(path='barberscore.json'):
         return accounts
 
 
-@job('low')
+@coalesced_job('low')
 def create_or_update_group_from_structure(structure):
     Group = apps.get_model('bhs.group')
     return Group.objects.update_or_create_from_structure(structure)
 
 
-@job('low')
+@coalesced_job('low')
 def create_or_update_person_from_human(human):
     Person = apps.get_model('bhs.person')
     return Person.objects.update_or_create_from_human(human)
 
 
-@job('low')
+@coalesced_job('low')
 def create_or_update_account_from_human(human):
     if isinstance(human, dict):
         mc_pk = human['id']
@@ -138,7 +139,7 @@ def create_or_update_account_from_human(human):
         created = True
     return account, created
 
-@job('low')
+@coalesced_job('low')
 def delete_account_from_human(human):
     if isinstance(human, dict):
         mc_pk = human['id']
@@ -168,18 +169,18 @@ def get_account_orphans():
     return orphans
 
 
-@job('low')
+@coalesced_job('low')
 def create_or_update_person_from_human(human):
     Person = apps.get_model('bhs.person')
     return Person.objects.update_or_create_from_human(human)
 
 
-@job('low')
+@coalesced_job('low')
 def create_or_update_group_from_structure(structure):
     Group = apps.get_model('bhs.group')
     return Group.objects.update_or_create_from_structure(structure)
 
-@job('high')
+@coalesced_job('high')
 def link_person_from_user(user):
     Person = apps.get_model('bhs.person')
     return Person.objects.link_from_user(user)
@@ -2,7 +2,11 @@
 # Third-Party
 from rest_framework import routers
 
+# Django
+from django.urls import path
+
 # Local
+from .deferred import DeferredReportView
 from .views import GroupViewSet
 from .views import MemberViewSet
 from .views import OfficerViewSet
@@ -20,4 +24,6 @@ router.register(r'officer', OfficerViewSet)
 router.register(r'person', PersonViewSet)
 router.register(r'chart', ChartViewSet)
 router.register(r'repertory', RepertoryViewSet)
-urlpatterns = router.urls
+urlpatterns = router.urls + [
+    path('report/<str:key>', DeferredReportView.as_view(), name='deferred-report'),
+]
@@ -23,6 +23,7 @@ from django.template.loader import render_to_string
 from django.utils.text import slugify
 
 # Local
+from .generations import ConditionalMixin
 from .filtersets import MemberFilterset
 from .filtersets import OfficerFilterset
 from .filtersets import PersonFilterset
@@ -33,10 +34,10 @@ from .models import Officer
 from .models import Person
 from .models import Chart
 from .models import Repertory
-from .renderers import PDFRenderer
+from .optimizers import OptimizerMixin
+from .pagination import KeysetPagination
 from .renderers import XLSXRenderer
-from .responders import PDFResponse
-from .responders import XLSXResponse
+from .responders import StreamingXLSXResponse
 from .serializers import GroupSerializer
 from .serializers import MemberSerializer
 from .serializers import OfficerSerializer
@@ -64,23 +65,8 @@ class IgnoreClientContentNegotiation(BaseContentNegotiation):
         return (renderers[0], renderers[0].media_type)
 
 
-class GroupViewSet(viewsets.ModelViewSet):
-    queryset = Group.objects.select_related(
-        'parent',
-    ).prefetch_related(
-        'children',
-        # 'awards',
-        # 'appearances',
-        # 'conventions',
-        # 'entries',
-        'members',
-        'members__person',
-        'officers',
-        'officers__person',
-        'repertories',
-        'repertories__chart',
-        'statelogs',
-    ).distinct()
+class GroupViewSet(ConditionalMixin, OptimizerMixin, viewsets.ModelViewSet):
+    queryset = Group.objects.all()
     serializer_class = GroupSerializer
     filter_backends = [
         DjangoFilterBackend,
@@ -89,6 +75,7 @@ class GroupViewSet(viewsets.ModelViewSet):
         DRYPermissions,
     ]
     resource_name = "group"
+    generation_scopes = ('bhs', 'cmanager', 'smanager')
 
     @action(methods=['post'], detail=True)
     def activate(self, request, pk=None, **kwargs):
@@ -135,10 +122,10 @@ class GroupViewSet(viewsets.ModelViewSet):
                 )
             )
         )
-        return XLSXResponse(
+        return StreamingXLSXResponse(
+            request,
             xlsx,
             file_name=file_name,
-            status=status.HTTP_200_OK
         )
 
     @action(
@@ -151,20 +138,18 @@ class GroupViewSet(viewsets.ModelViewSet):
     def quartets(self, request):
         xlsx = Group.objects.get_quartets()
         file_name = 'quartets-report'
-        return XLSXResponse(
+        return StreamingXLSXResponse(
+            request,
             xlsx,
             file_name=file_name,
-            status=status.HTTP_200_OK
         )
 
 
-class MemberViewSet(viewsets.ModelViewSet):
-    queryset = Member.objects.select_related(
+class MemberViewSet(OptimizerMixin, viewsets.ModelViewSet):
+    queryset = Member.objects.order_by('id')
+    permission_related = [
         'group',
-        'person',
-    ).prefetch_related(
-        'statelogs',
-    ).order_by('id')
+    ]
     serializer_class = MemberSerializer
     filterset_class = MemberFilterset
     filter_backends = [
@@ -173,6 +158,7 @@ class MemberViewSet(viewsets.ModelViewSet):
     permission_classes = [
         DRYPermissions,
     ]
+    pagination_class = KeysetPagination
     resource_name = "member"
 
     @action(methods=['post'], detail=True)
@@ -204,13 +190,11 @@ class MemberViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class OfficerViewSet(viewsets.ModelViewSet):
-    queryset = Officer.objects.select_related(
-        'person',
+class OfficerViewSet(OptimizerMixin, viewsets.ModelViewSet):
+    queryset = Officer.objects.order_by('id')
+    permission_related = [
         'group',
-    ).prefetch_related(
-        'statelogs',
-    ).order_by('id')
+    ]
     serializer_class = OfficerSerializer
     filterset_class = OfficerFilterset
     filter_backends = [
@@ -250,16 +234,8 @@ class OfficerViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class PersonViewSet(viewsets.ModelViewSet):
-    queryset = Person.objects.select_related(
-        # 'user',
-    ).prefetch_related(
-        # 'assignments',
-        'members',
-        'officers',
-        # 'panelists',
-        'statelogs',
-    ).order_by('id')
+class PersonViewSet(OptimizerMixin, viewsets.ModelViewSet):
+    queryset = Person.objects.order_by('id')
     serializer_class = PersonSerializer
     filterset_class = PersonFilterset
     filter_backends = [
@@ -268,6 +244,7 @@ class PersonViewSet(viewsets.ModelViewSet):
     permission_classes = [
         DRYPermissions,
     ]
+    pagination_class = KeysetPagination
     resource_name = "person"
 
     @action(methods=['post'], detail=True)
@@ -299,12 +276,8 @@ class PersonViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class ChartViewSet(viewsets.ModelViewSet):
-    queryset = Chart.objects.select_related(
-    ).prefetch_related(
-        'repertories',
-        'statelogs',
-    ).order_by('status', 'title')
+class ChartViewSet(ConditionalMixin, OptimizerMixin, viewsets.ModelViewSet):
+    queryset = Chart.objects.order_by('status', 'title')
     serializer_class = ChartSerializer
     filter_backends = [
         DjangoFilterBackend,
@@ -313,6 +286,7 @@ class ChartViewSet(viewsets.ModelViewSet):
         DRYPermissions,
     ]
     resource_name = "chart"
+    generation_scopes = ('bhs',)
 
     @action(methods=['post'], detail=True)
     def activate(self, request, pk=None, **kwargs):
@@ -352,20 +326,18 @@ class ChartViewSet(viewsets.ModelViewSet):
     def report(self, request):
         xlsx = Chart.objects.get_report()
         file_name = 'chart-report'
-        return XLSXResponse(
+        return StreamingXLSXResponse(
+            request,
             xlsx,
             file_name=file_name,
-            status=status.HTTP_200_OK
         )
 
 
-class RepertoryViewSet(viewsets.ModelViewSet):
-    queryset = Repertory.objects.select_related(
+class RepertoryViewSet(OptimizerMixin, viewsets.ModelViewSet):
+    queryset = Repertory.objects.order_by('id')
+    permission_related = [
         'group',
-        'chart',
-    ).prefetch_related(
-        'statelogs',
-    ).order_by('id')
+    ]
     serializer_class = RepertorySerializer
     filter_backends = [
         DjangoFilterBackend,
@@ -28,6 +28,7 @@ from django.contrib.postgres.fields import FloatRangeField
 from django.contrib.postgres.fields import IntegerRangeField
 
 # First-Party
+from apps.bhs.permissions import PermissionContext
 from .managers import AwardManager
 from .fields import ImageUploadPath
 from .fields import DivisionsField
@@ -123,20 +124,14 @@ class Assignment(TimeStampedModel):
     @authenticated_users
     def has_write_permission(request):
         return any([
-            request.user.person.officers.filter(
-                office__lt=200,
-                status__gt=0,
-            ),
+            PermissionContext.for_request(request).has_office(below=200),
         ])
 
     @allow_staff_or_superuser
     @authenticated_users
     def has_object_write_permission(self, request):
         return any([
-            request.user.person.officers.filter(
-                office__lt=200,
-                status__gt=0,
-            ),
+            PermissionContext.for_request(request).has_office(below=200),
         ])
 
     # Transitions
@@ -452,20 +447,14 @@ class Award(TimeStampedModel):
     @authenticated_users
     def has_write_permission(request):
         return any([
-            request.user.person.officers.filter(
-                office__lt=200,
-                status__gt=0,
-            ),
+            PermissionContext.for_request(request).has_office(below=200),
         ])
 
     @allow_staff_or_superuser
     @authenticated_users
     def has_object_write_permission(self, request):
         return any([
-            request.user.person.officers.filter(
-                office__lt=200,
-                status__gt=0,
-            ),
+            PermissionContext.for_request(request).has_office(below=200),
         ])
 
     # Transitions
@@ -819,20 +808,14 @@ class Convention(TimeStampedModel):
     @authenticated_users
     def has_write_permission(request):
         return any([
-            request.user.person.officers.filter(
-                office__lt=200,
-                status__gt=0,
-            ),
+            PermissionContext.for_request(request).has_office(below=200),
         ])
 
     @allow_staff_or_superuser
     @authenticated_users
     def has_object_write_permission(self, request):
         return any([
-            request.user.person.officers.filter(
-                office__lt=200,
-                status__gt=0,
-            ),
+            PermissionContext.for_request(request).has_office(below=200),
         ])
 
     # Convention Transition Conditions
@@ -1,8 +1,12 @@
 
 # Third-Party
-from dry_rest_permissions.generics import DRYPermissionsField
 from rest_framework_json_api import serializers
 from rest_framework.serializers import SerializerMethodField
+
+# First-Party
+from apps.bhs.permissions import PermissionsField
+from apps.bhs.permissions import PermissionsMixin
+
 # Local
 from .fields import TimezoneField
 
@@ -12,8 +16,8 @@ from .models import Convention
 
 
 
-class AssignmentSerializer(serializers.ModelSerializer):
-    permissions = DRYPermissionsField()
+class AssignmentSerializer(PermissionsMixin, serializers.ModelSerializer):
+    permissions = PermissionsField()
     # included_serializers = {
     #     'person': 'api.serializers.PersonSerializer',
     #     'convention': 'api.serializers.ConventionSerializer',
@@ -39,8 +43,8 @@ class AssignmentSerializer(serializers.ModelSerializer):
     #     ]
 
 
-class AwardSerializer(serializers.ModelSerializer):
-    permissions = DRYPermissionsField()
+class AwardSerializer(PermissionsMixin, serializers.ModelSerializer):
+    permissions = PermissionsField()
 
     class Meta:
         model = Award
@@ -74,9 +78,9 @@ class AwardSerializer(serializers.ModelSerializer):
         )
 
 
-class ConventionSerializer(serializers.ModelSerializer):
+class ConventionSerializer(PermissionsMixin, serializers.ModelSerializer):
     timezone = TimezoneField(allow_null=True)
-    permissions = DRYPermissionsField()
+    permissions = PermissionsField()
     included_serializers = {
         # 'sessions': 'api.serializers.SessionSerializer',
         # 'assignments': 'apps.cmanager.serializers.AssignmentSerializer',
@@ -13,6 +13,10 @@ from rest_framework.response import Response
 from .renderers import XLSXRenderer
 from .responders import XLSXResponse
 
+# First-Party
+from apps.bhs.generations import ConditionalMixin
+from apps.bhs.optimizers import OptimizerMixin
+
 # Local
 from .filtersets import AssignmentFilterset
 from .filtersets import ConventionFilterset
@@ -44,13 +48,8 @@ class IgnoreClientContentNegotiation(BaseContentNegotiation):
         return (renderers[0], renderers[0].media_type)
 
 
-class AssignmentViewSet(viewsets.ModelViewSet):
-    queryset = Assignment.objects.select_related(
-        'convention',
-        'person',
-    ).prefetch_related(
-        'statelogs',
-    ).order_by('id')
+class AssignmentViewSet(OptimizerMixin, viewsets.ModelViewSet):
+    queryset = Assignment.objects.order_by('id')
     serializer_class = AssignmentSerializer
     filterset_class = AssignmentFilterset
     filter_backends = [
@@ -90,14 +89,8 @@ class AssignmentViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class AwardViewSet(viewsets.ModelViewSet):
-    queryset = Award.objects.select_related(
-        'group',
-        'parent',
-    ).prefetch_related(
-        'children',
-        'contests',
-    ).order_by('status', 'name')
+class AwardViewSet(ConditionalMixin, OptimizerMixin, viewsets.ModelViewSet):
+    queryset = Award.objects.order_by('status', 'name')
     serializer_class = AwardSerializer
     filter_backends = [
         DjangoFilterBackend,
@@ -106,6 +99,7 @@ class AwardViewSet(viewsets.ModelViewSet):
         DRYPermissions,
     ]
     resource_name = "award"
+    generation_scopes = ('cmanager', 'smanager')
 
     @action(methods=['post'], detail=True)
     def activate(self, request, pk=None, **kwargs):
@@ -152,15 +146,8 @@ class AwardViewSet(viewsets.ModelViewSet):
         )
 
 
-class ConventionViewSet(viewsets.ModelViewSet):
-    queryset = Convention.objects.select_related(
-        'venue',
-        'group',
-    ).prefetch_related(
-        'sessions',
-        'assignments',
-        'statelogs',
-    ).order_by('id')
+class ConventionViewSet(ConditionalMixin, OptimizerMixin, viewsets.ModelViewSet):
+    queryset = Convention.objects.order_by('id')
     serializer_class = ConventionSerializer
     filterset_class = ConventionFilterset
     filter_backends = [
@@ -170,6 +157,7 @@ class ConventionViewSet(viewsets.ModelViewSet):
         DRYPermissions,
     ]
     resource_name = "convention"
+    generation_scopes = ('cmanager', 'smanager')
 
     @action(methods=['post'], detail=True)
     def activate(self, request, pk=None, **kwargs):
@@ -0,0 +1,115 @@
+# Standard Library
+import random
+
+# Django
+from django.apps import apps
+from django.db import models
+from django.db import transaction
+from django.db.models import Case
+from django.db.models import F
+from django.db.models import Value
+from django.db.models import When
+from django.db.models import Window
+from django.db.models.functions import RowNumber
+from django.utils.timezone import now
+
+# First-Party
+from apps.bhs.generations import Generation
+from apps.bhs.generations import get_scopes
+
+
+class AdvancementEngine(object):
+    """
+    Advancers, mic tester and draw for a round, from one ranked query.
+
+    The verified multi-round appearances are read once, ranked by total,
+    then singing, then performance points; everything else is decided from
+    that snapshot.
+    """
+
+    # Scores at or above this advance regardless of spots (except BHS).
+    AUTOMATIC_SCORE = 73.0
+
+    def __init__(self, round):
+        Appearance = apps.get_model('rmanager.appearance')
+        self.round = round
+        self.spots = round.spots
+        self.is_bhs = round.session.convention.district == 'BHS'
+        rows = Appearance.objects.filter(
+            round=round,
+            status=Appearance.STATUS.verified,
+            is_single=False,
+        ).annotate(
+            avg=F('aggregate__tot_score'),
+            row=Window(
+                expression=RowNumber(),
+                order_by=(
+                    F('aggregate__tot_points').desc(),
+                    F('aggregate__sng_points').desc(),
+                    F('aggregate__per_points').desc(),
+                ),
+            ),
+        ).order_by(
+            'row',
+        ).values_list(
+            'id',
+            'avg',
+        )
+        # Ranked (id, average) pairs.
+        self.standings = list(rows)
+
+    def get_advancers(self):
+        """Advancing appearance ids and the mic tester id (or None)."""
+        ranked = [x[0] for x in self.standings]
+        # Without constricted spots, everyone advances.
+        if not self.spots:
+            return ranked, None
+        if self.is_bhs:
+            advancers = ranked[:self.spots]
+            remains = ranked[self.spots:]
+        else:
+            advancers = [
+                x[0] for x in self.standings
+                if x[1] is not None and x[1] >= self.AUTOMATIC_SCORE
+            ]
+            automatics = set(advancers)
+            remains = [x for x in ranked if x not in automatics]
+            diff = self.spots - len(advancers)
+            # Fill any remaining spots in rank order.
+            if diff > 0:
+                advancers = advancers + remains[:diff]
+                remains = remains[diff:]
+        mt = remains[0] if remains else None
+        return advancers, mt
+
+    def get_draws(self):
+        """Map appearance ids to their draw; the mic tester draws 0."""
+        advancers, mt = self.get_advancers()
+        advancers = random.sample(advancers, len(advancers))
+        draws = {x: i for i, x in enumerate(advancers, start=1)}
+        if mt:
+            draws[mt] = 0
+        return draws
+
+    def save(self):
+        """Reset and write every draw in the round with a single UPDATE."""
+        draws = self.get_draws()
+        output_field = models.IntegerField(null=True)
+        self.round.appearances.update(
+            draw=Case(
+                *[
+                    When(id=k, then=Value(v))
+                    for k, v in draws.items()
+                ],
+                default=Value(None),
+                output_field=output_field
+            ),
+            # Keyset walkers page by `modified`; see KeysetPagination.
+            modified=now(),
+        )
+        # The UPDATE skips the signals that would bump the generations.
+        scopes = get_scopes(self.round)
+        transaction.on_commit(
+            lambda: Generation().bump(scopes)
+        )
+        return draws
@@ -0,0 +1,187 @@
+# Standard Library
+import warnings
+
+# Third-Party
+import numpy as np
+
+# Django
+from django.apps import apps
+
+
+class SessionScoreCube(object):
+    """
+    Official scores for a session, held as one dense array.
+
+    The array is indexed by (group, round, song, panelist); cells without a
+    score are NaN, so every reduction is nan-aware.  All reductions accept a
+    category prefix (`tot`, `mus`, `per`, `sng`) and an optional round number
+    to limit the result to rounds up to and including that round.
+    """
+
+    PREFIXES = ('tot', 'mus', 'per', 'sng')
+
+    # Axes to reduce for each level of detail.
+    LEVELS = {
+        'group': (1, 2, 3),
+        'appearance': (2, 3),
+        'song': (3,),
+    }
+
+    def __init__(self, session):
+        Panelist = apps.get_model('rmanager.panelist')
+        Score = apps.get_model('rmanager.score')
+        rows = Score.objects.filter(
+            song__appearance__round__session=session,
+            song__appearance__group__isnull=False,
+            panelist__kind=Panelist.KIND.official,
+            points__isnull=False,
+        ).values_list(
+            'song__appearance__group',
+            'song__appearance__round__num',
+            'song__num',
+            'panelist',
+            'panelist__category',
+            'points',
+        )
+        rows = list(rows)
+        columns = list(zip(*rows)) or [[]] * 6
+
+        # Axes
+        self.groups = sorted(set(columns[0]))
+        self.rounds = sorted(set(columns[1]))
+        self.songs = sorted(set(columns[2]))
+        self.panelists = sorted(set(columns[3]))
+        self.group_index = {v: i for i, v in enumerate(self.groups)}
+        self.round_index = {v: i for i, v in enumerate(self.rounds)}
+        self.song_index = {v: i for i, v in enumerate(self.songs)}
+        self.panelist_index = {v: i for i, v in enumerate(self.panelists)}
+
+        # Dense array
+        self.array = np.full(
+            (
+                len(self.groups),
+                len(self.rounds),
+                len(self.songs),
+                len(self.panelists),
+            ),
+            np.nan,
+        )
+        if rows:
+            self.array[
+                [self.group_index[x] for x in columns[0]],
+                [self.round_index[x] for x in columns[1]],
+                [self.song_index[x] for x in columns[2]],
+                [self.panelist_index[x] for x in columns[3]],
+            ] = columns[5]
+
+        # Category masks over the panelist axis
+        categories = dict(zip(columns[3], columns[4]))
+        categories = np.array(
+            [categories[x] for x in self.panelists],
+            dtype=int,
+        )
+        self.masks = {
+            'tot': np.ones(len(self.panelists), dtype=bool),
+            'mus': categories == Panelist.CATEGORY.music,
+            'per': categories == Panelist.CATEGORY.performance,
+            'sng': categories == Panelist.CATEGORY.singing,
+        }
+
+    def __len__(self):
+        return int(np.count_nonzero(~np.isnan(self.array)))
+
+    def get_slice(self, prefix='tot', num=None):
+        """Scores for one category through round `num`."""
+        array = self.array[..., self.masks[prefix]]
+        if num is not None:
+            array = array[:, np.array(self.rounds) <= num]
+        return array
+
+    def get_counts(self, prefix='tot', num=None, level='group'):
+        array = self.get_slice(prefix, num)
+        return np.count_nonzero(~np.isnan(array), axis=self.LEVELS[level])
+
+    def get_points(self, prefix='tot', num=None, level='group'):
+        """Summed points; NaN where there are no scores."""
+        array = self.get_slice(prefix, num)
+        points = np.nansum(array, axis=self.LEVELS[level])
+        counts = np.count_nonzero(~np.isnan(array), axis=self.LEVELS[level])
+        return np.where(counts > 0, points, np.nan)
+
+    def get_scores(self, prefix='tot', num=None, level='group'):
+        """Average points; NaN where there are no scores."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return (
+                self.get_points(prefix, num, level) /
+                self.get_counts(prefix, num, level)
+            )
+
+    def get_devs(self, prefix='tot', num=None, level='song'):
+        """Population standard deviation, matching Postgres `stddev_pop`."""
+        array = self.get_slice(prefix, num)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', category=RuntimeWarning)
+            return np.nanstd(array, axis=self.LEVELS[level])
+
+    def get_totals(self, num=None):
+        """Points and scores for every category, keyed by group id."""
+        totals = {group_id: {} for group_id in self.groups}
+        for prefix in self.PREFIXES:
+            points = self.get_points(prefix, num)
+            scores = self.get_scores(prefix, num)
+            for group_id, i in self.group_index.items():
+                totals[group_id]['{0}_points'.format(prefix)] = None if np.isnan(points[i]) else int(points[i])
+                totals[group_id]['{0}_score'.format(prefix)] = None if np.isnan(scores[i]) else float(scores[i])
+        return totals
+
+    def get_stats(self, num=None):
+        """Average song-level deviation for each category."""
+        stats = {}
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', category=RuntimeWarning)
+            for prefix in self.PREFIXES:
+                value = np.nanmean(self.get_devs(prefix, num))
+                stats[prefix] = None if np.isnan(value) else float(value)
+        return stats
+
+    def _get_keys(self, group_ids, prefixes, num):
+        """
+        Descending sort keys for the given groups.
+
+        Unscored groups sort first, as NULLs do in a descending Postgres
+        ordering, so the ranking matches what the queries returned.
+        """
+        rows = [self.group_index.get(x) for x in group_ids]
+        keys = []
+        for prefix in prefixes:
+            points = self.get_points(prefix, num)
+            key = np.array([
+                np.nan if i is None else points[i] for i in rows
+            ], dtype=float)
+            keys.append(np.where(np.isnan(key), np.inf, key))
+        return keys
+
+    def get_ranking(self, group_ids=None, num=None):
+        """
+        Group ids ordered by total, then singing, then performance points.
+
+        Mirrors `Window(RowNumber())` over `-tot, -sng, -per`; the position in
+        the returned list is the row number.
+        """
+        if group_ids is None:
+            group_ids = self.groups
+        group_ids = list(group_ids)
+        tot, sng, per = self._get_keys(group_ids, ['tot', 'sng', 'per'], num)
+        # lexsort sorts by the last key first.
+        order = np.lexsort((-per, -sng, -tot))
+        return [group_ids[i] for i in order]
+
+    def get_ranks(self, prefix='tot', group_ids=None, num=None):
+        """Competition ranks (ties share, then skip), mirroring `Rank()`."""
+        if group_ids is None:
+            group_ids = self.groups
+        group_ids = list(group_ids)
+        key, = self._get_keys(group_ids, [prefix], num)
+        ascending = np.sort(key)
+        above = len(key) - np.searchsorted(ascending, key, side='right')
+        return dict(zip(group_ids, (above + 1).tolist()))
@@ -0,0 +1,123 @@
+# Standard Library
+import json
+
+# Third-Party
+from django_redis import get_redis_connection
+
+# Django
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+# A song or appearance never changes round, so the lookups keep a good while.
+ROUND_TIMEOUT = 60 * 60 * 24
+
+
+def get_round_id(model, pk, path):
+    """
+    The round of `model` object `pk`, reached by the lookup `path`.
+
+    Cached, so a run of score saves costs one query per song rather than
+    one per save.
+    """
+    key = 'feed_round_{0}_{1}'.format(model._meta.model_name, pk)
+    round_id = cache.get(key)
+    if round_id is None:
+        round_id = model.objects.filter(
+            pk=pk,
+        ).values_list(path, flat=True).first()
+        if round_id is not None:
+            cache.set(key, round_id, ROUND_TIMEOUT)
+    return round_id
+
+
+class RoundFeed(object):
+    """
+    A per-round change feed kept as a capped Redis stream.
+
+    Each entry is a compact delta: the entity, its id, the fields that
+    changed and, for transitions, the new status.  Cursors are stream ids,
+    so a client resumes exactly where its last read stopped.
+    """
+
+    # Entries kept per round; older ones are trimmed on write.
+    MAXLEN = 1000
+
+    # Feeds are only interesting while a round is live.
+    TIMEOUT = 60 * 60 * 24
+
+    def __init__(self, round_id):
+        self.round_id = round_id
+        self.key = cache.make_key('feed_round_{0}'.format(round_id))
+        self.connection = get_redis_connection('default')
+
+    def get_event(self, entity, pk, fields=None, status=None, **kwargs):
+        event = {
+            'entity': entity,
+            'id': pk,
+        }
+        if fields:
+            event['fields'] = fields
+        if status is not None:
+            event['status'] = status
+        event.update(kwargs)
+        return {'event': json.dumps(event, cls=DjangoJSONEncoder)}
+
+    def publish(self, entity, pk, fields=None, status=None, **kwargs):
+        pipeline = self.connection.pipeline()
+        pipeline.xadd(
+            self.key,
+            self.get_event(entity, pk, fields=fields, status=status, **kwargs),
+            maxlen=self.MAXLEN,
+        )
+        pipeline.expire(self.key, self.TIMEOUT)
+        pipeline.execute()
+        return
+
+    def publish_many(self, deltas, **kwargs):
+        """
+        Publish `(entity, pk, fields)` deltas in one round trip.
+
+        Keyword arguments, such as a transition's `status`, go on every
+        entry.
+        """
+        if not deltas:
+            return
+        pipeline = self.connection.pipeline()
+        for entity, pk, fields in deltas:
+            pipeline.xadd(
+                self.key,
+                self.get_event(entity, pk, fields=fields, **kwargs),
+                maxlen=self.MAXLEN,
+            )
+        pipeline.expire(self.key, self.TIMEOUT)
+        pipeline.execute()
+        return
+
+    def get_cursor(self):
+        """The id of the newest entry, for clients starting from now."""
+        entries = self.connection.xrevrange(self.key, count=1)
+        if not entries:
+            return '0-0'
+        return entries[0][0].decode()
+
+    def read(self, cursor=None, wait=0, count=100):
+        """Events after `cursor`, blocking up to `wait` seconds for new ones."""
+        if cursor is None:
+            cursor = self.get_cursor()
+        # Capped; see FEED_WAIT.
+        wait = max(0, min(wait, settings.FEED_WAIT))
+        streams = self.connection.xread(
+            {self.key: cursor},
+            count=count,
+            block=wait * 1000 if wait else None,
+        )
+        events = []
+        for key, entries in streams or []:
+            for entry_id, values in entries:
+                cursor = entry_id.decode()
+                event = json.loads(values[b'event'])
+                event['cursor'] = cursor
+                events.append(event)
+        return cursor, events
@@ -1,10 +1,18 @@
 from dry_rest_permissions.generics import DRYPermissionFiltersBase
 from django.db.models import Q
 
-from apps.cmanager.models import Assignment
-
 from .models import Appearance
 from .models import Round
+from .models import Visibility
+
+
+def get_rounds(user, kind):
+    """Subquery of the rounds `user` can see as `kind`."""
+    return Visibility.objects.filter(
+        user=user,
+        kind=kind,
+    ).values('round')
+
 
 class AppearanceFilterBackend(DRYPermissionFiltersBase):
 
@@ -19,11 +27,9 @@ class AppearanceFilterBackend(DRYPermissionFiltersBase):
                 round__status=Round.STATUS.completed,
             ) |
             Q(
-                round__session__convention__assignments__person__user=request.user,
-                round__session__convention__assignments__status__gt=0,
-                round__session__convention__assignments__category__lte=Assignment.CATEGORY.ca,
+                round__in=get_rounds(request.user, Visibility.KIND.officer),
             )
-        ).distinct()
+        )
         return queryset
 
 
@@ -40,11 +46,9 @@ class OutcomeFilterBackend(DRYPermissionFiltersBase):
                 round__status=Round.STATUS.completed,
             ) |
             Q(
-                round__session__convention__assignments__person__user=request.user,
-                round__session__convention__assignments__status__gt=0,
-                round__session__convention__assignments__category__lte=Assignment.CATEGORY.ca,
+                round__in=get_rounds(request.user, Visibility.KIND.officer),
             )
-        ).distinct()
+        )
         return queryset
 
 
@@ -59,9 +63,7 @@ class ScoreFilterBackend(DRYPermissionFiltersBase):
         queryset = queryset.filter(
             # Assigned DRCJs and CAs can always see
             Q(
-                song__appearance__round__session__convention__assignments__person__user=request.user,
-                song__appearance__round__session__convention__assignments__status__gt=0,
-                song__appearance__round__session__convention__assignments__category__lte=Assignment.CATEGORY.ca,
+                song__appearance__round__in=get_rounds(request.user, Visibility.KIND.officer),
             ) |
             # Panelists can see their own scores
             Q(
@@ -70,17 +72,18 @@ class ScoreFilterBackend(DRYPermissionFiltersBase):
             ) |
             # Panelists can see others' scores if Appearance is complete.
             Q(
-                song__appearance__round__panelists__person__user=request.user,
-                song__appearance__round__panelists__status__gt=0,
+                song__appearance__round__in=get_rounds(request.user, Visibility.KIND.panelist),
                 song__appearance__status__lte=Appearance.STATUS.completed,
             ) |
             # Group members can see their own scores if complete.
             Q(
-                song__appearance__group__members__person__user=request.user,
-                song__appearance__group__members__status__gt=0,
+                song__appearance__group__in=Visibility.objects.filter(
+                    user=request.user,
+                    kind=Visibility.KIND.member,
+                ).values('group'),
                 song__appearance__status__lte=Appearance.STATUS.completed,
             )
-        ).distinct()
+        )
         return queryset
 
 
@@ -97,9 +100,7 @@ class SongFilterBackend(DRYPermissionFiltersBase):
                 appearance__round__status=Round.STATUS.completed,
             ) |
             Q(
-                appearance__round__session__convention__assignments__person__user=request.user,
-                appearance__round__session__convention__assignments__status__gt=0,
-                appearance__round__session__convention__assignments__category__lte=Assignment.CATEGORY.ca,
+                appearance__round__in=get_rounds(request.user, Visibility.KIND.officer),
             )
-        ).distinct()
-        return queryset
\ No newline at end of file
+        )
+        return queryset
@@ -15,6 +15,13 @@ class RoundFilterset(FilterSet):
             ],
         }
 
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        # Assignments fan out; only pay for DISTINCT when filtering on them.
+        if self.form.cleaned_data.get('session__convention__assignments__person__user'):
+            queryset = queryset.distinct()
+        return queryset
+
 
 class ScoreFilterset(FilterSet):
     class Meta:
@@ -0,0 +1,18 @@
+# Django
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Command to rebuild score aggregates."
+
+    def handle(self, *args, **options):
+        Song = apps.get_model('rmanager.song')
+        SongAggregate = apps.get_model('rmanager.songaggregate')
+        song_ids = list(Song.objects.values_list('id', flat=True))
+        t = len(song_ids)
+        self.stdout.write("Rebuilding {0} Songs.".format(t))
+        size = 500
+        for i in range(0, t, size):
+            SongAggregate.objects.refresh(song_ids[i:i + size])
+        self.stdout.write("Complete.")
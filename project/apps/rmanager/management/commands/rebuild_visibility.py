@@ -0,0 +1,18 @@
+# Django
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Command to rebuild round visibility."
+
+    def handle(self, *args, **options):
+        Round = apps.get_model('rmanager.round')
+        Visibility = apps.get_model('rmanager.visibility')
+        round_ids = list(Round.objects.values_list('id', flat=True))
+        t = len(round_ids)
+        self.stdout.write("Rebuilding {0} Rounds.".format(t))
+        size = 100
+        for i in range(0, t, size):
+            Visibility.objects.refresh(round_ids=round_ids[i:i + size])
+        self.stdout.write("Complete.")
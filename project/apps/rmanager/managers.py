@@ -1,40 +1,31 @@
-
 # Standard Library
-import json
+import functools
 import logging
 import uuid
-import maya
-
-# Third-Party
-import django_rq
-from algoliasearch_django.decorators import disable_auto_indexing
-from openpyxl import Workbook
-from openpyxl.writer.excel import save_virtual_workbook
+import weakref
 
 # Django
 from django.apps import apps
-from django.contrib.auth.models import BaseUserManager
-from django.core.exceptions import ValidationError
-from django.core.files.base import ContentFile
-from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import RegexValidator
 from django.core.validators import URLValidator
-from django.core.validators import validate_email
-from django.db import IntegrityError
-from django.db.models import CharField
-from django.db.models import F
+from django.db import transaction
+from django.db.models import Case
+from django.db.models import Count
 from django.db.models import Manager
+from django.db.models import Q
+from django.db.models import QuerySet
+from django.db.models import StdDev
+from django.db.models import Sum
 from django.db.models import Value
-from django.db.models.functions import Concat
-from django.forms.models import model_to_dict
-from django.utils.timezone import localdate
+from django.db.models import When
+from django.db.models.functions import Cast
 from django.utils.timezone import now
 
 # First-Party
-from phonenumber_field.validators import validate_international_phonenumber
-from .validators import validate_bhs_id
-from .validators import validate_tin
-from .validators import validate_url
+from apps.bhs.generations import Generation
+
+# Local
+from .standings import Standings
 
 
 log = logging.getLogger(__name__)
@@ -116,7 +107,17 @@ class SongManager(Manager):
         )
 
 
-class ScoreManager(Manager):
+class ScoreQuerySet(QuerySet):
+    def update(self, **kwargs):
+        # Bulk updates bypass signals, so refresh the aggregates here.
+        song_ids = list(self.values_list('song', flat=True).distinct())
+        rows = super().update(**kwargs)
+        SongAggregate = apps.get_model('rmanager.songaggregate')
+        SongAggregate.objects.refresh(song_ids)
+        return rows
+
+
+class ScoreManager(Manager.from_queryset(ScoreQuerySet)):
     def update_or_create_from_clean(self, item):
         song = item.cleansong.song
         panelist = item.cleanpanelist.panelist
@@ -128,3 +129,310 @@ class ScoreManager(Manager):
             panelist=panelist,
             defaults=defaults,
         )
+
+
+class ScoreAggregateManager(Manager):
+    def write(self, rows, creates=None):
+        """
+        Write `{pk: defaults}` rows in bulk.
+
+        Rows that exist are changed with one UPDATE and the rest inserted
+        with one bulk_create; `creates` maps a pk to any further fields a
+        new row needs.  Neither sends signals, so the generation is bumped
+        here.
+        """
+        if not rows:
+            return
+        creates = creates or {}
+        existing = self.filter(
+            pk__in=rows.keys(),
+        ).values_list('pk', flat=True)
+        existing = set(existing)
+        updates = {k: v for k, v in rows.items() if k in existing}
+        if updates:
+            fields = {}
+            for name in next(iter(updates.values())):
+                field = self.model._meta.get_field(name)
+                # Cast, or a column of all NULLs comes back as text.
+                fields[name] = Cast(
+                    Case(
+                        *[
+                            When(pk=k, then=Value(v[name]))
+                            for k, v in updates.items()
+                        ],
+                        output_field=field
+                    ),
+                    output_field=field,
+                )
+            self.filter(
+                pk__in=updates.keys(),
+            ).update(
+                # Keyset walkers page by `modified`; see KeysetPagination.
+                modified=now(),
+                **fields
+            )
+        pk = self.model._meta.pk.attname
+        self.bulk_create([
+            self.model(**{pk: k}, **creates.get(k, {}), **v)
+            for k, v in rows.items() if k not in existing
+        ], batch_size=1000)
+        scopes = [self.model._meta.app_label]
+        transaction.on_commit(
+            lambda: Generation().bump(scopes)
+        )
+        return
+
+
+class SongAggregateManager(ScoreAggregateManager):
+    def refresh(self, song_ids):
+        """Recompute the song aggregates and cascade to appearances."""
+        Panelist = apps.get_model('rmanager.panelist')
+        Score = apps.get_model('rmanager.score')
+        Song = apps.get_model('rmanager.song')
+        songs = Song.objects.filter(
+            id__in=song_ids,
+        ).values_list('id', 'appearance')
+        songs = dict(songs)
+        if not songs:
+            return
+        categories = {
+            'mus': Panelist.CATEGORY.music,
+            'per': Panelist.CATEGORY.performance,
+            'sng': Panelist.CATEGORY.singing,
+        }
+        annotations = {
+            'tot_count': Count('points'),
+            'tot_points': Sum('points'),
+            'tot_dev': StdDev('points'),
+        }
+        for prefix, category in categories.items():
+            category_filter = Q(panelist__category=category)
+            annotations['{0}_count'.format(prefix)] = Count(
+                'points',
+                filter=category_filter,
+            )
+            annotations['{0}_points'.format(prefix)] = Sum(
+                'points',
+                filter=category_filter,
+            )
+            annotations['{0}_dev'.format(prefix)] = StdDev(
+                'points',
+                filter=category_filter,
+            )
+        rows = Score.objects.filter(
+            song__in=songs.keys(),
+            panelist__kind=Panelist.KIND.official,
+        ).values(
+            'song',
+        ).annotate(**annotations)
+        totals = {row.pop('song'): row for row in rows}
+        self.write({
+            song_id: self.model.get_defaults(totals.get(song_id, {}))
+            for song_id in songs
+        })
+        AppearanceAggregate = apps.get_model('rmanager.appearanceaggregate')
+        return AppearanceAggregate.objects.refresh(set(songs.values()))
+
+
+class AppearanceAggregateManager(ScoreAggregateManager):
+    def refresh(self, appearance_ids):
+        """Recompute the appearance aggregates from the song aggregates."""
+        Appearance = apps.get_model('rmanager.appearance')
+        SongAggregate = apps.get_model('rmanager.songaggregate')
+        appearances = Appearance.objects.filter(
+            id__in=appearance_ids,
+        ).values_list('id', 'round__session', 'group', 'round')
+        appearances = list(appearances)
+        if not appearances:
+            return
+        sums = {}
+        for prefix in self.model.PREFIXES:
+            for suffix in ['count', 'points']:
+                name = '{0}_{1}'.format(prefix, suffix)
+                sums['sum_{0}'.format(name)] = Sum(name)
+        rows = SongAggregate.objects.filter(
+            song__appearance__in=[x[0] for x in appearances],
+        ).values(
+            'song__appearance',
+        ).annotate(**sums)
+        totals = {
+            row.pop('song__appearance'): {
+                key.partition('sum_')[2]: value for key, value in row.items()
+            } for row in rows
+        }
+        self.write({
+            x[0]: self.model.get_defaults(totals.get(x[0], {}))
+            for x in appearances
+        })
+        standings = {}
+        for appearance_id, session_id, group_id, round_id in appearances:
+            standings.setdefault(round_id, set()).add(appearance_id)
+        # Redis isn't rolled back with the transaction; wait for the commit.
+        for round_id, members in standings.items():
+            transaction.on_commit(
+                functools.partial(Standings.for_round(round_id).refresh, members)
+            )
+        GroupAggregate = apps.get_model('rmanager.groupaggregate')
+        return GroupAggregate.objects.refresh(
+            set((x[1], x[2]) for x in appearances if x[2])
+        )
+
+
+class GroupAggregateManager(ScoreAggregateManager):
+    def refresh(self, pairs):
+        """Recompute the per-session group aggregates from the appearances."""
+        AppearanceAggregate = apps.get_model('rmanager.appearanceaggregate')
+        pairs = set(pairs)
+        if not pairs:
+            return
+        sums = {}
+        for prefix in self.model.PREFIXES:
+            for suffix in ['count', 'points']:
+                name = '{0}_{1}'.format(prefix, suffix)
+                sums['sum_{0}'.format(name)] = Sum(name)
+        rows = AppearanceAggregate.objects.filter(
+            appearance__round__session__in=[x[0] for x in pairs],
+            appearance__group__in=[x[1] for x in pairs],
+        ).values(
+            'appearance__round__session',
+            'appearance__group',
+        ).annotate(**sums)
+        totals = {}
+        for row in rows:
+            key = (
+                row.pop('appearance__round__session'),
+                row.pop('appearance__group'),
+            )
+            totals[key] = {
+                k.partition('sum_')[2]: v for k, v in row.items()
+            }
+        existing = self.filter(
+            session__in=[x[0] for x in pairs],
+            group__in=[x[1] for x in pairs],
+        ).values_list('session', 'group', 'id')
+        ids = {(x[0], x[1]): x[2] for x in existing}
+        rows = {}
+        creates = {}
+        standings = {}
+        for session_id, group_id in pairs:
+            pk = ids.get((session_id, group_id))
+            if pk is None:
+                pk = uuid.uuid4()
+                creates[pk] = {
+                    'session_id': session_id,
+                    'group_id': group_id,
+                }
+            rows[pk] = self.model.get_defaults(
+                totals.get((session_id, group_id), {})
+            )
+            standings.setdefault(session_id, set()).add(group_id)
+        self.write(rows, creates=creates)
+        for session_id, members in standings.items():
+            transaction.on_commit(
+                functools.partial(Standings.for_session(session_id).refresh, members)
+            )
+        return
+
+
+class VisibilityManager(Manager):
+    def refresh_on_commit(self, user_ids=None, round_ids=None):
+        """
+        Queue a refresh for after the commit.
+
+        Every call in the same transaction adds to one batch, so a loop of
+        saves costs one refresh per kind rather than one per save.
+        """
+        connection = transaction.get_connection()
+        batch = getattr(connection, 'visibility_batch', None)
+        # Django drops the callback when the transaction rolls back, and
+        # nothing else holds it; a dead reference means the batch is lost.
+        if batch is None or batch['flush']() is None:
+            batch = {
+                'user_ids': set(),
+                'round_ids': set(),
+            }
+
+            def flush():
+                connection.visibility_batch = None
+                self.refresh(user_ids=batch['user_ids'])
+                self.refresh(round_ids=batch['round_ids'])
+            batch['flush'] = weakref.ref(flush)
+            connection.visibility_batch = batch
+        else:
+            flush = None
+        batch['user_ids'].update(user_ids or [])
+        batch['round_ids'].update(round_ids or [])
+        if flush is not None:
+            # Runs at once outside a transaction.
+            transaction.on_commit(flush)
+        return
+
+    def refresh(self, user_ids=None, round_ids=None):
+        """Rebuild the visibility rows for the given users, or rounds."""
+        Assignment = apps.get_model('cmanager.assignment')
+        Member = apps.get_model('bhs.member')
+        Panelist = apps.get_model('rmanager.panelist')
+        if user_ids is not None:
+            user_ids = set(x for x in user_ids if x)
+            if not user_ids:
+                return
+            scope = Q(user__in=user_ids)
+            officers = Q(person__user__in=user_ids)
+            panelists = Q(person__user__in=user_ids)
+            members = Q(person__user__in=user_ids)
+        elif round_ids is not None:
+            round_ids = set(x for x in round_ids if x)
+            if not round_ids:
+                return
+            scope = Q(round__in=round_ids)
+            officers = Q(convention__sessions__rounds__in=round_ids)
+            panelists = Q(round__in=round_ids)
+            members = Q(group__appearances__round__in=round_ids)
+        else:
+            return
+        rows = set()
+        officers = Assignment.objects.filter(
+            officers,
+            person__user__isnull=False,
+            status__gt=0,
+            category__lte=Assignment.CATEGORY.ca,
+            convention__sessions__rounds__isnull=False,
+        ).values_list(
+            'person__user',
+            'convention__sessions__rounds',
+        )
+        for user_id, round_id in officers:
+            rows.add((self.model.KIND.officer, user_id, round_id, None))
+        panelists = Panelist.objects.filter(
+            panelists,
+            person__user__isnull=False,
+            status__gt=0,
+        ).values_list(
+            'person__user',
+            'round',
+        )
+        for user_id, round_id in panelists:
+            rows.add((self.model.KIND.panelist, user_id, round_id, None))
+        members = Member.objects.filter(
+            members,
+            person__user__isnull=False,
+            status__gt=0,
+            group__appearances__isnull=False,
+        ).values_list(
+            'person__user',
+            'group__appearances__round',
+            'group',
+        )
+        for user_id, round_id, group_id in members:
+            rows.add((self.model.KIND.member, user_id, round_id, group_id))
+        with transaction.atomic():
+            self.filter(scope).delete()
+            self.bulk_create([
+                self.model(
+                    kind=kind,
+                    user_id=user_id,
+                    round_id=round_id,
+                    group_id=group_id,
+                ) for kind, user_id, round_id, group_id in rows
+            ], batch_size=1000)
+        return len(rows)
@@ -0,0 +1,95 @@
+# Generated by Django 2.1.9 on 2019-06-27 18:12
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import model_utils.fields
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bhs', '0004_auto_20190625_1329'),
+        ('smanager', '0001_initial'),
+        ('rmanager', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AppearanceAggregate',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('tot_count', models.IntegerField(default=0)),
+                ('mus_count', models.IntegerField(default=0)),
+                ('per_count', models.IntegerField(default=0)),
+                ('sng_count', models.IntegerField(default=0)),
+                ('tot_points', models.IntegerField(blank=True, null=True)),
+                ('mus_points', models.IntegerField(blank=True, null=True)),
+                ('per_points', models.IntegerField(blank=True, null=True)),
+                ('sng_points', models.IntegerField(blank=True, null=True)),
+                ('tot_score', models.FloatField(blank=True, null=True)),
+                ('mus_score', models.FloatField(blank=True, null=True)),
+                ('per_score', models.FloatField(blank=True, null=True)),
+                ('sng_score', models.FloatField(blank=True, null=True)),
+                ('appearance', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='aggregate', serialize=False, to='rmanager.Appearance')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='GroupAggregate',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('tot_count', models.IntegerField(default=0)),
+                ('mus_count', models.IntegerField(default=0)),
+                ('per_count', models.IntegerField(default=0)),
+                ('sng_count', models.IntegerField(default=0)),
+                ('tot_points', models.IntegerField(blank=True, null=True)),
+                ('mus_points', models.IntegerField(blank=True, null=True)),
+                ('per_points', models.IntegerField(blank=True, null=True)),
+                ('sng_points', models.IntegerField(blank=True, null=True)),
+                ('tot_score', models.FloatField(blank=True, null=True)),
+                ('mus_score', models.FloatField(blank=True, null=True)),
+                ('per_score', models.FloatField(blank=True, null=True)),
+                ('sng_score', models.FloatField(blank=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('group', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='aggregates', to='bhs.Group')),
+                ('session', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='aggregates', to='smanager.Session')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='SongAggregate',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('tot_count', models.IntegerField(default=0)),
+                ('mus_count', models.IntegerField(default=0)),
+                ('per_count', models.IntegerField(default=0)),
+                ('sng_count', models.IntegerField(default=0)),
+                ('tot_points', models.IntegerField(blank=True, null=True)),
+                ('mus_points', models.IntegerField(blank=True, null=True)),
+                ('per_points', models.IntegerField(blank=True, null=True)),
+                ('sng_points', models.IntegerField(blank=True, null=True)),
+                ('tot_score', models.FloatField(blank=True, null=True)),
+                ('mus_score', models.FloatField(blank=True, null=True)),
+                ('per_score', models.FloatField(blank=True, null=True)),
+                ('sng_score', models.FloatField(blank=True, null=True)),
+                ('song', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='aggregate', serialize=False, to='rmanager.Song')),
+                ('tot_dev', models.FloatField(blank=True, null=True)),
+                ('mus_dev', models.FloatField(blank=True, null=True)),
+                ('per_dev', models.FloatField(blank=True, null=True)),
+                ('sng_dev', models.FloatField(blank=True, null=True)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='groupaggregate',
+            unique_together={('session', 'group')},
+        ),
+    ]
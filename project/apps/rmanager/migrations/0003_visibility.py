@@ -0,0 +1,35 @@
+# Generated by Django 2.1.9 on 2019-06-28 09:41
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('bhs', '0004_auto_20190625_1329'),
+        ('rmanager', '0002_aggregates'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Visibility',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('kind', models.IntegerField(choices=[(10, 'Officer'), (20, 'Panelist'), (30, 'Member')])),
+                ('group', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='visibilities', to='bhs.Group')),
+                ('round', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='visibilities', to='rmanager.Round')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='visibilities', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name_plural': 'visibilities',
+            },
+        ),
+        migrations.AlterIndexTogether(
+            name='visibility',
+            index_together={('user', 'kind')},
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 2.1.9 on 2019-06-29 10:12
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rmanager', '0003_visibility'),
+    ]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name='score',
+            index_together={('modified', 'id')},
+        ),
+        migrations.AlterIndexTogether(
+            name='song',
+            index_together={('modified', 'id')},
+        ),
+    ]
@@ -15,45 +15,144 @@ from django_fsm_log.models import StateLog
 from dry_rest_permissions.generics import allow_staff_or_superuser
 from dry_rest_permissions.generics import authenticated_users
 from model_utils import Choices
+from model_utils import FieldTracker
 from model_utils.models import TimeStampedModel
-from django.db.models import Sum, Max, Avg, StdDev, Count, Q, F, Func
+from django.db.models import Sum, Max, Avg, Count, Q, F
 from django.contrib.postgres.fields import ArrayField, JSONField
 from django_fsm import RETURN_VALUE
-from django.db.models.functions import DenseRank, RowNumber, Rank
+from django.db.models.functions import DenseRank, RowNumber
+from django.db.models.functions import Cast
 from django.core.validators import MaxValueValidator
 from django.core.validators import MinValueValidator
 from django.db import models
-from django.db.models import Min, Max, Count, Avg
+from django.db.models import Max, Count, Avg
 from django.core.exceptions import ValidationError
 # Django
 from django.apps import apps
 from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.files.base import ContentFile
 from django.db import models
+from django.db import transaction
+from django.db.models import Case
 from django.db.models import F, Window
+from django.db.models import Value
+from django.db.models import When
 from django.template.loader import render_to_string
 from django.utils.functional import cached_property
 from django.conf import settings
 from django.utils.timezone import now
 
+# First-Party
+from apps.bhs.generations import Generation
+from apps.bhs.generations import get_scopes
+from apps.bhs.permissions import PermissionContext
+
 from .tasks import build_email
-from .tasks import send_publish_email_from_round
-from .tasks import send_publish_report_email_from_round
-from .tasks import send_psa_email_from_panelist
-from .tasks import save_psa_from_panelist
-from .tasks import send_complete_email_from_appearance
-from .tasks import save_reports_from_round
 
+from .advancement import AdvancementEngine
+from .cubes import SessionScoreCube
+from .feeds import RoundFeed
 from .fields import FileUploadPath
+from .reports import Report
+from .reports import fingerprint
+from .reports import get_template_digest
+from .reports import fit_pdf
+from .reports import render_pdf
+from .variance import VarianceEngine
 
 
+from .managers import AppearanceAggregateManager
 from .managers import AppearanceManager
+from .managers import GroupAggregateManager
 from .managers import PanelistManager
+from .managers import SongAggregateManager
 from .managers import SongManager
 from .managers import ScoreManager
+from .managers import VisibilityManager
 
 log = logging.getLogger(__name__)
 
+# Fingerprints are keyed by generation, so this only bounds memory.
+REPORT_FINGERPRINT_TIMEOUT = 60 * 60 * 24
+
+
+class ScoreAggregate(TimeStampedModel):
+    """
+    Official-only score totals, kept current from Score writes.
+
+    Points are sums; scores are averages (points / count).
+    """
+
+    PREFIXES = ('tot', 'mus', 'per', 'sng')
+
+    tot_count = models.IntegerField(default=0)
+    mus_count = models.IntegerField(default=0)
+    per_count = models.IntegerField(default=0)
+    sng_count = models.IntegerField(default=0)
+
+    tot_points = models.IntegerField(null=True, blank=True)
+    mus_points = models.IntegerField(null=True, blank=True)
+    per_points = models.IntegerField(null=True, blank=True)
+    sng_points = models.IntegerField(null=True, blank=True)
+
+    tot_score = models.FloatField(null=True, blank=True)
+    mus_score = models.FloatField(null=True, blank=True)
+    per_score = models.FloatField(null=True, blank=True)
+    sng_score = models.FloatField(null=True, blank=True)
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def get_defaults(cls, totals):
+        """Build field defaults from a dict of counts and points."""
+        defaults = {}
+        for prefix in cls.PREFIXES:
+            count = totals.get('{0}_count'.format(prefix)) or 0
+            points = totals.get('{0}_points'.format(prefix))
+            defaults['{0}_count'.format(prefix)] = count
+            defaults['{0}_points'.format(prefix)] = points if count else None
+            defaults['{0}_score'.format(prefix)] = points / count if count else None
+        return defaults
+
+    @classmethod
+    def get_sums(cls, path, **filters):
+        """Sum annotations over a related aggregate, e.g. `appearances__aggregate`."""
+        sums = {}
+        for prefix in cls.PREFIXES:
+            for suffix in ['count', 'points']:
+                name = '{0}_{1}'.format(prefix, suffix)
+                sums[name] = Sum(
+                    '{0}__{1}'.format(path, name),
+                    filter=Q(**filters) if filters else None,
+                )
+        return sums
+
+    @classmethod
+    def get_columns(cls, path):
+        """Column annotations from a related aggregate, e.g. `aggregate`."""
+        columns = {}
+        for prefix in cls.PREFIXES:
+            for suffix in ['points', 'score']:
+                name = '{0}_{1}'.format(prefix, suffix)
+                columns[name] = F('{0}__{1}'.format(path, name))
+        return columns
+
+    @classmethod
+    def patch_scores(cls, obj):
+        """Set the averages on an object annotated by `get_sums`."""
+        for prefix in cls.PREFIXES:
+            count = getattr(obj, '{0}_count'.format(prefix))
+            points = getattr(obj, '{0}_points'.format(prefix))
+            setattr(
+                obj,
+                '{0}_score'.format(prefix),
+                points / count if count else None,
+            )
+        return obj
+
 
 class Appearance(TimeStampedModel):
     """
@@ -213,41 +312,36 @@ class Appearance(TimeStampedModel):
 
     @cached_property
     def run_total(self):
-        Score = apps.get_model('rmanager.score')
-        Panelist = apps.get_model('rmanager.panelist')
-        run_total = Score.objects.filter(
-            song__appearance__round__session=self.round.session,
-            song__appearance__round__num__lte=self.round.num,
-            song__appearance__group=self.group,
-            panelist__kind=Panelist.KIND.official,
+        AppearanceAggregate = apps.get_model('rmanager.appearanceaggregate')
+        totals = AppearanceAggregate.objects.filter(
+            appearance__round__session=self.round.session_id,
+            appearance__round__num__lte=self.round.num,
+            appearance__group=self.group_id,
         ).aggregate(
-            sum=Sum('points'),
-            avg=Avg('points'),
-            mus=Sum(
-                'points',
-                filter=Q(
-                    panelist__category=Panelist.CATEGORY.music,
-                ),
-            ),
-            sng=Sum(
-                'points',
-                filter=Q(
-                    panelist__category=Panelist.CATEGORY.singing,
-                ),
-            ),
-            per=Sum(
-                'points',
-                filter=Q(
-                    panelist__category=Panelist.CATEGORY.performance,
-                ),
-            ),
+            sum=Sum('tot_points'),
+            cnt=Sum('tot_count'),
+            mus=Sum('mus_points'),
+            sng=Sum('sng_points'),
+            per=Sum('per_points'),
         )
-        return run_total
+        cnt = totals.pop('cnt')
+        totals['avg'] = totals['sum'] / cnt if cnt else None
+        return totals
 
 
     # Appearance Internals
     objects = AppearanceManager()
 
+    tracker = FieldTracker(fields=[
+        'status',
+        'draw',
+        'onstage',
+        'actual_start',
+        'actual_finish',
+        'pos',
+        'is_private',
+    ])
+
     def clean(self):
         if self.group.kind != self.group.KIND.vlq:
             if self.group.kind != self.round.session.kind:
@@ -274,18 +368,17 @@ class Appearance(TimeStampedModel):
         )
 
     # Methods
+    def get_fingerprint(self, template):
+        return self.round.get_fingerprint(template, obj=self)
+
     def get_variance(self):
         Score = apps.get_model('rmanager.score')
         Panelist = apps.get_model('rmanager.panelist')
+        AppearanceAggregate = apps.get_model('rmanager.appearanceaggregate')
 
         # Songs Block
         songs = self.songs.annotate(
-            tot_score=Avg(
-                'scores__points',
-                filter=Q(
-                    scores__panelist__kind=Panelist.KIND.official,
-                ),
-            ),
+            tot_score=F('aggregate__tot_score'),
         ).order_by('num')
         scores = Score.objects.filter(
             panelist__kind=Panelist.KIND.official,
@@ -307,7 +400,9 @@ class Appearance(TimeStampedModel):
             variances.extend(song.dixons)
             variances.extend(song.asterisks)
         variances = list(set(variances))
-        tot_points = scores.aggregate(sum=Sum('points'))['sum']
+        tot_points = AppearanceAggregate.objects.filter(
+            appearance=self,
+        ).values_list('tot_points', flat=True).first()
         context = {
             'appearance': self,
             'songs': songs,
@@ -331,7 +426,7 @@ class Appearance(TimeStampedModel):
         content = self.get_variance()
         self.variance_report.save("variance_report", content)
 
-    def mock(self):
+    def mock_scores(self):
         # Mock Appearance
         Chart = apps.get_model('bhs.chart')
         Panelist = apps.get_model('rmanager.panelist')
@@ -362,166 +457,179 @@ class Appearance(TimeStampedModel):
                 d = randint(-3, 3)
                 score.points = prelim + d
                 score.save()
+        return
+
+    def set_scoresheet(self, scores):
+        """
+        Apply a score matrix for the whole appearance in one UPDATE.
+
+        `scores` is a list of `song`, `panelist` and `points` dicts.  Every
+        cell is validated before anything is written; returns the updated
+        points by score id.
+        """
+        Round = apps.get_model('rmanager.round')
+        Score = apps.get_model('rmanager.score')
+        if self.round.status >= Round.STATUS.verified:
+            raise ValidationError(
+                {'scores': ['Scores are locked once the round is verified.']}
+            )
+        sheet = Score.objects.filter(
+            song__appearance=self,
+        ).values_list(
+            'id',
+            'song',
+            'panelist',
+        )
+        cells = {(str(x[1]), str(x[2])): x[0] for x in sheet}
+        updates = {}
+        errors = []
+        for i, row in enumerate(scores, start=1):
+            key = (str(row.get('song')), str(row.get('panelist')))
+            points = row.get('points')
+            if key not in cells:
+                errors.append('Row {0}: No score for that song and panelist.'.format(i))
+                continue
+            if cells[key] in updates:
+                errors.append('Row {0}: Duplicate score.'.format(i))
+                continue
+            if points is not None:
+                try:
+                    if isinstance(points, bool):
+                        raise ValueError
+                    points = int(points)
+                except (TypeError, ValueError):
+                    errors.append('Row {0}: Points must be a number.'.format(i))
+                    continue
+                if not 0 <= points <= 100:
+                    errors.append('Row {0}: Points must be between 0 - 100'.format(i))
+                    continue
+            updates[cells[key]] = points
+        if errors:
+            raise ValidationError({'scores': errors})
+        if not updates:
+            return updates
+        with transaction.atomic():
+            # Refreshes the aggregates and standings on the way.
+            Score.objects.filter(
+                id__in=updates.keys(),
+            ).update(
+                # Cast, or a sheet of all blanks comes back as text.
+                points=Cast(
+                    Case(
+                        *[
+                            When(id=k, then=Value(v))
+                            for k, v in updates.items()
+                        ],
+                        output_field=models.IntegerField(null=True)
+                    ),
+                    output_field=models.IntegerField(null=True),
+                ),
+                # Keyset walkers page by `modified`; see KeysetPagination.
+                modified=now(),
+            )
+        round_id = self.round_id
+        transaction.on_commit(
+            lambda: RoundFeed(round_id).publish_many([
+                ('score', k, {'points': v}) for k, v in updates.items()
+            ])
+        )
+        # The UPDATE skips the signals that would bump the generations.
+        scopes = get_scopes(self)
+        transaction.on_commit(
+            lambda: Generation().bump(scopes)
+        )
+        return updates
+
+    def get_scoresheet_totals(self):
+        """Current appearance and song totals, for scoresheet responses."""
+        AppearanceAggregate = apps.get_model('rmanager.appearanceaggregate')
+        SongAggregate = apps.get_model('rmanager.songaggregate')
+        fields = []
+        for prefix in ScoreAggregate.PREFIXES:
+            for suffix in ['count', 'points', 'score']:
+                fields.append('{0}_{1}'.format(prefix, suffix))
+        totals = AppearanceAggregate.objects.filter(
+            appearance=self,
+        ).values(*fields).first() or {}
+        songs = SongAggregate.objects.filter(
+            song__appearance=self,
+        ).order_by(
+            'song__num',
+        ).values('song', 'song__num', *fields)
+        totals['songs'] = [
+            dict(
+                {k: v for k, v in row.items() if k not in ['song', 'song__num']},
+                id=row['song'],
+                num=row['song__num'],
+            ) for row in songs
+        ]
+        return totals
+
+    def mock(self, engine=None):
+        self.mock_scores()
+        return self.mock_transitions(engine=engine)
+
+    def mock_transitions(self, engine=None):
         if self.status == self.STATUS.new:
             raise RuntimeError("Out of state")
         if self.status == self.STATUS.built:
             self.start()
             self.finish()
-            self.verify()
+            self.verify(engine=engine)
             return
         if self.status == self.STATUS.started:
             self.finish()
-            self.verify()
+            self.verify(engine=engine)
             return
         if self.status == self.STATUS.finished:
-            self.verify()
+            self.verify(engine=engine)
             return
 
-    def check_variance(self):
-        # Set flag
-        variance = False
-        # Run checks for all songs and save.
-        for song in self.songs.all():
-            asterisks = song.get_asterisks()
-            if asterisks:
-                song.asterisks = asterisks
-                variance = True
-            dixons = song.get_dixons()
-            if dixons:
-                song.dixons = dixons
-                variance = True
-            if variance:
-                song.save()
-        return variance
+    def check_variance(self, engine=None):
+        # Run checks for all songs and save; the engine loads the round once.
+        if engine is None:
+            engine = VarianceEngine(self.round)
+        song_ids = self.songs.values_list('id', flat=True)
+        return bool(engine.save(song_ids))
 
-    def get_csa(self):
+    def get_csa_report(self):
         Panelist = apps.get_model('rmanager.panelist')
         Song = apps.get_model('rmanager.song')
-        Score = apps.get_model('rmanager.score')
+        AppearanceAggregate = apps.get_model('rmanager.appearanceaggregate')
+        GroupAggregate = apps.get_model('rmanager.groupaggregate')
+        SongAggregate = apps.get_model('rmanager.songaggregate')
 
         # Appearancers Block
         group = self.group
-        stats = Score.objects.select_related(
-            'song__appearance__group',
-            'song__appearance__round__session',
-            'song__appearance__round',
-            'panelist',
-        ).filter(
-            song__appearance__group=self.group,
-            song__appearance__round__session=self.round.session,
-            panelist__kind=Panelist.KIND.official,
+        stats = GroupAggregate.objects.filter(
+            session=self.round.session_id,
+            group=self.group_id,
+        ).values(
+            'tot_points',
+            'mus_points',
+            'per_points',
+            'sng_points',
+            'tot_score',
+            'mus_score',
+            'per_score',
+            'sng_score',
+        ).first() or {}
+        stats['max'] = Appearance.objects.filter(
+            group=self.group,
+            round__session=self.round.session,
+            songs__scores__panelist__kind=Panelist.KIND.official,
         ).aggregate(
-            max=Max(
-                'song__appearance__round__num',
-            ),
-            tot_points=Sum(
-                'points',
-            ),
-            mus_points=Sum(
-                'points',
-                filter=Q(
-                    panelist__category=Panelist.CATEGORY.music,
-                )
-            ),
-            per_points=Sum(
-                'points',
-                filter=Q(
-                    panelist__category=Panelist.CATEGORY.performance,
-                )
-            ),
-            sng_points=Sum(
-                'points',
-                filter=Q(
-                    panelist__category=Panelist.CATEGORY.singing,
-                )
-            ),
-            tot_score=Avg(
-                'points',
-            ),
-            mus_score=Avg(
-                'points',
-                filter=Q(
-                    panelist__category=Panelist.CATEGORY.music,
-                )
-            ),
-            per_score=Avg(
-                'points',
-                filter=Q(
-                    panelist__category=Panelist.CATEGORY.performance,
-                )
-            ),
-            sng_score=Avg(
-                'points',
-                filter=Q(
-                    panelist__category=Panelist.CATEGORY.singing,
-                )
-            ),
-        )
+            max=Max('round__num'),
+        )['max']
         appearances = Appearance.objects.select_related(
             'group',
             'round',
             'round__session',
-        ).prefetch_related(
-            'songs__scores',
-            'songs__scores__panelist',
         ).filter(
             group=self.group,
             round__session=self.round.session,
         ).annotate(
-            tot_points=Sum(
-                'songs__scores__points',
-                filter=Q(
-                    songs__scores__panelist__kind=Panelist.KIND.official,
-                ),
-            ),
-            mus_points=Sum(
-                'songs__scores__points',
-                filter=Q(
-                    songs__scores__panelist__kind=Panelist.KIND.official,
-                    songs__scores__panelist__category=Panelist.CATEGORY.music,
-                ),
-            ),
-            per_points=Sum(
-                'songs__scores__points',
-                filter=Q(
-                    songs__scores__panelist__kind=Panelist.KIND.official,
-                    songs__scores__panelist__category=Panelist.CATEGORY.performance,
-                ),
-            ),
-            sng_points=Sum(
-                'songs__scores__points',
-                filter=Q(
-                    songs__scores__panelist__kind=Panelist.KIND.official,
-                    songs__scores__panelist__category=Panelist.CATEGORY.singing,
-                ),
-            ),
-            tot_score=Avg(
-                'songs__scores__points',
-                filter=Q(
-                    songs__scores__panelist__kind=Panelist.KIND.official,
-                ),
-            ),
-            mus_score=Avg(
-                'songs__scores__points',
-                filter=Q(
-                    songs__scores__panelist__kind=Panelist.KIND.official,
-                    songs__scores__panelist__category=Panelist.CATEGORY.music,
-                ),
-            ),
-            per_score=Avg(
-                'songs__scores__points',
-                filter=Q(
-                    songs__scores__panelist__kind=Panelist.KIND.official,
-                    songs__scores__panelist__category=Panelist.CATEGORY.performance,
-                ),
-            ),
-            sng_score=Avg(
-                'songs__scores__points',
-                filter=Q(
-                    songs__scores__panelist__kind=Panelist.KIND.official,
-                    songs__scores__panelist__category=Panelist.CATEGORY.singing,
-                ),
-            ),
+            **AppearanceAggregate.get_columns('aggregate')
         )
 
         # Monkeypatch
@@ -534,60 +642,7 @@ class Appearance(TimeStampedModel):
             ).order_by(
                 'num',
             ).annotate(
-                tot_score=Avg(
-                    'scores__points',
-                    filter=Q(
-                        scores__panelist__kind=Panelist.KIND.official,
-                    ),
-                ),
-                mus_score=Avg(
-                    'scores__points',
-                    filter=Q(
-                        scores__panelist__kind=Panelist.KIND.official,
-                        scores__panelist__category=Panelist.CATEGORY.music,
-                    ),
-                ),
-                per_score=Avg(
-                    'scores__points',
-                    filter=Q(
-                        scores__panelist__kind=Panelist.KIND.official,
-                        scores__panelist__category=Panelist.CATEGORY.performance,
-                    ),
-                ),
-                sng_score=Avg(
-                    'scores__points',
-                    filter=Q(
-                        scores__panelist__kind=Panelist.KIND.official,
-                        scores__panelist__category=Panelist.CATEGORY.singing,
-                    ),
-                ),
-                tot_points=Sum(
-                    'scores__points',
-                    filter=Q(
-                        scores__panelist__kind=Panelist.KIND.official,
-                    ),
-                ),
-                mus_points=Sum(
-                    'scores__points',
-                    filter=Q(
-                        scores__panelist__kind=Panelist.KIND.official,
-                        scores__panelist__category=Panelist.CATEGORY.music,
-                    ),
-                ),
-                per_points=Sum(
-                    'scores__points',
-                    filter=Q(
-                        scores__panelist__kind=Panelist.KIND.official,
-                        scores__panelist__category=Panelist.CATEGORY.performance,
-                    ),
-                ),
-                sng_points=Sum(
-                    'scores__points',
-                    filter=Q(
-                        scores__panelist__kind=Panelist.KIND.official,
-                        scores__panelist__category=Panelist.CATEGORY.singing,
-                    ),
-                ),
+                **SongAggregate.get_columns('aggregate')
             )
             for song in songs:
                 penalties_map = {
@@ -678,26 +733,23 @@ class Appearance(TimeStampedModel):
             'penalties': penalties,
             'category_count': category_count,
         }
-        rendered = render_to_string(
-            'reports/csa.html',
-            context,
-        )
         statelog = self.round.statelogs.latest('timestamp')
         footer = 'Published by {0} at {1}'.format(
             statelog.by,
             statelog.timestamp.strftime("%Y-%m-%d %H:%M:%S %Z"),
         )
-        file = pydf.generate_pdf(
-            rendered,
-            orientation='Portrait',
-            margin_top='5mm',
-            margin_bottom='5mm',
-            footer_right=footer,
-            footer_font_name='Encode Sans',
-            footer_font_size=6,
-        )
-        content = ContentFile(file)
-        return content
+        options = {
+            'orientation': 'Portrait',
+            'margin_top': '5mm',
+            'margin_bottom': '5mm',
+            'footer_right': footer,
+            'footer_font_name': 'Encode Sans',
+            'footer_font_size': 6,
+        }
+        return Report('reports/csa.html', context, options)
+
+    def get_csa(self):
+        return render_pdf(self.get_csa_report())
 
     def save_csa(self):
         content = self.get_csa()
@@ -706,131 +758,41 @@ class Appearance(TimeStampedModel):
 
     def get_complete_email(self):
         Panelist = apps.get_model('rmanager.panelist')
-        Score = apps.get_model('rmanager.score')
+        AppearanceAggregate = apps.get_model('rmanager.appearanceaggregate')
+        GroupAggregate = apps.get_model('rmanager.groupaggregate')
+        SongAggregate = apps.get_model('rmanager.songaggregate')
 
         # Context
         group = self.group
-        stats = Score.objects.select_related(
-            'song__appearance__group',
-            'song__appearance__round__session',
-            'song__appearance__round',
-            'panelist',
-        ).filter(
-            song__appearance__group=self.group,
-            song__appearance__round__session=self.round.session,
-            panelist__kind=Panelist.KIND.official,
+        stats = GroupAggregate.objects.filter(
+            session=self.round.session_id,
+            group=self.group_id,
+        ).values(
+            'tot_points',
+            'mus_points',
+            'per_points',
+            'sng_points',
+            'tot_score',
+            'mus_score',
+            'per_score',
+            'sng_score',
+        ).first() or {}
+        stats['max'] = Appearance.objects.filter(
+            group=self.group,
+            round__session=self.round.session,
+            songs__scores__panelist__kind=Panelist.KIND.official,
         ).aggregate(
-            max=Max(
-                'song__appearance__round__num',
-            ),
-            tot_points=Sum(
-                'points',
-            ),
-            mus_points=Sum(
-                'points',
-                filter=Q(
-                    panelist__category=Panelist.CATEGORY.music,
-                )
-            ),
-            per_points=Sum(
-                'points',
-                filter=Q(
-                    panelist__category=Panelist.CATEGORY.performance,
-                )
-            ),
-            sng_points=Sum(
-                'points',
-                filter=Q(
-                    panelist__category=Panelist.CATEGORY.singing,
-                )
-            ),
-            tot_score=Avg(
-                'points',
-            ),
-            mus_score=Avg(
-                'points',
-                filter=Q(
-                    panelist__category=Panelist.CATEGORY.music,
-                )
-            ),
-            per_score=Avg(
-                'points',
-                filter=Q(
-                    panelist__category=Panelist.CATEGORY.performance,
-                )
-            ),
-            sng_score=Avg(
-                'points',
-                filter=Q(
-                    panelist__category=Panelist.CATEGORY.singing,
-                )
-            ),
-        )
+            max=Max('round__num'),
+        )['max']
         appearances = Appearance.objects.select_related(
             'group',
             'round',
             'round__session',
-        ).prefetch_related(
-            'songs__scores',
-            'songs__scores__panelist',
         ).filter(
             group=self.group,
             round__session=self.round.session,
         ).annotate(
-            tot_points=Sum(
-                'songs__scores__points',
-                filter=Q(
-                    songs__scores__panelist__kind=Panelist.KIND.official,
-                ),
-            ),
-            mus_points=Sum(
-                'songs__scores__points',
-                filter=Q(
-                    songs__scores__panelist__kind=Panelist.KIND.official,
-                    songs__scores__panelist__category=Panelist.CATEGORY.music,
-                ),
-            ),
-            per_points=Sum(
-                'songs__scores__points',
-                filter=Q(
-                    songs__scores__panelist__kind=Panelist.KIND.official,
-                    songs__scores__panelist__category=Panelist.CATEGORY.performance,
-                ),
-            ),
-            sng_points=Sum(
-                'songs__scores__points',
-                filter=Q(
-                    songs__scores__panelist__kind=Panelist.KIND.official,
-                    songs__scores__panelist__category=Panelist.CATEGORY.singing,
-                ),
-            ),
-            tot_score=Avg(
-                'songs__scores__points',
-                filter=Q(
-                    songs__scores__panelist__kind=Panelist.KIND.official,
-                ),
-            ),
-            mus_score=Avg(
-                'songs__scores__points',
-                filter=Q(
-                    songs__scores__panelist__kind=Panelist.KIND.official,
-                    songs__scores__panelist__category=Panelist.CATEGORY.music,
-                ),
-            ),
-            per_score=Avg(
-                'songs__scores__points',
-                filter=Q(
-                    songs__scores__panelist__kind=Panelist.KIND.official,
-                    songs__scores__panelist__category=Panelist.CATEGORY.performance,
-                ),
-            ),
-            sng_score=Avg(
-                'songs__scores__points',
-                filter=Q(
-                    songs__scores__panelist__kind=Panelist.KIND.official,
-                    songs__scores__panelist__category=Panelist.CATEGORY.singing,
-                ),
-            ),
+            **AppearanceAggregate.get_columns('aggregate')
         )
 
         # Monkeypatch
@@ -843,60 +805,7 @@ class Appearance(TimeStampedModel):
             ).order_by(
                 'num',
             ).annotate(
-                tot_score=Avg(
-                    'scores__points',
-                    filter=Q(
-                        scores__panelist__kind=Panelist.KIND.official,
-                    ),
-                ),
-                mus_score=Avg(
-                    'scores__points',
-                    filter=Q(
-                        scores__panelist__kind=Panelist.KIND.official,
-                        scores__panelist__category=Panelist.CATEGORY.music,
-                    ),
-                ),
-                per_score=Avg(
-                    'scores__points',
-                    filter=Q(
-                        scores__panelist__kind=Panelist.KIND.official,
-                        scores__panelist__category=Panelist.CATEGORY.performance,
-                    ),
-                ),
-                sng_score=Avg(
-                    'scores__points',
-                    filter=Q(
-                        scores__panelist__kind=Panelist.KIND.official,
-                        scores__panelist__category=Panelist.CATEGORY.singing,
-                    ),
-                ),
-                tot_points=Sum(
-                    'scores__points',
-                    filter=Q(
-                        scores__panelist__kind=Panelist.KIND.official,
-                    ),
-                ),
-                mus_points=Sum(
-                    'scores__points',
-                    filter=Q(
-                        scores__panelist__kind=Panelist.KIND.official,
-                        scores__panelist__category=Panelist.CATEGORY.music,
-                    ),
-                ),
-                per_points=Sum(
-                    'scores__points',
-                    filter=Q(
-                        scores__panelist__kind=Panelist.KIND.official,
-                        scores__panelist__category=Panelist.CATEGORY.performance,
-                    ),
-                ),
-                sng_points=Sum(
-                    'scores__points',
-                    filter=Q(
-                        scores__panelist__kind=Panelist.KIND.official,
-                        scores__panelist__category=Panelist.CATEGORY.singing,
-                    ),
-                ),
+                **SongAggregate.get_columns('aggregate')
             )
             for song in songs:
                 penalties_map = {
@@ -957,11 +866,7 @@ class Appearance(TimeStampedModel):
     def has_object_read_permission(self, request):
         return any([
             self.round.status == self.round.STATUS.published,
-            self.round.session.convention.assignments.filter(
-                person__user=request.user,
-                status__gt=0,
-                category__lte=10,
-            ),
+            PermissionContext.for_request(request).is_officer_round(self.round_id),
         ])
 
     @staticmethod
@@ -969,10 +874,7 @@ class Appearance(TimeStampedModel):
     @authenticated_users
     def has_write_permission(request):
         return any([
-            request.user.person.officers.filter(
-                office__lt=300,
-                status__gt=0,
-            ),
+            PermissionContext.for_request(request).has_office(below=300),
         ])
 
     @allow_staff_or_superuser
@@ -980,11 +882,7 @@ class Appearance(TimeStampedModel):
     def has_object_write_permission(self, request):
         return any([
             all([
-                self.round.session.convention.assignments.filter(
-                    person__user=request.user,
-                    status__gt=0,
-                    category__lte=10,
-                ),
+                PermissionContext.for_request(request).is_officer_round(self.round_id),
                 self.round.status != self.round.STATUS.published,
             ]),
         ])
@@ -1003,6 +901,25 @@ class Appearance(TimeStampedModel):
             not self.songs.filter(scores__points__isnull=True),
         ])
 
+    def get_sheets(self, panelists):
+        """Unsaved songs and their empty scores, for bulk insert."""
+        Score = apps.get_model('rmanager.score')
+        Song = apps.get_model('rmanager.song')
+        songs = []
+        scores = []
+        for num in [1, 2]:  # Number songs constant
+            song = Song(
+                appearance=self,
+                num=num,
+            )
+            songs.append(song)
+            for panelist in panelists:
+                scores.append(Score(
+                    song=song,
+                    panelist=panelist,
+                ))
+        return songs, scores
+
     # Appearance Transitions
     @fsm_log_by
     @transition(
@@ -1013,19 +930,16 @@ class Appearance(TimeStampedModel):
     def build(self, *args, **kwargs):
         """Sets up the Appearance."""
         Panelist = apps.get_model('rmanager.panelist')
+        Score = apps.get_model('rmanager.score')
+        Song = apps.get_model('rmanager.song')
+        SongAggregate = apps.get_model('rmanager.songaggregate')
         panelists = self.round.panelists.filter(
             category__gt=Panelist.CATEGORY.ca,
         )
-        i = 1
-        while i <= 2:  # Number songs constant
-            song = self.songs.create(
-                num=i
-            )
-            for panelist in panelists:
-                song.scores.create(
-                    panelist=panelist,
-                )
-            i += 1
+        songs, scores = self.get_sheets(panelists)
+        Song.objects.bulk_create(songs)
+        Score.objects.bulk_create(scores)
+        SongAggregate.objects.refresh([x.id for x in songs])
         return
 
     @fsm_log_by
@@ -1060,7 +974,7 @@ class Appearance(TimeStampedModel):
     def verify(self, *args, **kwargs):
         # Checks for variance.  Returns Verified or Variance accordingly.
         if self.status == self.STATUS.finished:
-            variance = self.check_variance()
+            variance = self.check_variance(engine=kwargs.get('engine'))
             if variance:
                 # Run variance report and save file.
                 self.save_variance()
@@ -1118,6 +1032,20 @@ class Appearance(TimeStampedModel):
         return
 
 
+class AppearanceAggregate(ScoreAggregate):
+    appearance = models.OneToOneField(
+        'Appearance',
+        related_name='aggregate',
+        primary_key=True,
+        on_delete=models.CASCADE,
+    )
+
+    objects = AppearanceAggregateManager()
+
+    def __str__(self):
+        return str(self.appearance_id)
+
+
 class Contender(TimeStampedModel):
     id = models.UUIDField(
         primary_key=True,
@@ -1190,10 +1118,7 @@ class Contender(TimeStampedModel):
     @authenticated_users
     def has_write_permission(request):
         return any([
-            request.user.person.officers.filter(
-                office__lt=500,
-                status__gt=0,
-            ),
+            PermissionContext.for_request(request).has_office(below=500),
         ])
 
     @allow_staff_or_superuser
@@ -1201,11 +1126,7 @@ class Contender(TimeStampedModel):
     def has_object_write_permission(self, request):
         return any([
             all([
-                self.outcome.round.session.convention.assignments.filter(
-                    person__user=request.user,
-                    status__gt=0,
-                    category__lte=10,
-                ),
+                PermissionContext.for_request(request).is_officer_round(self.outcome.round_id),
                 self.outcome.round.status < self.outcome.round.STATUS.started,
             ]),
         ])
@@ -1216,10 +1137,41 @@ class Contender(TimeStampedModel):
     def include(self, *args, **kwargs):
         return
 
-    @fsm_log_by
-    @transition(field=status, source='*', target=STATUS.excluded)
-    def exclude(self, *args, **kwargs):
-        return
+    @fsm_log_by
+    @transition(field=status, source='*', target=STATUS.excluded)
+    def exclude(self, *args, **kwargs):
+        return
+
+
+class GroupAggregate(ScoreAggregate):
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False,
+    )
+
+    # FKs
+    session = models.ForeignKey(
+        'smanager.session',
+        related_name='aggregates',
+        on_delete=models.CASCADE,
+    )
+
+    group = models.ForeignKey(
+        'bhs.group',
+        related_name='aggregates',
+        on_delete=models.CASCADE,
+    )
+
+    objects = GroupAggregateManager()
+
+    class Meta:
+        unique_together = (
+            ('session', 'group',),
+        )
+
+    def __str__(self):
+        return str(self.id)
 
 
 class Outcome(TimeStampedModel):
@@ -1284,7 +1236,7 @@ class Outcome(TimeStampedModel):
     # Methods
     def get_name(self):
         Group = apps.get_model('bhs.group')
-        Panelist = apps.get_model('rmanager.panelist')
+        GroupAggregate = apps.get_model('rmanager.groupaggregate')
         if self.round.kind != self.round.KIND.finals and not self.award.is_single:
             return "(Result determined in Finals)"
         if self.award.level == self.award.LEVEL.deferred:
@@ -1373,55 +1325,33 @@ class Outcome(TimeStampedModel):
             group_ids = Group.objects.filter(
                 appearances__contenders__outcome=self,
             ).values_list('id', flat=True)
-            qualifiers = Group.objects.filter(
-                id__in=group_ids,
-            ).annotate(
-                avg=Avg(
-                    'appearances__songs__scores__points',
-                    filter=Q(
-                        appearances__round__session=self.round.session,
-                        appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                    ),
-                ),
-            ).filter(
-                avg__gte=threshold,
+            qualifiers = GroupAggregate.objects.filter(
+                session=self.round.session_id,
+                group__id__in=group_ids,
+                tot_score__gte=threshold,
             ).order_by(
-                'name',
-            ).values_list('name', flat=True)
+                'group__name',
+            ).values_list('group__name', flat=True)
             if qualifiers:
                 return ", ".join(qualifiers)
             return "(No Qualifiers)"
         if self.award.level in [self.award.LEVEL.championship, self.award.LEVEL.representative]:
-            winner = Group.objects.filter(
+            group_ids = Group.objects.filter(
                 appearances__contenders__outcome=self,
-            ).annotate(
-                tot=Sum(
-                    'appearances__songs__scores__points',
-                    filter=Q(
-                        appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                    ),
-                ),
-                sng=Sum(
-                    'appearances__songs__scores__points',
-                    filter=Q(
-                        appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                        appearances__songs__scores__panelist__category=Panelist.CATEGORY.singing
-                    ),
-                ),
-                per=Sum(
-                    'appearances__songs__scores__points',
-                    filter=Q(
-                        appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                        appearances__songs__scores__panelist__category=Panelist.CATEGORY.performance
-                    ),
-                ),
-            ).earliest(
-                '-tot',
-                '-sng',
-                '-per',
-            )
+            ).values_list('id', flat=True)
+            winner = GroupAggregate.objects.filter(
+                session=self.round.session_id,
+                group__id__in=group_ids,
+                tot_points__isnull=False,
+            ).select_related(
+                'group',
+            ).order_by(
+                '-tot_points',
+                '-sng_points',
+                '-per_points',
+            ).first()
             if winner:
-                return str(winner.name)
+                return str(winner.group.name)
             return "(No Recipient)"
         raise RuntimeError("Level mismatch")
 
@@ -1453,11 +1383,7 @@ class Outcome(TimeStampedModel):
     def has_object_read_permission(self, request):
         return any([
             self.round.status == self.round.STATUS.published,
-            self.round.session.convention.assignments.filter(
-                person__user=request.user,
-                status__gt=0,
-                category__lte=10,
-            ),
+            PermissionContext.for_request(request).is_officer_round(self.round_id),
         ])
 
 
@@ -1466,10 +1392,7 @@ class Outcome(TimeStampedModel):
     @authenticated_users
     def has_write_permission(request):
         return any([
-            request.user.person.officers.filter(
-                office__lt=300,
-                status__gt=0,
-            ),
+            PermissionContext.for_request(request).has_office(below=300),
         ])
 
     @allow_staff_or_superuser
@@ -1477,11 +1400,7 @@ class Outcome(TimeStampedModel):
     def has_object_write_permission(self, request):
         return any([
             all([
-                self.round.session.convention.assignments.filter(
-                    person__user=request.user,
-                    status__gt=0,
-                    category__lte=10,
-                ),
+                PermissionContext.for_request(request).is_officer_round(self.round_id),
                 self.round.status < self.round.STATUS.verified,
             ]),
         ])
@@ -1591,6 +1510,13 @@ class Panelist(TimeStampedModel):
     # Internals
     objects = PanelistManager()
 
+    tracker = FieldTracker(fields=[
+        'kind',
+        'category',
+        'status',
+        'person',
+    ])
+
     class Meta:
         unique_together = (
             ('round', 'num',),
@@ -1641,10 +1567,7 @@ class Panelist(TimeStampedModel):
     @authenticated_users
     def has_write_permission(request):
         return any([
-            request.user.person.officers.filter(
-                office__lt=300,
-                status__gt=0,
-            ),
+            PermissionContext.for_request(request).has_office(below=300),
         ])
 
     @allow_staff_or_superuser
@@ -1652,16 +1575,15 @@ class Panelist(TimeStampedModel):
     def has_object_write_permission(self, request):
         return any([
             all([
-                self.round.session.convention.assignments.filter(
-                    person__user=request.user,
-                    status__gt=0,
-                    category__lte=10,
-                ),
+                PermissionContext.for_request(request).is_officer_round(self.round_id),
                 self.round.status < self.round.STATUS.started,
             ]),
         ])
 
-    def get_psa(self):
+    def get_fingerprint(self, template):
+        return self.round.get_fingerprint(template, obj=self)
+
+    def get_psa_report(self):
         Appearance = apps.get_model('rmanager.appearance')
         Score = apps.get_model('rmanager.score')
         Group = apps.get_model('bhs.group')
@@ -1684,27 +1606,16 @@ class Panelist(TimeStampedModel):
             'appearances__round__session',
         ).annotate(
             tot_points=Sum(
-                'appearances__songs__scores__points',
-                filter=Q(
-                    appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                    appearances__round__session=self.round.session,
-                ),
+                'aggregates__tot_points',
+                filter=Q(aggregates__session=self.round.session),
             ),
             per_points=Sum(
-                'appearances__songs__scores__points',
-                filter=Q(
-                    appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                    appearances__songs__scores__panelist__category=Panelist.CATEGORY.performance,
-                    appearances__round__session=self.round.session,
-                ),
+                'aggregates__per_points',
+                filter=Q(aggregates__session=self.round.session),
             ),
             sng_points=Sum(
-                'appearances__songs__scores__points',
-                filter=Q(
-                    appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                    appearances__songs__scores__panelist__category=Panelist.CATEGORY.singing,
-                    appearances__round__session=self.round.session,
-                ),
+                'aggregates__sng_points',
+                filter=Q(aggregates__session=self.round.session),
             ),
         ).order_by(
             '-tot_points',
@@ -1728,39 +1639,11 @@ class Panelist(TimeStampedModel):
                     'scores',
                     'scores__panelist',
                 ).annotate(
-                    avg=Avg(
-                        'scores__points',
-                        filter=Q(
-                            scores__panelist__kind=Panelist.KIND.official,
-                        ),
-                    ),
-                    dev=StdDev(
-                        'scores__points',
-                        filter=Q(
-                            scores__panelist__kind=Panelist.KIND.official,
-                        ),
-                    ),
-                    Music=Avg(
-                        'scores__points',
-                        filter=Q(
-                            scores__panelist__kind=Panelist.KIND.official,
-                            scores__panelist__category=Panelist.CATEGORY.music,
-                        ),
-                    ),
-                    Performance=Avg(
-                        'scores__points',
-                        filter=Q(
-                            scores__panelist__kind=Panelist.KIND.official,
-                            scores__panelist__category=Panelist.CATEGORY.performance,
-                        ),
-                    ),
-                    Singing=Avg(
-                        'scores__points',
-                        filter=Q(
-                            scores__panelist__kind=Panelist.KIND.official,
-                            scores__panelist__category=Panelist.CATEGORY.singing,
-                        ),
-                    ),
+                    avg=F('aggregate__tot_score'),
+                    dev=F('aggregate__tot_dev'),
+                    Music=F('aggregate__mus_score'),
+                    Performance=F('aggregate__per_score'),
+                    Singing=F('aggregate__sng_score'),
                 )
                 for song in songs:
                     scores2 = song.scores.select_related(
@@ -1792,27 +1675,24 @@ class Panelist(TimeStampedModel):
             'panelist': self,
             'groups': groups,
         }
-        rendered = render_to_string(
-            'reports/psa.html',
-            context,
-        )
         statelog = self.round.statelogs.latest('timestamp')
         footer = 'Published by {0} at {1}'.format(
             statelog.by,
             statelog.timestamp.strftime("%Y-%m-%d %H:%M:%S %Z"),
         )
-        file = pydf.generate_pdf(
-            rendered,
-            page_size='Letter',
-            orientation='Portrait',
-            margin_top='5mm',
-            margin_bottom='5mm',
-            footer_right=footer,
-            footer_font_name='Encode Sans',
-            footer_font_size=6,
-        )
-        content = ContentFile(file)
-        return content
+        options = {
+            'page_size': 'Letter',
+            'orientation': 'Portrait',
+            'margin_top': '5mm',
+            'margin_bottom': '5mm',
+            'footer_right': footer,
+            'footer_font_name': 'Encode Sans',
+            'footer_font_size': 6,
+        }
+        return Report('reports/psa.html', context, options)
+
+    def get_psa(self):
+        return render_pdf(self.get_psa_report())
 
     def save_psa(self):
         content = self.get_psa()
@@ -1970,11 +1850,165 @@ class Round(TimeStampedModel):
         )
 
     # Methods
-    def get_oss(self, zoom=1):
+    def get_report_sources(self):
+        """Rows the reports in this round's session are rendered from."""
+        Appearance = apps.get_model('rmanager.appearance')
+        Contender = apps.get_model('rmanager.contender')
+        Outcome = apps.get_model('rmanager.outcome')
+        Panelist = apps.get_model('rmanager.panelist')
+        Score = apps.get_model('rmanager.score')
+        Song = apps.get_model('rmanager.song')
+        session = self.session
+        scores = Score.objects.filter(
+            song__appearance__round__session=session,
+        ).order_by(
+            'id',
+        ).values_list(
+            'id',
+            'points',
+            'song',
+            'panelist',
+        )
+        songs = Song.objects.filter(
+            appearance__round__session=session,
+        ).order_by(
+            'id',
+        ).values_list(
+            'id',
+            'num',
+            'penalties',
+            'chart__title',
+            'chart__arrangers',
+            # Written on verify, not on score save.
+            'asterisks',
+            'dixons',
+        )
+        contenders = Contender.objects.filter(
+            appearance__round__session=session,
+        ).order_by(
+            'id',
+        ).values_list(
+            'id',
+            'appearance_id',
+            'outcome_id',
+        )
+        appearances = Appearance.objects.filter(
+            round__session=session,
+        ).order_by(
+            'id',
+        ).values_list(
+            'id',
+            'status',
+            'num',
+            'draw',
+            'pos',
+            'is_private',
+            'participants',
+            'representing',
+            'group__name',
+        )
+        panelists = Panelist.objects.filter(
+            round__session=session,
+        ).order_by(
+            'id',
+        ).values_list(
+            'id',
+            'status',
+            'kind',
+            'category',
+            'num',
+            'person__first_name',
+            'person__last_name',
+            'person__nick_name',
+            'person__district',
+        )
+        rounds = session.rounds.order_by(
+            'id',
+        ).values_list(
+            'id',
+            'status',
+            'kind',
+            'num',
+            'spots',
+            'date',
+            'footnotes',
+        )
+        outcomes = Outcome.objects.filter(
+            round__session=session,
+        ).order_by(
+            'id',
+        ).values_list(
+            'id',
+            'num',
+            'name',
+            'award__name',
+        )
+        statelogs = self.statelogs.order_by(
+            '-timestamp',
+        ).values_list(
+            'timestamp',
+            'by',
+        )[:1]
+        convention = [(
+            session.kind,
+            session.convention.name,
+            session.convention.location,
+            session.convention.district,
+        )]
+        return [
+            scores,
+            songs,
+            appearances,
+            panelists,
+            rounds,
+            outcomes,
+            contenders,
+            statelogs,
+            convention,
+        ]
+
+    def get_fingerprint(self, template, obj=None):
+        """
+        Fingerprint a report on `obj` (default the round) in this round.
+
+        Hashing the sources takes a handful of session-wide queries, so the
+        result is kept under the generations every source row bumps: the
+        convention's, for the session's own rows, and bhs and cmanager, for
+        groups, charts, people and awards.  Any write to those, or a change
+        to the templates, moves the key on.
+        """
+        obj = obj or self
+        scopes = [
+            'bhs',
+            'cmanager',
+            'convention_{0}'.format(self.session.convention_id),
+        ]
+        generations = Generation().get(scopes)
+        key = 'report_fingerprint_{0}_{1}_{2}_{3}'.format(
+            get_template_digest(template),
+            obj._meta.label_lower,
+            obj.pk,
+            '_'.join(str(count) for count, modified in generations),
+        )
+        value = cache.get(key)
+        if value is None:
+            value = fingerprint(
+                template,
+                [(obj._meta.label_lower, obj.pk)],
+                *self.get_report_sources()
+            )
+            cache.set(key, value, REPORT_FINGERPRINT_TIMEOUT)
+        return value
+
+    def get_oss_context(self, cube=None):
+        """Build the OSS context with a fixed number of queries."""
         Group = apps.get_model('bhs.group')
         Panelist = apps.get_model('rmanager.panelist')
         Appearance = apps.get_model('rmanager.appearance')
+        AppearanceAggregate = apps.get_model('rmanager.appearanceaggregate')
+        Contender = apps.get_model('rmanager.contender')
         Song = apps.get_model('rmanager.song')
+        SongAggregate = apps.get_model('rmanager.songaggregate')
 
         # Score Block
         group_ids = self.appearances.filter(
@@ -1992,13 +2026,11 @@ class Round(TimeStampedModel):
             # Don't include mic testers on OSS
             num__lte=0,
         ).values_list('group__id', flat=True)
+        group_ids = list(group_ids)
         groups = Group.objects.filter(
             id__in=group_ids,
-        ).prefetch_related(
-            'appearances',
-            'appearances__songs__scores',
-            'appearances__songs__scores__panelist',
-            'appearances__round__session',
+        ).select_related(
+            'parent',
         ).annotate(
             max_round=Max(
                 'appearances__round__num',
@@ -2007,201 +2039,83 @@ class Round(TimeStampedModel):
                     appearances__round__session=self.session,
                 ),
             ),
-            tot_points=Sum(
-                'appearances__songs__scores__points',
-                filter=Q(
-                    appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                    appearances__round__session=self.session,
-                    appearances__round__num__lte=self.num,
-                ),
-            ),
-            sng_points=Sum(
-                'appearances__songs__scores__points',
-                filter=Q(
-                    appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                    appearances__songs__scores__panelist__category=Panelist.CATEGORY.singing,
-                    appearances__round__session=self.session,
-                    appearances__round__num__lte=self.num,
-                ),
-            ),
-            per_points=Sum(
-                'appearances__songs__scores__points',
-                filter=Q(
-                    appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                    appearances__songs__scores__panelist__category=Panelist.CATEGORY.performance,
-                    appearances__round__session=self.session,
-                    appearances__round__num__lte=self.num,
-                ),
-            ),
-            mus_points=Sum(
-                'appearances__songs__scores__points',
-                filter=Q(
-                    appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                    appearances__songs__scores__panelist__category=Panelist.CATEGORY.music,
-                    appearances__round__session=self.session,
-                    appearances__round__num__lte=self.num,
-                ),
-            ),
-            tot_score=Avg(
-                'appearances__songs__scores__points',
-                filter=Q(
-                    appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                    appearances__round__session=self.session,
-                    appearances__round__num__lte=self.num,
-                ),
-            ),
-            mus_score=Avg(
-                'appearances__songs__scores__points',
-                filter=Q(
-                    appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                    appearances__songs__scores__panelist__category=Panelist.CATEGORY.music,
-                    appearances__round__session=self.session,
-                    appearances__round__num__lte=self.num,
-                ),
-            ),
-            per_score=Avg(
-                'appearances__songs__scores__points',
-                filter=Q(
-                    appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                    appearances__songs__scores__panelist__category=Panelist.CATEGORY.performance,
-                    appearances__round__session=self.session,
-                    appearances__round__num__lte=self.num,
-                ),
-            ),
-            sng_score=Avg(
-                'appearances__songs__scores__points',
-                filter=Q(
-                    appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                    appearances__songs__scores__panelist__category=Panelist.CATEGORY.singing,
-                    appearances__round__session=self.session,
-                    appearances__round__num__lte=self.num,
-                ),
-            ),
-            tot_rank=Window(
-                expression=RowNumber(),
-                order_by=(
-                    F('tot_points').desc(),
-                    F('sng_points').desc(),
-                    F('per_points').desc(),
-                )
-            ),
-        ).order_by(
-            '-tot_points',
-            '-sng_points',
-            '-per_points',
         )
 
-        # Monkeypatching
-        for group in groups:
-            group.tot_rank = group.tot_rank + self.spots
-            appearances = group.appearances.filter(
-                num__gt=0,
-                round__session=self.session,
-                round__num__lte=self.num,
-            ).prefetch_related(
-                'songs__scores',
-                'songs__scores__panelist',
-            ).order_by(
-                'round__kind',
-            ).annotate(
-                tot_points=Sum(
-                    'songs__scores__points',
-                    filter=Q(
-                        songs__scores__panelist__kind=Panelist.KIND.official,
-                    ),
-                ),
-                tot_score=Avg(
-                    'songs__scores__points',
-                    filter=Q(
-                        songs__scores__panelist__kind=Panelist.KIND.official,
-                    ),
-                ),
-                mus_score=Avg(
-                    'songs__scores__points',
-                    filter=Q(
-                        songs__scores__panelist__kind=Panelist.KIND.official,
-                        songs__scores__panelist__category=Panelist.CATEGORY.music,
-                    ),
-                ),
-                per_score=Avg(
-                    'songs__scores__points',
-                    filter=Q(
-                        songs__scores__panelist__kind=Panelist.KIND.official,
-                        songs__scores__panelist__category=Panelist.CATEGORY.performance,
-                    ),
-                ),
-                sng_score=Avg(
-                    'songs__scores__points',
-                    filter=Q(
-                        songs__scores__panelist__kind=Panelist.KIND.official,
-                        songs__scores__panelist__category=Panelist.CATEGORY.singing,
-                    ),
-                ),
-            )
-            for appearance in appearances:
-                songs = appearance.songs.prefetch_related(
-                    'scores',
-                    'scores__panelist',
-                ).order_by(
-                    'num',
-                ).annotate(
-                    tot_score=Avg(
-                        'scores__points',
-                        filter=Q(
-                            scores__panelist__kind=Panelist.KIND.official,
-                        ),
-                    ),
-                    mus_score=Avg(
-                        'scores__points',
-                        filter=Q(
-                            scores__panelist__kind=Panelist.KIND.official,
-                            scores__panelist__category=Panelist.CATEGORY.music,
-                        ),
-                    ),
-                    per_score=Avg(
-                        'scores__points',
-                        filter=Q(
-                            scores__panelist__kind=Panelist.KIND.official,
-                            scores__panelist__category=Panelist.CATEGORY.performance,
-                        ),
-                    ),
-                    sng_score=Avg(
-                        'scores__points',
-                        filter=Q(
-                            scores__panelist__kind=Panelist.KIND.official,
-                            scores__panelist__category=Panelist.CATEGORY.singing,
-                        ),
-                    ),
-                )
-                for song in songs:
-                    penalties_map = {
-                        10: "†",
-                        30: "‡",
-                        40: "✠",
-                        50: "✶",
-                    }
-                    items = " ".join([penalties_map[x] for x in song.penalties])
-                    song.penalties_patched = items
-                appearance.songs_patched = songs
-            recent = appearances.get(round__num=self.num)
-            contesting = recent.contenders.order_by(
-                'outcome__num',
-            ).values_list(
-                'outcome__num',
-                flat=True
-            )
-            group.contesting_patched = ", ".join([str(x) for x in contesting])
-            group.pos_patched = recent.pos
-            group.representing_patched = recent.representing
-            group.participants_patched = recent.participants
-            group.appearances_patched = appearances
+        # Rank from the session cube
+        if cube is None:
+            cube = SessionScoreCube(self.session)
+        totals = cube.get_totals(num=self.num)
+        groups = {group.id: group for group in groups}
+        ranking = cube.get_ranking(groups.keys(), num=self.num)
+        groups = [groups[x] for x in ranking]
 
+        # All appearances, songs and contenders for the groups, at once.
+        appearances = Appearance.objects.filter(
+            group__id__in=group_ids,
+            num__gt=0,
+            round__session=self.session,
+            round__num__lte=self.num,
+        ).select_related(
+            'round',
+        ).order_by(
+            'round__kind',
+        ).annotate(
+            **AppearanceAggregate.get_columns('aggregate')
+        )
+        appearances = list(appearances)
+        songs = Song.objects.filter(
+            appearance__in=appearances,
+        ).select_related(
+            'chart',
+        ).order_by(
+            'num',
+        ).annotate(
+            **SongAggregate.get_columns('aggregate')
+        )
+        penalties_map = {
+            10: "†",
+            30: "‡",
+            40: "✠",
+            50: "✶",
+        }
+        songs_map = {}
+        for song in songs:
+            song.penalties_patched = " ".join([penalties_map[x] for x in song.penalties])
+            songs_map.setdefault(song.appearance_id, []).append(song)
+        appearances_map = {}
+        recents = {}
+        for appearance in appearances:
+            appearance.songs_patched = songs_map.get(appearance.id, [])
+            appearances_map.setdefault(appearance.group_id, []).append(appearance)
+            if appearance.round.num == self.num:
+                recents[appearance.group_id] = appearance
+        contenders = Contender.objects.filter(
+            appearance__in=recents.values(),
+        ).order_by(
+            'outcome__num',
+        ).values_list(
+            'appearance',
+            'outcome__num',
+        )
+        contesting = {}
+        for appearance_id, num in contenders:
+            contesting.setdefault(appearance_id, []).append(str(num))
+
+        # Monkeypatching
+        for i, group in enumerate(groups):
+            for key, value in totals.get(group.id, {}).items():
+                setattr(group, key, value)
+            group.tot_rank = i + 1 + self.spots
+            group.appearances_patched = appearances_map.get(group.id, [])
+            recent = recents.get(group.id)
+            if recent:
+                group.contesting_patched = ", ".join(contesting.get(recent.id, []))
+                group.pos_patched = recent.pos
+                group.representing_patched = recent.representing
+                group.participants_patched = recent.participants
 
         # Penalties Block
-        array = Song.objects.select_related(
-            'appearance__round',
-            'appearance__group',
-        ).filter(
+        array = Song.objects.filter(
             appearance__round__session=self.session,
             appearance__round__num__lte=self.num,
             penalties__len__gt=0,
@@ -2217,15 +2131,14 @@ class Round(TimeStampedModel):
 
         # Missing flag
         # use group_ids - these are the completeds
-        is_missing = bool(Song.objects.filter(
+        is_missing = Song.objects.filter(
             appearance__round__session=self.session,
             chart__isnull=True,
             appearance__group__id__in=group_ids,
-        ))
+        ).exists()
+
         # Eval Only Block
-        privates = self.appearances.prefetch_related(
-            'group',
-        ).filter(
+        privates = self.appearances.filter(
             is_private=True,
         ).order_by(
             'group__name',
@@ -2233,9 +2146,7 @@ class Round(TimeStampedModel):
         privates = list(privates)
 
         # Disqualification Block
-        disqualifications = self.appearances.prefetch_related(
-            'group',
-        ).filter(
+        disqualifications = self.appearances.filter(
             status=Appearance.STATUS.disqualified,
         ).order_by(
             'group__name',
@@ -2244,25 +2155,18 @@ class Round(TimeStampedModel):
 
         # Draw Block
         if self.kind != self.KIND.finals:
-            # Get advancers
-            advancers = self.appearances.filter(
-                draw__gt=0,
-            ).select_related(
-                'group',
+            # Get advancers, with the mic tester (draw 0) last
+            draws = self.appearances.filter(
+                draw__gte=0,
             ).order_by(
                 'draw',
             ).values_list(
                 'draw',
                 'group__name',
             )
-            advancers = list(advancers)
-            try:
-                mt = self.appearances.get(
-                    draw=0,
-                ).group.name
-                advancers.append(('MT', mt))
-            except self.appearances.model.DoesNotExist:
-                pass
+            draws = list(draws)
+            advancers = [x for x in draws if x[0] > 0]
+            advancers.extend(('MT', x[1]) for x in draws if x[0] == 0)
         else:
             advancers = None
 
@@ -2281,30 +2185,21 @@ class Round(TimeStampedModel):
             40: 'PER',
             50: 'SNG',
         }
+        sections = {}
+        for x in panelists_raw:
+            try:
+                person = "{0} {1}".format(
+                    x.person.common_name,
+                    x.person.district,
+                )
+            except AttributeError:
+                person = "(Unknown)"
+            sections.setdefault(x.category, []).append(person)
         panelists = []
         for key, value in categories_map.items():
-            sections = panelists_raw.filter(
-                category=key,
-            ).select_related(
-                'person',
-            ).order_by(
-                'num',
-            )
-            persons = []
-            for x in sections:
-                try:
-                    persons.append(
-                        "{0} {1}".format(
-                            x.person.common_name,
-                            x.person.district,
-                        )
-                    )
-                except AttributeError:
-                    persons.append("(Unknown)")
-            names = ", ".join(persons)
+            names = ", ".join(sections.get(key, []))
             panelists.append((value, names))
 
-
         # Outcome Block
         items = self.outcomes.select_related(
             'award',
@@ -2335,7 +2230,11 @@ class Round(TimeStampedModel):
             'outcomes': outcomes,
             'is_missing': is_missing,
         }
-        rendered = render_to_string('reports/oss.html', context)
+        return context
+
+    def get_oss_report(self, zoom=1, cube=None):
+        context = self.get_oss_context(cube=cube)
+        groups = context['groups']
 
         if self.session.convention.district == 'BHS':
             if self.session.convention.name == 'International Youth Convention':
@@ -2346,18 +2245,18 @@ class Round(TimeStampedModel):
                 page_size = 'Letter'
         else:
             if self.session.rounds.count() == 1:
-                if groups.count() <= 15:
+                if len(groups) <= 15:
                     page_size = 'Letter'
                 else:
                     page_size = 'Legal'
             else:
                 if self.kind == self.KIND.finals:
-                    if groups.count() >= 8:
+                    if len(groups) >= 8:
                         page_size = 'Legal'
                     else:
                         page_size = 'Letter'
                 elif self.kind == self.KIND.semis:
-                    if groups.count() >= 8:
+                    if len(groups) >= 8:
                         page_size = 'Legal'
                     else:
                         page_size = 'Letter'
@@ -2371,51 +2270,45 @@ class Round(TimeStampedModel):
             )
         except StateLog.DoesNotExist:
             footer = '(Unknown)'
-        file = pydf.generate_pdf(
-            rendered,
-            page_size=page_size,
-            orientation='Portrait',
-            margin_top='5mm',
-            margin_bottom='5mm',
-            footer_right=footer,
-            footer_font_name='Encode Sans',
-            footer_font_size=6,
-            zoom=zoom,
-        )
-        content = ContentFile(file)
+        options = {
+            'page_size': page_size,
+            'orientation': 'Portrait',
+            'margin_top': '5mm',
+            'margin_bottom': '5mm',
+            'footer_right': footer,
+            'footer_font_name': 'Encode Sans',
+            'footer_font_size': 6,
+            'zoom': zoom,
+        }
+        return Report('reports/oss.html', context, options)
+
+    def get_oss(self, zoom=1, cube=None, fit_one_page=True):
+        report = self.get_oss_report(zoom=zoom, cube=cube)
+        if not fit_one_page:
+            return render_pdf(report)
+        # The zoom that fit this version of the round is reused as-is; one
+        # that fit an earlier version only narrows the search.
+        key = 'oss_fit_{0}'.format(self.id)
+        current = self.get_fingerprint('reports/oss.html')
+        last = cache.get(key) or {}
+        if last.get('fingerprint') == current:
+            options = dict(report.options, zoom=last['zoom'])
+            return render_pdf(report._replace(options=options))
+        content, zoom = fit_pdf(report, zoom=last.get('zoom'))
+        cache.set(key, {'fingerprint': current, 'zoom': zoom}, timeout=None)
         return content
 
 
-    # Placeholder for single-page recursion tool.
-    # from builtins import round as rnd
-    # from PyPDF2 import PdfFileReader
-
-    # r = Round.objects.get(id='0c02d601-357b-4315-9b73-063f563aa410')
-
-    # f = r.get_oss()
-    # obj = PdfFileReader(f)
-    # num_pages = obj.getNumPages()
-
-    # zoom = 1
-    # while num_pages > 1:
-    #     zoom = rnd((zoom - .05),2)
-    #     print(zoom)
-    #     f = r.get_oss(zoom=zoom)
-    #     obj = PdfFileReader(f)
-    #     num_pages = obj.getNumPages()
-    # print(type(f))
-
-    # r.oss.save('oss', f)
-
-
     def save_oss(self):
         oss = self.get_oss()
         return self.oss.save('oss', oss)
 
-    def get_sa(self):
+    def get_sa_report(self, cube=None):
         Appearance = apps.get_model('rmanager.appearance')
+        AppearanceAggregate = apps.get_model('rmanager.appearanceaggregate')
         Panelist = apps.get_model('rmanager.panelist')
         Song = apps.get_model('rmanager.song')
+        SongAggregate = apps.get_model('rmanager.songaggregate')
         Group = apps.get_model('bhs.group')
         Person = apps.get_model('bhs.person')
 
@@ -2437,103 +2330,20 @@ class Round(TimeStampedModel):
             'appearances__round__session',
         ).filter(
             id__in=group_ids,
-        ).annotate(
-            tot_points=Sum(
-                'appearances__songs__scores__points',
-                filter=Q(
-                    appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                    appearances__round__session=self.session,
-                    appearances__round__num__lte=self.num,
-                ),
-            ),
-            mus_points=Sum(
-                'appearances__songs__scores__points',
-                filter=Q(
-                    appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                    appearances__songs__scores__panelist__category=Panelist.CATEGORY.music,
-                    appearances__round__session=self.session,
-                    appearances__round__num__lte=self.num,
-                ),
-            ),
-            per_points=Sum(
-                'appearances__songs__scores__points',
-                filter=Q(
-                    appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                    appearances__songs__scores__panelist__category=Panelist.CATEGORY.performance,
-                    appearances__round__session=self.session,
-                    appearances__round__num__lte=self.num,
-                ),
-            ),
-            sng_points=Sum(
-                'appearances__songs__scores__points',
-                filter=Q(
-                    appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                    appearances__songs__scores__panelist__category=Panelist.CATEGORY.singing,
-                    appearances__round__session=self.session,
-                    appearances__round__num__lte=self.num,
-                ),
-            ),
-            tot_score=Avg(
-                'appearances__songs__scores__points',
-                filter=Q(
-                    appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                    appearances__round__session=self.session,
-                    appearances__round__num__lte=self.num,
-                ),
-            ),
-            mus_score=Avg(
-                'appearances__songs__scores__points',
-                filter=Q(
-                    appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                    appearances__songs__scores__panelist__category=Panelist.CATEGORY.music,
-                    appearances__round__session=self.session,
-                    appearances__round__num__lte=self.num,
-                ),
-            ),
-            per_score=Avg(
-                'appearances__songs__scores__points',
-                filter=Q(
-                    appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                    appearances__songs__scores__panelist__category=Panelist.CATEGORY.performance,
-                    appearances__round__session=self.session,
-                    appearances__round__num__lte=self.num,
-                ),
-            ),
-            sng_score=Avg(
-                'appearances__songs__scores__points',
-                filter=Q(
-                    appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                    appearances__songs__scores__panelist__category=Panelist.CATEGORY.singing,
-                    appearances__round__session=self.session,
-                    appearances__round__num__lte=self.num,
-                ),
-            ),
-            tot_rank=Window(
-                expression=RowNumber(),
-                order_by=(
-                    F('tot_points').desc(),
-                    F('sng_points').desc(),
-                    F('per_points').desc(),
-                )
-            ),
-            mus_rank=Window(
-                expression=Rank(),
-                order_by=F('mus_points').desc(),
-            ),
-            per_rank=Window(
-                expression=Rank(),
-                order_by=F('per_points').desc(),
-            ),
-            sng_rank=Window(
-                expression=Rank(),
-                order_by=F('sng_points').desc(),
-            ),
-        ).order_by(
-            '-tot_points',
-            '-sng_points',
-            '-per_points',
         )
 
+        # Rank from the session cube
+        if cube is None:
+            cube = SessionScoreCube(self.session)
+        totals = cube.get_totals(num=self.num)
+        groups = {group.id: group for group in groups}
+        ranking = cube.get_ranking(groups.keys(), num=self.num)
+        ranks = {
+            prefix: cube.get_ranks(prefix, groups.keys(), num=self.num)
+            for prefix in ['mus', 'per', 'sng']
+        }
+        groups = [groups[x] for x in ranking]
+
         persons = Person.objects.filter(
             panelists__round__session=self.session,
             panelists__category__gt=10,
@@ -2577,7 +2387,13 @@ class Round(TimeStampedModel):
             sng_persons.append((p.common_name, practice, p.initials))
 
         # Monkeypatching
-        for group in groups:
+        for i, group in enumerate(groups):
+            for key, value in totals.get(group.id, {}).items():
+                setattr(group, key, value)
+            group.tot_rank = i + 1
+            group.mus_rank = ranks['mus'][group.id]
+            group.per_rank = ranks['per'][group.id]
+            group.sng_rank = ranks['sng'][group.id]
             # Populate the group block
             appearances = group.appearances.filter(
                 round__session=self.session,
@@ -2586,53 +2402,7 @@ class Round(TimeStampedModel):
                 'songs__scores',
                 'songs__scores__panelist',
             ).annotate(
-                tot_points=Sum(
-                    'songs__scores__points',
-                    filter=Q(
-                        songs__scores__panelist__kind=Panelist.KIND.official,
-                    ),
-                ),
-                sng_points=Sum(
-                    'songs__scores__points',
-                    filter=Q(
-                        songs__scores__panelist__kind=Panelist.KIND.official,
-                        songs__scores__panelist__category=Panelist.CATEGORY.singing,
-                    ),
-                ),
-                per_points=Sum(
-                    'songs__scores__points',
-                    filter=Q(
-                        songs__scores__panelist__kind=Panelist.KIND.official,
-                        songs__scores__panelist__category=Panelist.CATEGORY.performance,
-                    ),
-                ),
-                tot_score=Avg(
-                    'songs__scores__points',
-                    filter=Q(
-                        songs__scores__panelist__kind=Panelist.KIND.official,
-                    ),
-                ),
-                mus_score=Avg(
-                    'songs__scores__points',
-                    filter=Q(
-                        songs__scores__panelist__kind=Panelist.KIND.official,
-                        songs__scores__panelist__category=Panelist.CATEGORY.music,
-                    ),
-                ),
-                per_score=Avg(
-                    'songs__scores__points',
-                    filter=Q(
-                        songs__scores__panelist__kind=Panelist.KIND.official,
-                        songs__scores__panelist__category=Panelist.CATEGORY.performance,
-                    ),
-                ),
-                sng_score=Avg(
-                    'songs__scores__points',
-                    filter=Q(
-                        songs__scores__panelist__kind=Panelist.KIND.official,
-                        songs__scores__panelist__category=Panelist.CATEGORY.singing,
-                    ),
-                ),
+                **AppearanceAggregate.get_columns('aggregate')
             ).order_by(
                 'round__kind',
             )
@@ -2643,60 +2413,7 @@ class Round(TimeStampedModel):
                 ).order_by(
                     'num',
                 ).annotate(
-                    tot_score=Avg(
-                        'scores__points',
-                        filter=Q(
-                            scores__panelist__kind=Panelist.KIND.official,
-                        ),
-                    ),
-                    mus_score=Avg(
-                        'scores__points',
-                        filter=Q(
-                            scores__panelist__kind=Panelist.KIND.official,
-                            scores__panelist__category=Panelist.CATEGORY.music,
-                        ),
-                    ),
-                    per_score=Avg(
-                        'scores__points',
-                        filter=Q(
-                            scores__panelist__kind=Panelist.KIND.official,
-                            scores__panelist__category=Panelist.CATEGORY.performance,
-                        ),
-                    ),
-                    sng_score=Avg(
-                        'scores__points',
-                        filter=Q(
-                            scores__panelist__kind=Panelist.KIND.official,
-                            scores__panelist__category=Panelist.CATEGORY.singing,
-                        ),
-                    ),
-                    tot_dev=StdDev(
-                        'scores__points',
-                        filter=Q(
-                            scores__panelist__kind=Panelist.KIND.official,
-                        ),
-                    ),
-                    mus_dev=StdDev(
-                        'scores__points',
-                        filter=Q(
-                            scores__panelist__kind=Panelist.KIND.official,
-                            scores__panelist__category=Panelist.CATEGORY.music,
-                        ),
-                    ),
-                    per_dev=StdDev(
-                        'scores__points',
-                        filter=Q(
-                            scores__panelist__kind=Panelist.KIND.official,
-                            scores__panelist__category=Panelist.CATEGORY.performance,
-                        ),
-                    ),
-                    sng_dev=StdDev(
-                        'scores__points',
-                        filter=Q(
-                            scores__panelist__kind=Panelist.KIND.official,
-                            scores__panelist__category=Panelist.CATEGORY.singing,
-                        ),
-                    ),
+                    **SongAggregate.get_columns('aggregate')
                 )
                 for song in songs:
                     penalties_map = {
@@ -2763,47 +2480,7 @@ class Round(TimeStampedModel):
             group.appearances_patched = appearances
 
         # Build stats
-        stats = Song.objects.select_related(
-            'appearance__round',
-        ).prefetch_related(
-            'scores__panelist__kind',
-        ).filter(
-            appearance__round__session=self.session,
-            appearance__round__num__lte=self.num,
-        ).annotate(
-            tot_dev=StdDev(
-                'scores__points',
-                filter=Q(
-                    scores__panelist__kind=Panelist.KIND.official,
-                ),
-            ),
-            mus_dev=StdDev(
-                'scores__points',
-                filter=Q(
-                    scores__panelist__kind=Panelist.KIND.official,
-                    scores__panelist__category=Panelist.CATEGORY.music,
-                ),
-            ),
-            per_dev=StdDev(
-                'scores__points',
-                filter=Q(
-                    scores__panelist__kind=Panelist.KIND.official,
-                    scores__panelist__category=Panelist.CATEGORY.performance,
-                ),
-            ),
-            sng_dev=StdDev(
-                'scores__points',
-                filter=Q(
-                    scores__panelist__kind=Panelist.KIND.official,
-                    scores__panelist__category=Panelist.CATEGORY.singing,
-                ),
-            ),
-        ).aggregate(
-            tot=Avg('tot_dev'),
-            mus=Avg('mus_dev'),
-            per=Avg('per_dev'),
-            sng=Avg('sng_dev'),
-        )
+        stats = cube.get_stats(num=self.num)
 
         # Penalties Block
         array = Song.objects.select_related(
@@ -2832,42 +2509,34 @@ class Round(TimeStampedModel):
             'stats': stats,
             'penalties': penalties,
         }
-        rendered = render_to_string('reports/sa.html', context)
         statelog = self.statelogs.latest('timestamp')
         footer = 'Published by {0} at {1}'.format(
             statelog.by,
             statelog.timestamp.strftime("%Y-%m-%d %H:%M:%S %Z"),
         )
-        file = pydf.generate_pdf(
-            rendered,
-            page_size='Letter',
-            orientation='Landscape',
-            margin_top='5mm',
-            margin_bottom='5mm',
-            footer_right=footer,
-            footer_font_name='Encode Sans',
-            footer_font_size=6,
-        )
-        content = ContentFile(file)
-        return content
+        options = {
+            'page_size': 'Letter',
+            'orientation': 'Landscape',
+            'margin_top': '5mm',
+            'margin_bottom': '5mm',
+            'footer_right': footer,
+            'footer_font_name': 'Encode Sans',
+            'footer_font_size': 6,
+        }
+        return Report('reports/sa.html', context, options)
+
+    def get_sa(self, cube=None):
+        return render_pdf(self.get_sa_report(cube=cube))
 
     def save_sa(self):
         sa = self.get_sa()
         return self.sa.save('sa', sa)
 
-    def save_reports(self):
-        oss = self.get_oss()
-        self.oss.save('oss', oss, save=False)
-        sa = self.get_sa()
-        self.sa.save('sa', sa, save=False)
-        return self.save()
-
-
     def get_legacy_oss(self):
         Panelist = apps.get_model('rmanager.panelist')
         Appearance = apps.get_model('rmanager.appearance')
+        AppearanceAggregate = apps.get_model('rmanager.appearanceaggregate')
         Song = apps.get_model('rmanager.song')
-        Score = apps.get_model('rmanager.score')
 
         # Get the Groups
         group_ids = self.appearances.filter(
@@ -2900,12 +2569,7 @@ class Round(TimeStampedModel):
                 'songs__scores',
                 'songs__scores__panelist',
             ).annotate(
-                sub_points=Sum(
-                    'songs__scores__points',
-                    filter=Q(
-                        songs__scores__panelist__kind=Panelist.KIND.official,
-                    ),
-                ),
+                sub_points=F('aggregate__tot_points'),
             )
             for appearance in appearances:
                 if appearance.round.num == 1:
@@ -2917,33 +2581,10 @@ class Round(TimeStampedModel):
                 ).order_by(
                     'num',
                 ).annotate(
-                    tot_score=Avg(
-                        'scores__points',
-                        filter=Q(
-                            scores__panelist__kind=Panelist.KIND.official,
-                        ),
-                    ),
-                    mus_points=Sum(
-                        'scores__points',
-                        filter=Q(
-                            scores__panelist__kind=Panelist.KIND.official,
-                            scores__panelist__category=Panelist.CATEGORY.music,
-                        ),
-                    ),
-                    per_points=Sum(
-                        'scores__points',
-                        filter=Q(
-                            scores__panelist__kind=Panelist.KIND.official,
-                            scores__panelist__category=Panelist.CATEGORY.performance,
-                        ),
-                    ),
-                    sng_points=Sum(
-                        'scores__points',
-                        filter=Q(
-                            scores__panelist__kind=Panelist.KIND.official,
-                            scores__panelist__category=Panelist.CATEGORY.singing,
-                        ),
-                    ),
+                    tot_score=F('aggregate__tot_score'),
+                    mus_points=F('aggregate__mus_points'),
+                    per_points=F('aggregate__per_points'),
+                    sng_points=F('aggregate__sng_points'),
                 )
                 for song in songs:
                     penalties_map = {
@@ -2958,26 +2599,23 @@ class Round(TimeStampedModel):
                     'outcome__num',
                 ).values_list('outcome__num', flat=True)
                 appearance.contesting = ", ".join([str(x) for x in contesting])
-                tot_score = Score.objects.filter(
-                    song__appearance__round__session=self.session,
-                    song__appearance__round__num__lte=round.num,
-                    song__appearance__group=appearance.group,
-                    panelist__kind=Panelist.KIND.official,
-                ).aggregate(tot_score=Avg('points'))['tot_score']
-                appearance.tot_score = tot_score
-                tot_points = Score.objects.filter(
-                    song__appearance__round__session=self.session,
-                    song__appearance__round__num__lte=round.num,
-                    song__appearance__group=appearance.group,
-                    panelist__kind=Panelist.KIND.official,
-                ).aggregate(tot_points=Sum('points'))['tot_points']
+                totals = AppearanceAggregate.objects.filter(
+                    appearance__round__session=self.session,
+                    appearance__round__num__lte=round.num,
+                    appearance__group=appearance.group,
+                ).aggregate(
+                    tot_points=Sum('tot_points'),
+                    tot_count=Sum('tot_count'),
+                )
+                tot_points = totals['tot_points']
+                tot_count = totals['tot_count']
+                appearance.tot_score = tot_points / tot_count if tot_count else None
                 appearance.tot_points = tot_points if tot_points else 0
-                prev_points = Score.objects.filter(
-                    song__appearance__round__session=self.session,
-                    song__appearance__round__num=round.num - 1,
-                    song__appearance__group=appearance.group,
-                    panelist__kind=Panelist.KIND.official,
-                ).aggregate(prev_points=Sum('points'))['prev_points']
+                prev_points = AppearanceAggregate.objects.filter(
+                    appearance__round__session=self.session,
+                    appearance__round__num=round.num - 1,
+                    appearance__group=appearance.group,
+                ).aggregate(prev_points=Sum('tot_points'))['prev_points']
                 appearance.prev_points = prev_points
                 appearance.songs_patched = songs
             appearances = sorted(appearances, reverse=True, key=lambda t: t.tot_points)
@@ -3193,7 +2831,6 @@ class Round(TimeStampedModel):
         return content
 
     def get_announcements(self):
-        Panelist = apps.get_model('rmanager.panelist')
         Group = apps.get_model('bhs.group')
         Appearance = apps.get_model('rmanager.appearance')
         appearances = self.appearances.filter(
@@ -3221,51 +2858,19 @@ class Round(TimeStampedModel):
                 'appearances__songs__scores__panelist',
                 'appearances__round__session',
             ).annotate(
-                tot_points=Sum(
-                    'appearances__songs__scores__points',
-                    filter=Q(
-                        appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                        appearances__round__session=self.session,
-                        appearances__round__num__lte=self.num,
-                    ),
-                ),
-                sng_points=Sum(
-                    'appearances__songs__scores__points',
-                    filter=Q(
-                        appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                        appearances__songs__scores__panelist__category=Panelist.CATEGORY.singing,
-                        appearances__round__session=self.session,
-                        appearances__round__num__lte=self.num,
-                    ),
-                ),
-                per_points=Sum(
-                    'appearances__songs__scores__points',
-                    filter=Q(
-                        appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                        appearances__songs__scores__panelist__category=Panelist.CATEGORY.performance,
-                        appearances__round__session=self.session,
-                        appearances__round__num__lte=self.num,
-                    ),
-                ),
-                raw_score=Avg(
-                    'appearances__songs__scores__points',
-                    filter=Q(
-                        appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                        appearances__round__session=self.session,
-                        appearances__round__num__lte=self.num,
-                    ),
-                ),
-                tot_score=Func(
-                    F('raw_score'),
-                    function='ROUND',
-                    template='%(function)s(%(expressions)s, 1)'
+                **ScoreAggregate.get_sums(
+                    'appearances__aggregate',
+                    appearances__round__session=self.session,
+                    appearances__round__num__lte=self.num,
                 ),
             ).order_by(
                 'tot_points',
                 'sng_points',
                 'per_points',
             )
-            groups = list(groups)[-5:]
+            groups = [ScoreAggregate.patch_scores(x) for x in groups][-5:]
+            for group in groups:
+                group.tot_score = round(group.tot_score, 1) if group.tot_score is not None else None
         else:
             groups = None
         pos = self.appearances.aggregate(sum=Sum('pos'))['sum']
@@ -3373,16 +2978,103 @@ class Round(TimeStampedModel):
         ).exclude(
             status=Appearance.STATUS.scratched,
         )
+        appearances = list(appearances)
         for appearance in appearances:
-            appearance.mock()
+            appearance.mock_scores()
+        # Check variance for the whole round at once.
+        engine = VarianceEngine(self)
+        for appearance in appearances:
+            appearance.mock_transitions(engine=engine)
             appearance.save()
         return
 
+    def provision(self, by=None):
+        """
+        Build the score sheets of every new appearance in bulk.
+
+        Songs, scores and their empty aggregates are each written with one
+        bulk_create; the appearances move to built in a single UPDATE, with
+        the matching StateLog rows inserted alongside.  None of that sends
+        post_transition, so the feed entries and the generation bump it
+        would have triggered are made here.
+        """
+        Appearance = apps.get_model('rmanager.appearance')
+        AppearanceAggregate = apps.get_model('rmanager.appearanceaggregate')
+        Panelist = apps.get_model('rmanager.panelist')
+        Score = apps.get_model('rmanager.score')
+        Song = apps.get_model('rmanager.song')
+        SongAggregate = apps.get_model('rmanager.songaggregate')
+        with transaction.atomic():
+            appearances = self.appearances.select_for_update().filter(
+                status=Appearance.STATUS.new,
+            )
+            appearances = list(appearances)
+            if not appearances:
+                return []
+            appearance_ids = [x.id for x in appearances]
+            panelists = self.panelists.filter(
+                category__gt=Panelist.CATEGORY.ca,
+            )
+            panelists = list(panelists)
+            songs = []
+            scores = []
+            for appearance in appearances:
+                appearance_songs, appearance_scores = appearance.get_sheets(panelists)
+                songs.extend(appearance_songs)
+                scores.extend(appearance_scores)
+            Song.objects.bulk_create(songs)
+            Score.objects.bulk_create(scores, batch_size=1000)
+
+            # Bulk inserts skip the score signals, so seed the aggregates.
+            empty = SongAggregate.get_defaults({})
+            SongAggregate.objects.bulk_create([
+                SongAggregate(song=song, **empty) for song in songs
+            ])
+            existing = AppearanceAggregate.objects.filter(
+                appearance__in=appearance_ids,
+            ).values_list('appearance', flat=True)
+            existing = set(existing)
+            AppearanceAggregate.objects.bulk_create([
+                AppearanceAggregate(appearance_id=x, **empty)
+                for x in appearance_ids if x not in existing
+            ])
+
+            # Transition and log, as `Appearance.build` would one at a time.
+            Appearance.objects.filter(
+                id__in=appearance_ids,
+            ).update(
+                status=Appearance.STATUS.built,
+                modified=now(),
+            )
+            content_type = ContentType.objects.get_for_model(Appearance)
+            StateLog.objects.bulk_create([
+                StateLog(
+                    by=by,
+                    state=Appearance.STATUS.built,
+                    transition='build',
+                    content_type=content_type,
+                    object_id=x,
+                ) for x in appearance_ids
+            ])
+            round_id = self.id
+            transaction.on_commit(
+                lambda: RoundFeed(round_id).publish_many(
+                    [('appearance', x, None) for x in appearance_ids],
+                    status=Appearance.STATUS.built,
+                    transition='build',
+                )
+            )
+            scopes = get_scopes(self)
+            transaction.on_commit(
+                lambda: Generation().bump(scopes)
+            )
+        for appearance in appearances:
+            appearance.status = Appearance.STATUS.built
+        return appearances
 
     def get_publish_email(self):
         Appearance = apps.get_model('rmanager.appearance')
         Group = apps.get_model('bhs.group')
-        Panelist = apps.get_model('rmanager.panelist')
         group_ids = self.appearances.filter(
             is_private=False,
         ).exclude(
@@ -3400,39 +3092,10 @@ class Round(TimeStampedModel):
             'appearances__songs__scores__panelist',
             'appearances__round__session',
         ).annotate(
-            tot_points=Sum(
-                'appearances__songs__scores__points',
-                filter=Q(
-                    appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                    appearances__round__session=self.session,
-                    appearances__round__num__lte=self.num,
-                ),
-            ),
-            per_points=Sum(
-                'appearances__songs__scores__points',
-                filter=Q(
-                    appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                    appearances__songs__scores__panelist__category=Panelist.CATEGORY.performance,
-                    appearances__round__session=self.session,
-                    appearances__round__num__lte=self.num,
-                ),
-            ),
-            sng_points=Sum(
-                'appearances__songs__scores__points',
-                filter=Q(
-                    appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                    appearances__songs__scores__panelist__category=Panelist.CATEGORY.singing,
-                    appearances__round__session=self.session,
-                    appearances__round__num__lte=self.num,
-                ),
-            ),
-            tot_score=Avg(
-                'appearances__songs__scores__points',
-                filter=Q(
-                    appearances__songs__scores__panelist__kind=Panelist.KIND.official,
-                    appearances__round__session=self.session,
-                    appearances__round__num__lte=self.num,
-                ),
+            **ScoreAggregate.get_sums(
+                'appearances__aggregate',
+                appearances__round__session=self.session,
+                appearances__round__num__lte=self.num,
             ),
             tot_rank=Window(
                 expression=RowNumber(),
@@ -3449,6 +3112,7 @@ class Round(TimeStampedModel):
         )
         # Monkeypatch results
         for complete in completes:
+            ScoreAggregate.patch_scores(complete)
             complete.tot_rank = complete.tot_rank + self.spots
 
         # Draw Block
@@ -3592,10 +3256,7 @@ class Round(TimeStampedModel):
     @authenticated_users
     def has_write_permission(request):
         return any([
-            request.user.person.officers.filter(
-                office__lt=300,
-                status__gt=0,
-            ),
+            PermissionContext.for_request(request).has_office(below=300),
         ])
 
     @allow_staff_or_superuser
@@ -3603,11 +3264,7 @@ class Round(TimeStampedModel):
     def has_object_write_permission(self, request):
         return any([
             all([
-                self.session.convention.assignments.filter(
-                    person__user=request.user,
-                    status__gt=0,
-                    category=self.session.convention.assignments.model.CATEGORY.ca,
-                ),
+                PermissionContext.for_request(request).is_ca(self.session.convention_id),
                 self.status != self.STATUS.published,
             ]),
         ])
@@ -3664,233 +3321,240 @@ class Round(TimeStampedModel):
         conditions=[can_build],
     )
     def build(self, *args, **kwargs):
-        # Reset for indempodence
-        self.reset()
-
-        # Instantiate prior round
-        if self.num == 1:
-            prior_round = None
-        else:
-            prior_round = self.session.rounds.get(num=self.num - 1)
-
-        # Create Panelsists
+        # Builds the round set-wise: each model is written with one
+        # bulk_create, from maps preloaded up front.
+        Appearance = apps.get_model('rmanager.appearance')
         Assignment = apps.get_model('cmanager.assignment')
-        cas = self.session.convention.assignments.filter(
-            status=Assignment.STATUS.active,
-            kind__in=[
-                Assignment.KIND.official,
-                Assignment.KIND.practice,
-            ],
-            category=Assignment.CATEGORY.ca,
-        ).order_by(
-            'kind',
-            'category',
-            'person__last_name',
-            'person__nick_name',
-            'person__first_name',
-        )
-        for ca in cas:
-            self.panelists.create(
-                kind=ca.kind,
-                category=ca.category,
-                person=ca.person,
-            )
-        officials = self.session.convention.assignments.filter(
-            status=Assignment.STATUS.active,
-            kind=Assignment.KIND.official,
-            category__gt=Assignment.CATEGORY.ca,
-        ).order_by(
-            'kind',
-            'category',
-            'person__last_name',
-            'person__nick_name',
-            'person__first_name',
-        )
-        i = 0
-        for official in officials:
-            i += 1
-            self.panelists.create(
-                num=i,
-                kind=official.kind,
-                category=official.category,
-                person=official.person,
-            )
+        Contender = apps.get_model('rmanager.contender')
+        Contestant = apps.get_model('smanager.contestant')
+        Entry = apps.get_model('smanager.entry')
+        Grid = apps.get_model('stage.grid')
+        Outcome = apps.get_model('rmanager.outcome')
+        Panelist = apps.get_model('rmanager.panelist')
+        Visibility = apps.get_model('rmanager.visibility')
 
-        practices = self.session.convention.assignments.filter(
-            status=Assignment.STATUS.active,
-            kind=Assignment.KIND.practice,
-            category__gt=Assignment.CATEGORY.ca,
-        ).order_by(
-            'kind',
-            'category',
-            'person__last_name',
-            'person__nick_name',
-            'person__first_name',
-        )
-        p = 50
-        for practice in practices:
-            p += 1
-            self.panelists.create(
-                num=p,
-                kind=practice.kind,
-                category=practice.category,
-                person=practice.person,
-            )
+        with transaction.atomic():
+            # Reset for indempodence
+            self.reset()
 
-        # Create Outcomes
-        # Create from contests if no prior round
-        if not prior_round:
-            contests = self.session.contests.select_related(
-                'award',
-            ).filter(
-                status__gt=0,
-            ).annotate(
-                cnt=Count(
-                    'contestants',
-                    filter=Q(
-                        contestants__status=10,
-                    )
-                ),
-            ).exclude(
-                cnt=0,
+            # Instantiate prior round
+            if self.num == 1:
+                prior_round = None
+            else:
+                prior_round = self.session.rounds.get(num=self.num - 1)
+
+            # Create Panelsists
+            assignments = self.session.convention.assignments.filter(
+                status=Assignment.STATUS.active,
+                kind__in=[
+                    Assignment.KIND.official,
+                    Assignment.KIND.practice,
+                ],
             ).order_by(
-                'award__tree_sort',
+                'kind',
+                'category',
+                'person__last_name',
+                'person__nick_name',
+                'person__first_name',
             )
-            i = 0
-            for contest in contests:
-                i += 1
-                self.outcomes.create(
+            assignments = list(assignments)
+            cas = [
+                x for x in assignments
+                if x.category == Assignment.CATEGORY.ca
+            ]
+            officials = [
+                x for x in assignments
+                if x.kind == Assignment.KIND.official and x.category > Assignment.CATEGORY.ca
+            ]
+            practices = [
+                x for x in assignments
+                if x.kind == Assignment.KIND.practice and x.category > Assignment.CATEGORY.ca
+            ]
+            panelists = []
+            for ca in cas:
+                panelists.append(Panelist(
+                    round=self,
+                    kind=ca.kind,
+                    category=ca.category,
+                    person_id=ca.person_id,
+                ))
+            for i, official in enumerate(officials, start=1):
+                panelists.append(Panelist(
+                    round=self,
                     num=i,
-                    award=contest.award,
+                    kind=official.kind,
+                    category=official.category,
+                    person_id=official.person_id,
+                ))
+            for p, practice in enumerate(practices, start=51):
+                panelists.append(Panelist(
+                    round=self,
+                    num=p,
+                    kind=practice.kind,
+                    category=practice.category,
+                    person_id=practice.person_id,
+                ))
+            Panelist.objects.bulk_create(panelists)
+
+            # Create Outcomes
+            # Create from contests if no prior round
+            outcomes = []
+            if not prior_round:
+                contests = self.session.contests.filter(
+                    status__gt=0,
+                ).annotate(
+                    cnt=Count(
+                        'contestants',
+                        filter=Q(
+                            contestants__status=10,
+                        )
+                    ),
+                ).exclude(
+                    cnt=0,
+                ).order_by(
+                    'award__tree_sort',
                 )
-        else:
-            prior_outcomes = prior_round.outcomes.exclude(
-                award__is_single=True,
-            )
-            for prior_outcome in prior_outcomes:
-                new_outcome = self.outcomes.create(
-                    num=prior_outcome.num,
-                    award=prior_outcome.award,
+                for i, contest in enumerate(contests, start=1):
+                    outcomes.append(Outcome(
+                        round=self,
+                        num=i,
+                        award_id=contest.award_id,
+                    ))
+            else:
+                prior_outcomes = prior_round.outcomes.exclude(
+                    award__is_single=True,
+                )
+                for prior_outcome in prior_outcomes:
+                    outcomes.append(Outcome(
+                        round=self,
+                        num=prior_outcome.num,
+                        award_id=prior_outcome.award_id,
+                    ))
+            Outcome.objects.bulk_create(outcomes)
+            outcomes_by_award = {}
+            for outcome in outcomes:
+                outcomes_by_award.setdefault(outcome.award_id, []).append(outcome)
+
+            # Grids by draw
+            grids = dict(
+                Grid.objects.filter(
+                    round=self,
+                ).values_list(
+                    'num',
+                    'onstage',
                 )
-
-        # Create Appearances
-        Appearance = apps.get_model('rmanager.appearance')
-        Entry = apps.get_model('smanager.entry')
-        Grid = apps.get_model('stage.grid')
-        # If the first round, populate from entries
-        if not prior_round:
-            entries = self.session.entries.filter(
-                status=Entry.STATUS.approved,
             )
-            z = 0
-            for entry in entries:
-                # TODO - MT hack
-                if entry.is_mt:
-                    entry.draw = z
-                    z -= 1
-                # Pull active contestants
-                contestants = entry.contestants.filter(
-                    status__gt=0,
+
+            # Create Appearances and Contenders
+            appearances = []
+            contenders = []
+            # If the first round, populate from entries
+            if not prior_round:
+                entries = self.session.entries.filter(
+                    status=Entry.STATUS.approved,
                 )
-                # Set is_single=True if they are only in single-round contests
-                is_single = not bool(
-                    contestants.filter(
-                        contest__award__is_single=False,
-                    )
+                # Awards of the active contestants, by entry
+                contestants = Contestant.objects.filter(
+                    entry__in=entries,
+                    status__gt=0,
+                ).values_list(
+                    'entry',
+                    'contest__award',
+                    'contest__award__is_single',
                 )
-                # Get grid if available
-                try:
-                    onstage = Grid.objects.get(
+                awards_map = {}
+                singles_map = {}
+                for entry_id, award_id, award_is_single in contestants:
+                    awards_map.setdefault(entry_id, set()).add(award_id)
+                    singles_map.setdefault(entry_id, []).append(award_is_single)
+                z = 0
+                for entry in entries:
+                    # TODO - MT hack
+                    if entry.is_mt:
+                        entry.draw = z
+                        z -= 1
+                    # Set is_single=True if they are only in single-round contests
+                    is_single = all(singles_map.get(entry.id, []))
+                    appearance = Appearance(
                         round=self,
+                        entry_id=entry.id,
+                        group_id=entry.group_id,
                         num=entry.draw,
-                    ).onstage
-                except Grid.DoesNotExist:
-                    onstage = None
-                # Create and start group
-                appearance = self.appearances.create(
-                    entry=entry,
-                    group=entry.group,
-                    num=entry.draw,
-                    onstage=onstage,
-                    is_single=is_single,
-                    is_private=entry.is_private,
-                    participants=entry.participants,
-                    representing=entry.representing,
-                )
-                # Create contenders
-                awards = contestants.values_list('contest__award', flat=True)
-                outcomes = self.outcomes.filter(award__in=awards)
-                for outcome in outcomes:
-                    outcome.contenders.create(
-                        appearance=appearance,
+                        onstage=grids.get(entry.draw),
+                        is_single=is_single,
+                        is_private=entry.is_private,
+                        participants=entry.participants,
+                        representing=entry.representing,
                     )
-        # Otherwise, populate from prior round
-        else:
-            new_outcomes = self.outcomes.all()
-            prior_appearances = prior_round.appearances.filter(
-                status=Appearance.STATUS.advanced,
-            )
-            for prior_appearance in prior_appearances:
-                # Get grid if available
-                try:
-                    onstage = Grid.objects.get(
+                    appearances.append(appearance)
+                    for award_id in awards_map.get(entry.id, []):
+                        for outcome in outcomes_by_award.get(award_id, []):
+                            contenders.append(Contender(
+                                appearance=appearance,
+                                outcome=outcome,
+                            ))
+            # Otherwise, populate from prior round
+            else:
+                prior_appearances = prior_round.appearances.filter(
+                    status=Appearance.STATUS.advanced,
+                )
+                # Awards contended in the prior round, by appearance
+                prior_contenders = Contender.objects.filter(
+                    appearance__round=prior_round,
+                ).values_list(
+                    'appearance',
+                    'outcome__award',
+                )
+                awards_map = {}
+                for appearance_id, award_id in prior_contenders:
+                    awards_map.setdefault(appearance_id, set()).add(award_id)
+                for prior_appearance in prior_appearances:
+                    appearance = Appearance(
                         round=self,
+                        entry_id=prior_appearance.entry_id,
+                        group_id=prior_appearance.group_id,
                         num=prior_appearance.draw,
-                    ).onstage
-                except Grid.DoesNotExist:
-                    onstage = None
-                # Create and start group
-                appearance = self.appearances.create(
-                    entry=prior_appearance.entry,
-                    group=prior_appearance.group,
-                    num=prior_appearance.draw,
-                    onstage=onstage,
-                    is_single=prior_appearance.is_single,
-                    is_private=prior_appearance.is_private,
-                    participants=prior_appearance.participants,
-                    representing=prior_appearance.representing,
-                )
-                for new_outcome in new_outcomes:
-                    curry = bool(
-                        prior_appearance.contenders.filter(outcome__award=new_outcome.award)
+                        onstage=grids.get(prior_appearance.draw),
+                        is_single=prior_appearance.is_single,
+                        is_private=prior_appearance.is_private,
+                        participants=prior_appearance.participants,
+                        representing=prior_appearance.representing,
                     )
-                    if curry:
-                        new_outcome.contenders.create(
-                            appearance=appearance,
-                        )
-
-            mts = prior_round.appearances.filter(
-                draw__lte=0,
-            )
-            for mt in mts:
-                # Get grid if available
-                try:
-                    onstage = Grid.objects.get(
+                    appearances.append(appearance)
+                    for outcome in outcomes:
+                        if outcome.award_id in awards_map.get(prior_appearance.id, set()):
+                            contenders.append(Contender(
+                                appearance=appearance,
+                                outcome=outcome,
+                            ))
+
+                mts = prior_round.appearances.filter(
+                    draw__lte=0,
+                )
+                for mt in mts:
+                    appearances.append(Appearance(
                         round=self,
+                        entry_id=mt.entry_id,
+                        group_id=mt.group_id,
                         num=mt.draw,
-                    ).onstage
-                except Grid.DoesNotExist:
-                    onstage = None
-                appearance = self.appearances.create(
-                    entry=mt.entry,
-                    group=mt.group,
-                    num=mt.draw,
-                    onstage=onstage,
-                    is_single=mt.is_single,
-                    is_private=True,
-                    participants=mt.participants,
-                    representing=mt.representing,
-                )
-
+                        onstage=grids.get(mt.draw),
+                        is_single=mt.is_single,
+                        is_private=True,
+                        participants=mt.participants,
+                        representing=mt.representing,
+                    ))
+            Appearance.objects.bulk_create(appearances)
+            Contender.objects.bulk_create(contenders)
+
+            # Bulk inserts skip the signals that maintain visibility.
+            Visibility.objects.refresh(round_ids=[self.id])
+        return
 
     @fsm_log_by
     @transition(field=status, source=[STATUS.built], target=STATUS.started)
     def start(self, *args, **kwargs):
         # Build the appearances
-        appearances = self.appearances.all()
-        for appearance in appearances:
-            appearance.build()
-            appearance.save()
+        self.provision(by=kwargs.get('by'))
         return
 
     @fsm_log_by
@@ -3900,8 +3564,6 @@ class Round(TimeStampedModel):
         target=STATUS.completed,
         conditions=[can_complete],)
     def complete(self, *args, **kwargs):
-        Appearance = apps.get_model('rmanager.appearance')
-        Panelist = apps.get_model('rmanager.panelist')
         # Run outcomes
         outcomes = self.outcomes.all()
         for outcome in outcomes:
@@ -3912,105 +3574,9 @@ class Round(TimeStampedModel):
         if self.kind == self.KIND.finals:
             return
 
-        # Otherwise, figure out the Draw.
-        # First, get spots available
-        spots = self.spots
-
-        # Get all multi appearances and annotate average.
-        multis = self.appearances.filter(
-            status=Appearance.STATUS.verified,
-            is_single=False,
-        ).annotate(
-            avg=Avg(
-                'songs__scores__points',
-                filter=Q(
-                    songs__scores__panelist__kind=Panelist.KIND.official,
-                )
-            ),
-            tot_points=Sum(
-                'songs__scores__points',
-                filter=Q(
-                    songs__scores__panelist__kind=Panelist.KIND.official,
-                )
-            ),
-            sng_points=Sum(
-                'songs__scores__points',
-                filter=Q(
-                    songs__scores__panelist__kind=Panelist.KIND.official,
-                    songs__scores__panelist__category=Panelist.CATEGORY.singing,
-                )
-            ),
-            per_points=Sum(
-                'songs__scores__points',
-                filter=Q(
-                    songs__scores__panelist__kind=Panelist.KIND.official,
-                    songs__scores__panelist__category=Panelist.CATEGORY.performance,
-                )
-            ),
-        )
-        # If spots are constricted, find those who advance
-        if spots:
-            # All those above 73.0 advance automatically, regardless of spots available
-            if self.session.convention.district == 'BHS':
-                ordered = multis.order_by(
-                    '-tot_points',
-                    '-sng_points',
-                    '-per_points',
-                )
-                advancer__ids = [x.id for x in ordered[:spots]]
-                mt = ordered[spots:spots+1][0]
-            else:
-                automatics = multis.filter(
-                    avg__gte=73.0,
-                )
-                # generate list of the advancers, as appearance IDs
-                advancer__ids = [x.id for x in automatics]
-                # Generate remaining multi appearances
-                remains = multis.exclude(
-                    id__in=advancer__ids,
-                ).order_by(
-                    '-tot_points',
-                    '-sng_points',
-                    '-per_points',
-                )
-                # Figure out remaining spots
-                diff = spots - automatics.count()
-                # If there are additional remaining spots, add them up to available
-                if diff > 0:
-                    adds = remains[:diff]
-                    for a in adds:
-                        advancer__ids.append(a.id)
-                    try:
-                        mt = remains[diff:diff+1][0]
-                    except IndexError:
-                        mt = None
-                else:
-                    # If MT available add, otherwise none
-                    try:
-                        mt = remains.first()
-                    except AttributeError:
-                        mt = None
-        # Otherwise, advance all
-        else:
-            advancer__ids = [a.id for a in multis]
-            mt = None
-
-        # Reset draw
-        self.appearances.update(draw=None)
-
-        # Randomize the advancers and set the initial draw
-        appearances = self.appearances.filter(
-            id__in=advancer__ids,
-        ).order_by('?')
-        i = 1
-        for appearance in appearances:
-            appearance.draw = i
-            appearance.save()
-            i += 1
-        # create Mic Tester at draw 0
-        if mt:
-            mt.draw = 0
-            mt.save()
+        # Otherwise, advance and draw from one snapshot of the standings.
+        with transaction.atomic():
+            AdvancementEngine(self).save()
         return
 
     @fsm_log_by
@@ -4027,8 +3593,9 @@ class Round(TimeStampedModel):
         ).exclude(
             draw__gt=0,
         )
+        # CSAs and PSAs are rendered in the round's report batch.
         for appearance in completed_appearances:
-            appearance.complete()
+            appearance.complete(batched=True)
             appearance.save()
         advancing_appearances = self.appearances.filter(
             status=Appearance.STATUS.verified,
@@ -4041,7 +3608,7 @@ class Round(TimeStampedModel):
             category__gt=Panelist.CATEGORY.ca,
         )
         for panelist in panelists:
-            panelist.release()
+            panelist.release(batched=True)
             panelist.save()
         # Saves reports through transition signal to avoid race condition
         return
@@ -4054,25 +3621,8 @@ class Round(TimeStampedModel):
         conditions=[can_publish],)
     def publish(self, *args, **kwargs):
         """Publishes the results and notifies all parties"""
-        Appearance = apps.get_model('rmanager.appearance')
-        Panelist = apps.get_model('rmanager.panelist')
-        # Send the OSS
-        send_publish_email_from_round.delay(self)
-        # Send the CSAs
-        completed_appearances = self.appearances.filter(
-            status=Appearance.STATUS.completed,
-        )
-        for appearance in completed_appearances:
-            send_complete_email_from_appearance.delay(appearance)
-        # Send the SAs
-        send_publish_report_email_from_round.delay(self)
-        # Send the PSAs
-        panelists = self.panelists.filter(
-            category__gt=Panelist.CATEGORY.ca,
-            status=Panelist.STATUS.released,
-        )
-        for panelist in panelists:
-            send_psa_email_from_panelist.delay(panelist)
+        # The OSS, SA, CSA and PSA emails go out from the round's pipeline
+        # once its reports are rendered; see signals.
         return
 
 
@@ -4155,10 +3705,15 @@ class Score(TimeStampedModel):
 
     objects = ScoreManager()
 
+    tracker = FieldTracker(fields=['status', 'points'])
+
     class Meta:
         unique_together = (
             ('song', 'panelist',),
         )
+        index_together = (
+            ('modified', 'id',),
+        )
 
     class JSONAPIMeta:
         resource_name = "score"
@@ -4185,27 +3740,17 @@ class Score(TimeStampedModel):
             return False
         return any([
             # Assigned DRCJs and CAs can always see
-            self.song.appearance.round.session.convention.assignments.filter(
-                person__user=request.user,
-                status__gt=0,
-                category__lte=10,
-            ),
+            PermissionContext.for_request(request).is_officer_round(self.song.appearance.round_id),
             # Panelists can see their own scores
-            self.panelist.person.user == request.user,
+            self.panelist.person.user_id == request.user.id,
             # Panelists can see others' scores if Appearance is complete.
             all([
-                self.song.appearance.round.panelists.filter(
-                    person__user=request.user,
-                    status__gt=0,
-                ),
+                PermissionContext.for_request(request).is_panelist(self.song.appearance.round_id),
                 self.song.appearance.status <= self.song.appearance.STATUS.completed
             ]),
             # Group members can see their own scores if complete.
             all([
-                self.song.appearance.group.members.filter(
-                    person__user=request.user,
-                    status__gt=0,
-                ),
+                PermissionContext.for_request(request).is_member(self.song.appearance.group_id),
                 self.song.appearance.status <= self.song.appearance.STATUS.completed
             ]),
         ])
@@ -4215,10 +3760,7 @@ class Score(TimeStampedModel):
     @authenticated_users
     def has_write_permission(request):
         return any([
-            request.user.person.officers.filter(
-                office__lt=300,
-                status__gt=0,
-            ),
+            PermissionContext.for_request(request).has_office(below=300),
         ])
 
     @allow_staff_or_superuser
@@ -4226,11 +3768,7 @@ class Score(TimeStampedModel):
     def has_object_write_permission(self, request):
         return any([
             all([
-                self.song.appearance.round.session.convention.assignments.filter(
-                    person__user=request.user,
-                    status__gt=0,
-                    category__lte=10,
-                ),
+                PermissionContext.for_request(request).is_officer_round(self.song.appearance.round_id),
                 self.song.appearance.round.status < self.song.appearance.round.STATUS.verified,
             ]),
         ])
@@ -4323,10 +3861,21 @@ class Song(TimeStampedModel):
     # Internals
     objects = SongManager()
 
+    tracker = FieldTracker(fields=[
+        'status',
+        'chart',
+        'penalties',
+        'asterisks',
+        'dixons',
+    ])
+
     class Meta:
         unique_together = (
             ('appearance', 'num',),
         )
+        index_together = (
+            ('modified', 'id',),
+        )
         get_latest_by = ['num']
 
     class JSONAPIMeta:
@@ -4336,92 +3885,6 @@ class Song(TimeStampedModel):
         return str(self.id)
 
     # Methods
-    def get_asterisks(self):
-        """
-        Check to see if the song produces a category variance (asterisk)
-
-        Returns a list of categories that produced an asterisk.
-        """
-        # Set Flag
-        asterisks = []
-        # Get Averages by category
-        categories = self.scores.filter(
-            panelist__kind=10,
-        ).values(
-            'panelist__category',
-        ).annotate(
-            avg=Avg('points'),
-        )
-        for category in categories:
-            category_scores = self.scores.filter(
-                panelist__category=category['panelist__category'],
-                panelist__kind=10,
-            )
-            for score in category_scores:
-                is_asterisk = abs(score.points - category['avg']) > 5
-                if is_asterisk:
-                    asterisks.append(category['panelist__category'])
-                    continue
-        asterisks = list(set(asterisks))
-        return asterisks
-
-    def get_dixons(self):
-        """
-        Check to see if the song produces a spread error (Dixon's Q)
-
-        Returns a list of categories that produced a Dixon's Q.
-        """
-        # Set flag
-        output = []
-        # Confidence thresholds
-        confidence = {
-            '3': 0.941,
-            '6': .56,
-            '9': .376,
-            '12': .437,
-            '15': .338,
-        }
-        # Only use official scores.
-        scores = self.scores.filter(
-            panelist__kind=10,
-        )
-        # Get the totals
-        aggregates = scores.aggregate(
-            cnt=Count('id'),
-            max=Max('points'),
-            min=Min('points'),
-            spread=Max('points') - Min('points'),
-        )
-        # Check for validity.
-        if aggregates['cnt'] < 3:
-            return RuntimeError('Panel too small error')
-        # Bypass to avoid division by zero
-        if not aggregates['spread']:
-            return output
-        # Order the scores
-        ascending = scores.order_by('points')
-        descending = scores.order_by('-points')
-        # Separate check for single-panel
-        if aggregates['cnt'] == '3':
-            if abs(ascending[0].points - ascending[1].points) >= 10:
-                output.append(ascending[0].panelist.category)
-            if abs(descending[0].points - descending[1].points) >= 10:
-                output.append(descending[0].panelist.category)
-            return output
-
-        # Otherwise, run the checks, both ascending and descending
-        critical = confidence[str(aggregates['cnt'])]
-        ascending_distance = abs(ascending[0].points - ascending[1].points)
-        ascending_q = ascending_distance / aggregates['spread']
-        if ascending_q > critical and ascending_distance > 4:
-            output.append(ascending[0].panelist.category)
-        descending_distance = abs(descending[0].points - descending[1].points)
-        descending_q = descending_distance / aggregates['spread']
-        if descending_q > critical and descending_distance > 4:
-            output.append(descending[0].panelist.category)
-        return output
-
-
     # Permissions
     @staticmethod
     @allow_staff_or_superuser
@@ -4434,11 +3897,7 @@ class Song(TimeStampedModel):
     def has_object_read_permission(self, request):
         return any([
             self.appearance.round.status == self.appearance.round.STATUS.published,
-            self.appearance.round.session.convention.assignments.filter(
-                person__user=request.user,
-                status__gt=0,
-                category__lte=10,
-            ),
+            PermissionContext.for_request(request).is_officer_round(self.appearance.round_id),
         ])
 
     @staticmethod
@@ -4446,10 +3905,7 @@ class Song(TimeStampedModel):
     @authenticated_users
     def has_write_permission(request):
         return any([
-            request.user.person.officers.filter(
-                office__lt=300,
-                status__gt=0,
-            ),
+            PermissionContext.for_request(request).has_office(below=300),
         ])
 
     @allow_staff_or_superuser
@@ -4457,11 +3913,99 @@ class Song(TimeStampedModel):
     def has_object_write_permission(self, request):
         return any([
             all([
-                self.appearance.round.session.convention.assignments.filter(
-                    person__user=request.user,
-                    status__gt=0,
-                    category__lte=10,
-                ),
+                PermissionContext.for_request(request).is_officer_round(self.appearance.round_id),
                 self.appearance.round.status < self.appearance.round.STATUS.verified,
             ]),
         ])
+
+
+class SongAggregate(ScoreAggregate):
+    song = models.OneToOneField(
+        'Song',
+        related_name='aggregate',
+        primary_key=True,
+        on_delete=models.CASCADE,
+    )
+
+    tot_dev = models.FloatField(null=True, blank=True)
+    mus_dev = models.FloatField(null=True, blank=True)
+    per_dev = models.FloatField(null=True, blank=True)
+    sng_dev = models.FloatField(null=True, blank=True)
+
+    objects = SongAggregateManager()
+
+    @classmethod
+    def get_defaults(cls, totals):
+        defaults = super().get_defaults(totals)
+        for prefix in cls.PREFIXES:
+            name = '{0}_dev'.format(prefix)
+            defaults[name] = totals.get(name)
+        return defaults
+
+    @classmethod
+    def get_columns(cls, path):
+        columns = super().get_columns(path)
+        for prefix in cls.PREFIXES:
+            name = '{0}_dev'.format(prefix)
+            columns[name] = F('{0}__{1}'.format(path, name))
+        return columns
+
+    def __str__(self):
+        return str(self.song_id)
+
+
+class Visibility(models.Model):
+    """
+    Rounds a user can see as an officer, panelist or group member.
+
+    A materialized index for the list filter backends, rebuilt from
+    Assignments, Panelists and Members whenever those change.
+    """
+
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False,
+    )
+
+    KIND = Choices(
+        (10, 'officer', 'Officer'),
+        (20, 'panelist', 'Panelist'),
+        (30, 'member', 'Member'),
+    )
+
+    kind = models.IntegerField(
+        choices=KIND,
+    )
+
+    # FKs
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        related_name='visibilities',
+        on_delete=models.CASCADE,
+    )
+
+    round = models.ForeignKey(
+        'Round',
+        related_name='visibilities',
+        on_delete=models.CASCADE,
+    )
+
+    group = models.ForeignKey(
+        'bhs.group',
+        related_name='visibilities',
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+    )
+
+    objects = VisibilityManager()
+
+    class Meta:
+        verbose_name_plural = 'visibilities'
+        index_together = (
+            ('user', 'kind',),
+        )
+
+    def __str__(self):
+        return "{0} {1}".format(self.user_id, self.round_id)
@@ -0,0 +1,324 @@
+# Standard Library
+import json
+import logging
+import time
+import uuid
+
+# Third-Party
+import django_rq
+from django_redis import get_redis_connection
+
+# Django
+from django.apps import apps
+from django.core.cache import cache
+
+# Local
+from .cubes import SessionScoreCube
+from .reports import render_pdf
+from .reports import render_pdfs
+
+log = logging.getLogger(__name__)
+
+
+def run_stage(round_id, run, stage):
+    """Job entry point; see RoundPipeline."""
+    return RoundPipeline(round_id).run(run, stage)
+
+
+class RoundPipeline(object):
+    """
+    The publication work for a round, as a small graph of jobs.
+
+    Aggregates are computed first and the session cube is stored for the
+    report jobs.  The OSS and SA, the CSAs and the PSAs then render in
+    parallel, each as its own job.  Emails go out once every report job
+    has finished and the round has been published, whichever comes last,
+    and attach the stored reports rather than rendering their own.
+
+    Progress is kept per stage in a Redis hash, along with the id of the
+    current run, so jobs left over from an earlier run stand down.  Every
+    write a job makes checks the run in the same transaction, so one that
+    was superseded mid-stage can't mark up or count down the new run.  A
+    failed report job holds the emails back; it shows in the progress, and
+    asking for the emails again starts a fresh run.
+    """
+
+    QUEUE = 'high'
+
+    STAGES = (
+        'aggregates',
+        'round',
+        'csa',
+        'psa',
+        'emails',
+    )
+
+    REPORT_STAGES = (
+        'round',
+        'csa',
+        'psa',
+    )
+
+    # Long enough to publish days after verifying.
+    TIMEOUT = 60 * 60 * 24 * 14
+
+    def __init__(self, round_id):
+        self.round_id = round_id
+        self.key = cache.make_key('pipeline_round_{0}'.format(round_id))
+        self.cube_key = 'pipeline_round_{0}_cube'.format(round_id)
+        self.connection = get_redis_connection('default')
+        # The run a job belongs to, once it is executing.
+        self.current_run = None
+
+    def get_round(self):
+        Round = apps.get_model('rmanager.round')
+        return Round.objects.select_related(
+            'session',
+            'session__convention',
+        ).get(id=self.round_id)
+
+    # Progress
+    def get_progress(self):
+        """Per-stage status, counts and timestamps for the current run."""
+        data = self.connection.hgetall(self.key)
+        data = {k.decode(): v.decode() for k, v in data.items()}
+        stages = []
+        for stage in self.STAGES:
+            progress = json.loads(data.get(stage, 'null')) or {
+                'status': 'pending',
+            }
+            progress['stage'] = stage
+            stages.append(progress)
+        return {
+            'run': data.get('run'),
+            'emails_requested': bool(data.get('emails_requested')),
+            'failed': [x['stage'] for x in stages if x['status'] == 'failed'],
+            'stages': stages,
+        }
+
+    def get_failed(self):
+        """Stages ahead of the emails that failed, and so hold them back."""
+        stages = ('aggregates',) + self.REPORT_STAGES
+        return [
+            x for x in self.get_progress()['failed'] if x in stages
+        ]
+
+    def write(self, run, func):
+        """
+        Call `func(pipeline)` with the hash watched, unless `run` has been
+        superseded; `func` reads what it needs, then queues its writes
+        after `pipeline.multi()`.  Returns False for a superseded run.
+        """
+        def transaction(pipeline):
+            if run is not None:
+                current = pipeline.hget(self.key, 'run')
+                if current is None or current.decode() != run:
+                    return False
+            func(pipeline)
+            return True
+        return self.connection.transaction(
+            transaction,
+            self.key,
+            value_from_callable=True,
+        )
+
+    def set_stage(self, stage, run=None, **kwargs):
+        progress = {}
+
+        def func(pipeline):
+            raw = pipeline.hget(self.key, stage)
+            progress.clear()
+            progress.update(json.loads(raw) if raw else {})
+            progress.update(kwargs)
+            pipeline.multi()
+            pipeline.hset(self.key, stage, json.dumps(progress))
+            pipeline.expire(self.key, self.TIMEOUT)
+        if not self.write(run or self.current_run, func):
+            return None
+        return progress
+
+    def advance(self, stage, done=1):
+        def func(pipeline):
+            raw = pipeline.hget(self.key, stage)
+            progress = json.loads(raw) if raw else {}
+            progress['done'] = progress.get('done', 0) + done
+            pipeline.multi()
+            pipeline.hset(self.key, stage, json.dumps(progress))
+        return self.write(self.current_run, func)
+
+    # Scheduling
+    def enqueue(self, run, stage, depends_on=None):
+        self.set_stage(stage, run=run, status='queued')
+        return django_rq.get_queue(self.QUEUE).enqueue_call(
+            run_stage,
+            args=(self.round_id, run, stage),
+            depends_on=depends_on,
+        )
+
+    def start(self, emails=False):
+        """Start a fresh run; `emails` sends them once the reports are in."""
+        run = uuid.uuid4().hex
+        pipeline = self.connection.pipeline()
+        pipeline.delete(self.key)
+        pipeline.hset(self.key, 'run', run)
+        pipeline.hset(self.key, 'reports_remaining', len(self.REPORT_STAGES))
+        if emails:
+            pipeline.hset(self.key, 'emails_requested', 1)
+        pipeline.expire(self.key, self.TIMEOUT)
+        pipeline.execute()
+        aggregates = self.enqueue(run, 'aggregates')
+        # rq runs a job once its one dependency has finished; the report
+        # jobs fan in through `reports_remaining` instead.
+        for stage in self.REPORT_STAGES:
+            self.enqueue(run, stage, depends_on=aggregates)
+        return run
+
+    def request_emails(self):
+        """Send the emails now if the reports are in, or as soon as they are."""
+        run = self.connection.hget(self.key, 'run')
+        if run is None or self.get_failed():
+            # Nothing rendered yet, or a failed report would hold the
+            # emails forever; do the lot.
+            return self.start(emails=True)
+        self.connection.hset(self.key, 'emails_requested', 1)
+        self.enqueue_emails(run.decode())
+        return run.decode()
+
+    def enqueue_emails(self, run):
+        # Both the last report job and publish land here; only one wins.
+        claimed = []
+
+        def func(pipeline):
+            del claimed[:]
+            remaining = int(pipeline.hget(self.key, 'reports_remaining') or 0)
+            if remaining > 0 or not pipeline.hget(self.key, 'emails_requested'):
+                return
+            if pipeline.hget(self.key, 'emails_enqueued'):
+                return
+            pipeline.multi()
+            pipeline.hset(self.key, 'emails_enqueued', 1)
+            claimed.append(True)
+        if not self.write(run, func) or not claimed:
+            return None
+        return self.enqueue(run, 'emails')
+
+    # Execution
+    def run(self, run, stage):
+        self.current_run = run
+        if self.set_stage(stage, status='running', started=time.time()) is None:
+            log.info("Skipping stale {0} stage for {1}".format(stage, self.round_id))
+            return
+        try:
+            result = getattr(self, 'run_{0}'.format(stage))()
+        except Exception:
+            self.set_stage(stage, status='failed', finished=time.time())
+            if stage != 'emails' and self.connection.hget(self.key, 'emails_requested'):
+                log.error("Emails for {0} held back by the {1} stage".format(
+                    self.round_id,
+                    stage,
+                ))
+            raise
+        if self.set_stage(stage, status='done', finished=time.time()) is None:
+            log.info("Dropping superseded {0} stage for {1}".format(stage, self.round_id))
+            return result
+        if stage in self.REPORT_STAGES:
+            def func(pipeline):
+                pipeline.multi()
+                pipeline.hincrby(self.key, 'reports_remaining', -1)
+            if self.write(run, func):
+                self.enqueue_emails(run)
+        return result
+
+    def run_aggregates(self):
+        Song = apps.get_model('rmanager.song')
+        SongAggregate = apps.get_model('rmanager.songaggregate')
+        round = self.get_round()
+        song_ids = list(Song.objects.filter(
+            appearance__round=round,
+        ).values_list('id', flat=True))
+        self.set_stage('aggregates', total=len(song_ids) + 1, done=0)
+        # Cascades to the appearance and group aggregates.
+        SongAggregate.objects.refresh(song_ids)
+        self.advance('aggregates', done=len(song_ids))
+        cube = SessionScoreCube(round.session)
+        cache.set(self.cube_key, cube, self.TIMEOUT)
+        self.advance('aggregates')
+        return len(song_ids)
+
+    def get_cube(self, round):
+        cube = cache.get(self.cube_key)
+        if cube is None:
+            cube = SessionScoreCube(round.session)
+        return cube
+
+    def run_round(self):
+        round = self.get_round()
+        cube = self.get_cube(round)
+        self.set_stage('round', total=2, done=0)
+        # The OSS is fitted to one page on its own.
+        oss = round.get_oss(cube=cube)
+        self.advance('round')
+        sa = render_pdf(round.get_sa_report(cube=cube))
+        round.oss.save('oss', oss, save=False)
+        round.sa.save('sa', sa, save=False)
+        # Only touch the report columns; the round may be mid-transition.
+        round.save(update_fields=['oss', 'sa'])
+        self.advance('round')
+        return
+
+    def run_csa(self):
+        Appearance = apps.get_model('rmanager.appearance')
+        round = self.get_round()
+        appearances = list(round.appearances.filter(
+            status=Appearance.STATUS.completed,
+        ))
+        self.set_stage('csa', total=len(appearances), done=0)
+        rendereds = render_pdfs(x.get_csa_report() for x in appearances)
+        for appearance, rendered in zip(appearances, rendereds):
+            appearance.csa.save('csa', rendered.content)
+            self.advance('csa')
+        return len(appearances)
+
+    def run_psa(self):
+        Panelist = apps.get_model('rmanager.panelist')
+        round = self.get_round()
+        panelists = list(round.panelists.filter(
+            status=Panelist.STATUS.released,
+            category__gt=Panelist.CATEGORY.ca,
+        ))
+        self.set_stage('psa', total=len(panelists), done=0)
+        rendereds = render_pdfs(x.get_psa_report() for x in panelists)
+        for panelist, rendered in zip(panelists, rendereds):
+            panelist.psa.save('psa', rendered.content)
+            self.advance('psa')
+        return len(panelists)
+
+    def run_emails(self):
+        Appearance = apps.get_model('rmanager.appearance')
+        Panelist = apps.get_model('rmanager.panelist')
+        round = self.get_round()
+        appearances = list(round.appearances.filter(
+            status=Appearance.STATUS.completed,
+        ))
+        panelists = list(round.panelists.filter(
+            category__gt=Panelist.CATEGORY.ca,
+            status=Panelist.STATUS.released,
+        ))
+        emails = [round.send_publish_email, round.send_publish_report_email]
+        emails.extend(x.send_complete_email for x in appearances)
+        emails.extend(x.send_psa_email for x in panelists)
+        self.set_stage('emails', total=len(emails), done=0, errors=0)
+        errors = 0
+        for send in emails:
+            # One bad address shouldn't hold up everybody else's.
+            try:
+                send()
+            except Exception:
+                log.exception("Email failed for {0}".format(send.__self__))
+                errors += 1
+                self.set_stage('emails', errors=errors)
+                continue
+            self.advance('emails')
+        if errors:
+            raise RuntimeError("{0} of {1} emails failed".format(errors, len(emails)))
+        return len(emails)
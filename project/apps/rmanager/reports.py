@@ -0,0 +1,274 @@
+# Standard Library
+import hashlib
+import logging
+import re
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# Third-Party
+import pydf
+from django_redis import get_redis_connection
+from redis.exceptions import LockError
+
+# Django
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.base import File
+from django.core.files.storage import default_storage
+from django.template.loader import get_template
+from django.template.loader_tags import ExtendsNode
+from django.template.loader_tags import IncludeNode
+from django.template.loader import render_to_string
+
+log = logging.getLogger(__name__)
+
+
+# A report to render: template name, template context, and pydf options.
+Report = namedtuple('Report', ['template', 'context', 'options'])
+
+# A rendered report: the PDF and the seconds spent converting it.
+Rendered = namedtuple('Rendered', ['content', 'seconds'])
+
+# Page objects, but not the `/Pages` tree nodes.
+PAGE_PATTERN = re.compile(rb'/Type\s*/Page(?!s)')
+
+# Seconds between checks on another request's render.
+POLL_INTERVAL = 0.25
+
+
+class ReportPending(Exception):
+    """The report is being rendered elsewhere and isn't ready yet."""
+
+
+def convert(rendered, options):
+    start = time.monotonic()
+    file = pydf.generate_pdf(rendered, **options)
+    return file, time.monotonic() - start
+
+
+def render_pdfs(reports, processes=None):
+    """
+    Render a batch of reports to PDF.
+
+    Templates are rendered here, where the database is available; the
+    conversions then run in parallel.  Each conversion is its own
+    wkhtmltopdf process, so the pool is bounded by `REPORT_PROCESSES`.
+    Results are returned in the order of `reports`.
+    """
+    reports = list(reports)
+    if not reports:
+        return []
+    if processes is None:
+        processes = settings.REPORT_PROCESSES
+    rendereds = [
+        render_to_string(report.template, report.context)
+        for report in reports
+    ]
+    workers = max(1, min(processes, len(reports)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(
+            convert,
+            rendereds,
+            [report.options for report in reports],
+        ))
+    output = []
+    for report, (file, seconds) in zip(reports, results):
+        log.info("Rendered {0} in {1:.2f}s".format(report.template, seconds))
+        output.append(Rendered(ContentFile(file), seconds))
+    return output
+
+
+def render_pdf(report):
+    return render_pdfs([report], processes=1)[0].content
+
+
+def count_pages(file):
+    return len(PAGE_PATTERN.findall(file))
+
+
+def fit_pdf(report, pages=1, zoom=None, minimum=0.5, maximum=1.0, precision=0.01):
+    """
+    Render a report at the largest zoom that fits on `pages` pages.
+
+    The template is rendered once; only the conversion is repeated while
+    binary-searching the zoom.  The search always starts at `maximum`, so
+    a report that has shrunk grows back; a `zoom` that fitted an earlier
+    version is probed next to narrow the search from either side.
+    Returns the PDF and the zoom used.
+    """
+    rendered = render_to_string(report.template, report.context)
+    files = {}
+
+    def probe(value):
+        value = round(value, 2)
+        if value not in files:
+            options = dict(report.options, zoom=value)
+            file, seconds = convert(rendered, options)
+            log.info("Probed {0} at zoom {1} in {2:.2f}s".format(
+                report.template,
+                value,
+                seconds,
+            ))
+            files[value] = file
+        return count_pages(files[value]) <= pages
+
+    high = round(maximum, 2)
+    if probe(high):
+        return ContentFile(files[high]), high
+    low = round(minimum, 2)
+    best = None
+    if zoom is not None and low < round(zoom, 2) < high:
+        if probe(zoom):
+            low = best = round(zoom, 2)
+        else:
+            high = round(zoom, 2)
+    while high - low > precision:
+        middle = round((low + high) / 2, 2)
+        if middle in (low, high):
+            break
+        if probe(middle):
+            low = best = middle
+        else:
+            high = middle
+    if best is None:
+        # Nothing fit; fall back to the smallest zoom.
+        best = round(minimum, 2)
+        probe(best)
+    return ContentFile(files[best]), best
+
+
+def get_template_sources(name, seen=None):
+    """Source of template `name` and of every template it extends or includes."""
+    if seen is None:
+        seen = set()
+    if name in seen:
+        return []
+    seen.add(name)
+    template = get_template(name).template
+    sources = [template.source]
+    expressions = [x.parent_name for x in template.nodelist.get_nodes_by_type(ExtendsNode)]
+    expressions.extend(x.template for x in template.nodelist.get_nodes_by_type(IncludeNode))
+    for expression in expressions:
+        # Only literal names; a name from a variable can't be known here.
+        if isinstance(expression.var, str):
+            sources.extend(get_template_sources(expression.var, seen))
+    return sources
+
+
+def get_template_digest(template):
+    """Hash of `template` and the templates it extends or includes."""
+    digest = hashlib.sha256()
+    for source in get_template_sources(template):
+        digest.update(source.encode())
+        digest.update(b'\x1d')
+    return digest.hexdigest()
+
+
+def fingerprint(template, *sources):
+    """
+    Hash a report's templates and the rows it is rendered from.
+
+    The templates are `template` and any it extends or includes.  Each
+    source is an iterable of rows, typically an ordered `values_list`.
+    """
+    digest = hashlib.sha256()
+    digest.update(get_template_digest(template).encode())
+    for rows in sources:
+        digest.update(b'\x1e')
+        for row in rows:
+            digest.update(repr(row).encode())
+            digest.update(b'\x1f')
+    return digest.hexdigest()
+
+
+class StoredFile(File):
+    """A file in storage, opened only when it is read."""
+
+    def __init__(self, storage, name):
+        self.storage = storage
+        self.name = name
+        self._file = None
+
+    def _get_file(self):
+        if self._file is None:
+            self._file = self.storage.open(self.name, 'rb')
+        return self._file
+
+    def _set_file(self, file):
+        self._file = file
+
+    def _del_file(self):
+        del self._file
+
+    file = property(_get_file, _set_file, _del_file)
+
+    @property
+    def size(self):
+        return self.storage.size(self.name)
+
+    @property
+    def closed(self):
+        return self._file is None or self._file.closed
+
+    def open(self, mode='rb'):
+        if self._file is None or self._file.closed:
+            self._file = self.storage.open(self.name, mode)
+        else:
+            self._file.seek(0)
+        return self
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+
+
+def get_cached_path(key):
+    return 'reports/{0}.pdf'.format(key)
+
+
+def has_cached_pdf(key):
+    return default_storage.exists(get_cached_path(key))
+
+
+def get_cached_pdf(key, render, wait=None):
+    """
+    Serve the PDF stored under a fingerprint, rendering it on a miss.
+
+    `render` is called without arguments and returns the PDF content.
+    Renders are single-flight: the first request for a missing report
+    takes a Redis lock and renders it, while concurrent requests wait up to
+    `wait` seconds (`REPORT_WAIT` by default) for the stored file and
+    then raise ReportPending rather than render it a second time.
+    """
+    path = get_cached_path(key)
+    if default_storage.exists(path):
+        return StoredFile(default_storage, path)
+    lock = get_redis_connection('default').lock(
+        cache.make_key('report_lock_{0}'.format(key)),
+        timeout=settings.REPORT_LOCK_TIMEOUT,
+    )
+    if lock.acquire(blocking=False):
+        try:
+            # It may have been stored between the check and the lock.
+            if default_storage.exists(path):
+                return StoredFile(default_storage, path)
+            content = render()
+            default_storage.save(path, content)
+        finally:
+            try:
+                lock.release()
+            except LockError:
+                # Outlived the timeout; somebody else may hold it now.
+                log.warning("Report lock expired for {0}".format(key))
+        return content
+    if wait is None:
+        wait = settings.REPORT_WAIT
+    deadline = time.monotonic() + wait
+    while lock.locked() and time.monotonic() < deadline:
+        time.sleep(POLL_INTERVAL)
+    if default_storage.exists(path):
+        return StoredFile(default_storage, path)
+    # Still rendering, or the render failed; either way, ask again later.
+    raise ReportPending(key)
@@ -2,6 +2,9 @@
 # Third-Party
 from rest_framework.response import Response
 
+# Django
+from django.http import HttpResponse
+
 
 class PDFResponse(Response):
     def __init__(self, pdf, file_name, *args, **kwargs):
@@ -48,3 +51,12 @@ class DOCXResponse(Response):
             *args,
             **kwargs
         )
+
+
+class PendingResponse(HttpResponse):
+    """202 for a report that is still being rendered; retry shortly."""
+    status_code = 202
+
+    def __init__(self, retry_after=5, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self['Retry-After'] = str(retry_after)
@@ -1,9 +1,12 @@
 
 # Third-Party
-from dry_rest_permissions.generics import DRYPermissionsField
 from rest_framework.validators import UniqueTogetherValidator
 from rest_framework_json_api import serializers
 
+# First-Party
+from apps.bhs.permissions import PermissionsField
+from apps.bhs.permissions import PermissionsMixin
+
 # Local
 from .fields import TimezoneField
 
@@ -17,8 +20,8 @@ from .models import Song
 
 
 
-class AppearanceSerializer(serializers.ModelSerializer):
-    permissions = DRYPermissionsField()
+class AppearanceSerializer(PermissionsMixin, serializers.ModelSerializer):
+    permissions = PermissionsField()
     included_serializers = {
         'songs': 'apps.rmanager.serializers.SongSerializer',
         # 'songs__scores': 'apps.rmanager.serializers.ScoreSerializer',
@@ -63,8 +66,8 @@ class AppearanceSerializer(serializers.ModelSerializer):
         ]
 
 
-class ContenderSerializer(serializers.ModelSerializer):
-    permissions = DRYPermissionsField()
+class ContenderSerializer(PermissionsMixin, serializers.ModelSerializer):
+    permissions = PermissionsField()
 
     class Meta:
         model = Contender
@@ -78,8 +81,8 @@ class ContenderSerializer(serializers.ModelSerializer):
         )
 
 
-class OutcomeSerializer(serializers.ModelSerializer):
-    permissions = DRYPermissionsField()
+class OutcomeSerializer(PermissionsMixin, serializers.ModelSerializer):
+    permissions = PermissionsField()
     # included_serializers = {
     #     'contenders': 'apps.rmanager.serializers.ContenderSerializer',
     # }
@@ -101,8 +104,8 @@ class OutcomeSerializer(serializers.ModelSerializer):
         )
 
 
-class PanelistSerializer(serializers.ModelSerializer):
-    permissions = DRYPermissionsField()
+class PanelistSerializer(PermissionsMixin, serializers.ModelSerializer):
+    permissions = PermissionsField()
     # included_serializers = {
     #     'scores': 'apps.rmanager.serializers.ScoreSerializer',
     # }
@@ -128,8 +131,8 @@ class PanelistSerializer(serializers.ModelSerializer):
     #     ]
 
 
-class RoundSerializer(serializers.ModelSerializer):
-    permissions = DRYPermissionsField()
+class RoundSerializer(PermissionsMixin, serializers.ModelSerializer):
+    permissions = PermissionsField()
     included_serializers = {
         'appearances': 'apps.rmanager.serializers.AppearanceSerializer',
         'members': 'apps.bhs.serializers.MemberSerializer',
@@ -168,8 +171,8 @@ class RoundSerializer(serializers.ModelSerializer):
         ]
 
 
-class ScoreSerializer(serializers.ModelSerializer):
-    permissions = DRYPermissionsField()
+class ScoreSerializer(PermissionsMixin, serializers.ModelSerializer):
+    permissions = PermissionsField()
 
     class Meta:
         model = Score
@@ -184,8 +187,8 @@ class ScoreSerializer(serializers.ModelSerializer):
         ]
 
 
-class SongSerializer(serializers.ModelSerializer):
-    permissions = DRYPermissionsField()
+class SongSerializer(PermissionsMixin, serializers.ModelSerializer):
+    permissions = PermissionsField()
     included_serializers = {
         'scores': 'apps.rmanager.serializers.ScoreSerializer',
     }
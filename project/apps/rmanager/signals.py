@@ -1,21 +1,41 @@
 import django_rq
 
 # Django
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django_fsm.signals import post_transition
+
+# First-Party
+from apps.bhs.models import Member
+from apps.bhs.models import Person
+from apps.cmanager.models import Assignment
+
 # Local
 from .models import Appearance
+from .models import AppearanceAggregate
+from .models import GroupAggregate
 from .models import Panelist
-# from .models import Person
 from .models import Round
+from .models import Score
+from .models import Song
+from .models import SongAggregate
+from .models import Visibility
+from .feeds import RoundFeed
+from .feeds import get_round_id
+from .pipeline import RoundPipeline
+from .standings import Standings
 
-from .tasks import save_reports_from_round
 from .tasks import save_psa_from_panelist
 from .tasks import save_csa_from_appearance
 
 
 @receiver(post_transition, sender=Appearance)
 def appearance_post_transition(sender, instance, name, source, target, **kwargs):
+    if kwargs.get('method_kwargs', {}).get('batched'):
+        # Rendered with the round reports instead.
+        return
     if name == 'complete':
         save_csa_from_appearance.delay(instance)
         return
@@ -23,6 +43,9 @@ def appearance_post_transition(sender, instance, name, source, target, **kwargs)
 
 @receiver(post_transition, sender=Panelist)
 def panelist_post_transition(sender, instance, name, source, target, **kwargs):
+    if kwargs.get('method_kwargs', {}).get('batched'):
+        # Rendered with the round reports instead.
+        return
     if name == 'release':
         save_psa_from_panelist.delay(instance)
         return
@@ -31,6 +54,224 @@ def panelist_post_transition(sender, instance, name, source, target, **kwargs):
 @receiver(post_transition, sender=Round)
 def round_post_transition(sender, instance, name, source, target, **kwargs):
     if name == 'verify':
-        save_reports_from_round.delay(instance)
+        # Aggregates, then reports, then (on publish) emails.
+        round_id = instance.id
+        transaction.on_commit(lambda: RoundPipeline(round_id).start())
+        return
+    if name == 'publish':
+        round_id = instance.id
+        transaction.on_commit(lambda: RoundPipeline(round_id).request_emails())
+        return
+    return
+
+
+# Aggregates
+@receiver(post_save, sender=Score)
+def score_post_save(sender, instance, **kwargs):
+    SongAggregate.objects.refresh([instance.song_id])
+    return
+
+@receiver(post_delete, sender=Score)
+def score_post_delete(sender, instance, **kwargs):
+    # Wait for cascades to finish; the song may be gone.
+    song_id = instance.song_id
+    transaction.on_commit(
+        lambda: SongAggregate.objects.refresh([song_id])
+    )
+    return
+
+@receiver(post_delete, sender=Song)
+def song_post_delete(sender, instance, **kwargs):
+    appearance_id = instance.appearance_id
+    transaction.on_commit(
+        lambda: AppearanceAggregate.objects.refresh([appearance_id])
+    )
+    return
+
+@receiver(post_delete, sender=Appearance)
+def appearance_post_delete(sender, instance, **kwargs):
+    # Leave the board alone if the delete rolls back.
+    round_id = instance.round_id
+    appearance_id = instance.id
+    transaction.on_commit(
+        lambda: Standings.for_round(round_id).remove([appearance_id])
+    )
+    if not instance.group_id:
+        return
+    pair = (instance.round.session_id, instance.group_id)
+    transaction.on_commit(
+        lambda: GroupAggregate.objects.refresh([pair])
+    )
+    return
+
+@receiver(post_save, sender=Panelist)
+def panelist_post_save(sender, instance, created, **kwargs):
+    # Kind or category changes move this panelist's scores.
+    if created:
+        return
+    if not any([
+        instance.tracker.has_changed('kind'),
+        instance.tracker.has_changed('category'),
+    ]):
+        return
+    song_ids = instance.scores.values_list('song', flat=True)
+    SongAggregate.objects.refresh(list(song_ids))
+    return
+
+
+# Standings
+@receiver(post_transition, sender=Appearance)
+def appearance_standings_post_transition(sender, instance, name, source, target, **kwargs):
+    # Verified totals are final; make sure the board reflects them.
+    if name != 'verify':
+        return
+    AppearanceAggregate.objects.refresh([instance.id])
+    return
+
+
+# Feed
+def publish_save(round_id, instance, created):
+    if created:
+        fields = instance.tracker.current()
+    else:
+        changed = instance.tracker.changed()
+        if not changed:
+            return
+        fields = instance.tracker.current(list(changed))
+    entity = instance._meta.model_name
+    transaction.on_commit(
+        lambda: RoundFeed(round_id).publish(
+            entity,
+            instance.id,
+            fields=fields,
+            created=created,
+        )
+    )
+    return
+
+def publish_transition(round_id, instance, name, target):
+    entity = instance._meta.model_name
+    transaction.on_commit(
+        lambda: RoundFeed(round_id).publish(
+            entity,
+            instance.id,
+            status=target,
+            transition=name,
+        )
+    )
+    return
+
+@receiver(post_save, sender=Score)
+def score_feed_post_save(sender, instance, created, **kwargs):
+    if not created and not instance.tracker.changed():
+        return
+    round_id = get_round_id(Song, instance.song_id, 'appearance__round')
+    publish_save(round_id, instance, created)
+    return
+
+@receiver(post_save, sender=Song)
+def song_feed_post_save(sender, instance, created, **kwargs):
+    if not created and not instance.tracker.changed():
         return
-    return
\ No newline at end of file
+    round_id = get_round_id(Appearance, instance.appearance_id, 'round')
+    publish_save(round_id, instance, created)
+    return
+
+@receiver(post_save, sender=Appearance)
+def appearance_feed_post_save(sender, instance, created, **kwargs):
+    publish_save(instance.round_id, instance, created)
+    return
+
+@receiver(post_transition, sender=Appearance)
+def appearance_feed_post_transition(sender, instance, name, source, target, **kwargs):
+    publish_transition(instance.round_id, instance, name, target)
+    return
+
+@receiver(post_transition, sender=Panelist)
+def panelist_feed_post_transition(sender, instance, name, source, target, **kwargs):
+    publish_transition(instance.round_id, instance, name, target)
+    return
+
+@receiver(post_transition, sender=Round)
+def round_feed_post_transition(sender, instance, name, source, target, **kwargs):
+    publish_transition(instance.id, instance, name, target)
+    return
+
+
+# Visibility
+def get_user_ids(person_ids):
+    return Person.objects.filter(
+        id__in=[x for x in person_ids if x],
+        user__isnull=False,
+    ).values_list('user', flat=True)
+
+def get_changed_user_ids(instance, fields, created):
+    """
+    Users whose visibility a save may have changed; none if no field in
+    `fields` changed.  A moved person leaves their old user to refresh too.
+    """
+    if not created and not any(instance.tracker.has_changed(x) for x in fields):
+        return []
+    person_ids = [instance.person_id]
+    if not created and instance.tracker.has_changed('person'):
+        person_ids.append(instance.tracker.previous('person'))
+    return list(get_user_ids(person_ids))
+
+@receiver(post_save, sender=Assignment)
+@receiver(post_delete, sender=Assignment)
+def assignment_visibility(sender, instance, **kwargs):
+    user_id = getattr(instance.person, 'user_id', None)
+    Visibility.objects.refresh_on_commit(user_ids=[user_id])
+    return
+
+@receiver(post_save, sender=Member)
+def member_visibility_post_save(sender, instance, created, **kwargs):
+    user_ids = get_changed_user_ids(
+        instance,
+        ['status', 'person', 'group'],
+        created,
+    )
+    if user_ids:
+        Visibility.objects.refresh_on_commit(user_ids=user_ids)
+    return
+
+@receiver(post_delete, sender=Member)
+def member_visibility_post_delete(sender, instance, **kwargs):
+    user_ids = list(get_user_ids([instance.person_id]))
+    Visibility.objects.refresh_on_commit(user_ids=user_ids)
+    return
+
+@receiver(post_save, sender=Panelist)
+def panelist_visibility_post_save(sender, instance, created, **kwargs):
+    # A panelist only grants their own user the round.
+    user_ids = get_changed_user_ids(
+        instance,
+        ['status', 'person'],
+        created,
+    )
+    if user_ids:
+        Visibility.objects.refresh_on_commit(user_ids=user_ids)
+    return
+
+@receiver(post_delete, sender=Panelist)
+def panelist_visibility_post_delete(sender, instance, **kwargs):
+    user_ids = list(get_user_ids([instance.person_id]))
+    Visibility.objects.refresh_on_commit(user_ids=user_ids)
+    return
+
+@receiver(post_save, sender=Person)
+def person_visibility(sender, instance, created, **kwargs):
+    # Relinked, e.g. by link_person_from_user; both users change.
+    if created or not instance.tracker.has_changed('user'):
+        return
+    user_ids = [instance.user_id, instance.tracker.previous('user')]
+    Visibility.objects.refresh_on_commit(user_ids=user_ids)
+    return
+
+@receiver(post_save, sender=Round)
+def round_visibility(sender, instance, created, **kwargs):
+    # New rounds are visible to the convention's officers.
+    if not created:
+        return
+    Visibility.objects.refresh_on_commit(round_ids=[instance.id])
+    return
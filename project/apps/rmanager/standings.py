@@ -0,0 +1,165 @@
+# Standard Library
+import json
+
+# Third-Party
+from django_redis import get_redis_connection
+
+# Django
+from django.apps import apps
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+class Standings(object):
+    """
+    Live standings held in Redis, one sorted set per round or session.
+
+    Round members are appearance ids and session members are group ids.
+    Each member is scored by a composite of total, singing and performance
+    points, so a reverse range is already in tie-break order; the totals
+    behind each member are kept in a companion hash.
+    """
+
+    # Composite weights.  Session totals stay well under 10,000 points, so
+    # the tie-breaks never spill into the next category.
+    TOT_WEIGHT = 10 ** 8
+    SNG_WEIGHT = 10 ** 4
+
+    # Standings are only live during a contest.
+    TIMEOUT = 60 * 60 * 24 * 7
+
+    FIELDS = (
+        'tot_points',
+        'sng_points',
+        'per_points',
+        'mus_points',
+        'tot_score',
+    )
+
+    def __init__(self, name, pk):
+        self.name = name
+        self.pk = pk
+        self.key = cache.make_key('standings_{0}_{1}'.format(name, pk))
+        self.totals_key = cache.make_key('standings_{0}_{1}_totals'.format(name, pk))
+        self.connection = get_redis_connection('default')
+
+    @classmethod
+    def for_round(cls, round_id):
+        return cls('round', round_id)
+
+    @classmethod
+    def for_session(cls, session_id):
+        return cls('session', session_id)
+
+    @classmethod
+    def get_composite(cls, totals):
+        return sum([
+            (totals.get('tot_points') or 0) * cls.TOT_WEIGHT,
+            (totals.get('sng_points') or 0) * cls.SNG_WEIGHT,
+            (totals.get('per_points') or 0),
+        ])
+
+    def exists(self):
+        return bool(self.connection.exists(self.key))
+
+    def update(self, rows):
+        """Set members from a dict of member id to totals."""
+        rows = {
+            k: {x: v.get(x) for x in self.FIELDS} for k, v in rows.items()
+        }
+        if not rows:
+            return
+        pipeline = self.connection.pipeline()
+        pipeline.zadd(self.key, {
+            str(k): self.get_composite(v) for k, v in rows.items()
+        })
+        pipeline.hset(self.totals_key, mapping={
+            str(k): json.dumps(v, cls=DjangoJSONEncoder) for k, v in rows.items()
+        })
+        pipeline.expire(self.key, self.TIMEOUT)
+        pipeline.expire(self.totals_key, self.TIMEOUT)
+        pipeline.execute()
+        return
+
+    def remove(self, members):
+        members = [str(x) for x in members]
+        if not members:
+            return
+        pipeline = self.connection.pipeline()
+        pipeline.zrem(self.key, *members)
+        pipeline.hdel(self.totals_key, *members)
+        pipeline.execute()
+        return
+
+    def clear(self):
+        self.connection.delete(self.key, self.totals_key)
+        return
+
+    def get_rows(self, members=None):
+        """Totals from the aggregates for `members`, or for all of them."""
+        if self.name == 'round':
+            AppearanceAggregate = apps.get_model('rmanager.appearanceaggregate')
+            rows = AppearanceAggregate.objects.filter(
+                appearance__round=self.pk,
+            )
+            if members is not None:
+                rows = rows.filter(appearance__in=members)
+            rows = rows.values('appearance', *self.FIELDS)
+            return {row.pop('appearance'): row for row in rows}
+        GroupAggregate = apps.get_model('rmanager.groupaggregate')
+        rows = GroupAggregate.objects.filter(
+            session=self.pk,
+        )
+        if members is not None:
+            rows = rows.filter(group__in=members)
+        rows = rows.values('group', *self.FIELDS)
+        return {row.pop('group'): row for row in rows}
+
+    def refresh(self, members):
+        """
+        Reload `members` from the aggregates.
+
+        Meant to run on commit, so the set only ever reflects committed
+        totals and a rolled-back score leaves it untouched.
+        """
+        self.update(self.get_rows(members))
+        return
+
+    def rebuild(self):
+        """Reload the whole set from the aggregates."""
+        rows = self.get_rows()
+        self.clear()
+        self.update(rows)
+        return rows
+
+    def get_standings(self, start=0, stop=-1):
+        """Ranked members with their totals; ties share a rank."""
+        if not self.exists():
+            self.rebuild()
+        members = self.connection.zrevrange(
+            self.key,
+            start,
+            stop,
+            withscores=True,
+        )
+        if not members:
+            return []
+        # Rank the first member by counting strictly higher composites.
+        top = members[0][1]
+        higher = self.connection.zcount(self.key, '({0}'.format(top), '+inf')
+        totals = self.connection.hmget(
+            self.totals_key,
+            [x[0] for x in members],
+        )
+        standings = []
+        rank = higher + 1
+        previous = top
+        for i, ((member, composite), row) in enumerate(zip(members, totals)):
+            if composite != previous:
+                rank = start + i + 1
+                previous = composite
+            row = json.loads(row) if row else {}
+            row['id'] = member.decode()
+            row['rank'] = rank
+            standings.append(row)
+        return standings
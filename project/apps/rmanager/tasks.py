@@ -2,12 +2,18 @@
 import logging
 
 # Third-Party
-from django_rq import job
 from django.core.mail import EmailMessage
 
 # Django
+from django.conf import settings
 from django.template.loader import render_to_string
 
+# First-Party
+from apps.bhs.jobs import coalesced_job
+
+# Local
+from .reports import get_cached_pdf
+
 
 log = logging.getLogger(__name__)
 
@@ -52,31 +58,19 @@ def build_email(template, context, subject, to, cc=[], bcc=[], attachments=[]):
     return email
 
 
-@job('high')
-def send_complete_email_from_appearance(appearance):
-    return appearance.send_complete_email()
-
-
-@job('high')
-def send_psa_email_from_panelist(panelist):
-    return panelist.send_psa_email()
-
-@job('high')
-def send_publish_email_from_round(round):
-    return round.send_publish_email()
-
-@job('high')
-def send_publish_report_email_from_round(round):
-    return round.send_publish_report_email()
-
-@job('high')
+@coalesced_job('high')
 def save_csa_from_appearance(appearance):
     return appearance.save_csa()
 
-@job('high')
+@coalesced_job('high')
 def save_psa_from_panelist(panelist):
     return panelist.save_psa()
 
-@job('high')
-def save_reports_from_round(round):
-    return round.save_reports()
+@coalesced_job('high')
+def save_cached_pdf(obj, key, method):
+    # Waits out a render already running in a web request.
+    return get_cached_pdf(
+        key,
+        getattr(obj, method),
+        wait=settings.REPORT_LOCK_TIMEOUT,
+    )
@@ -0,0 +1,185 @@
+# Standard Library
+import warnings
+
+# Third-Party
+import numpy as np
+
+# Django
+from django.apps import apps
+from django.contrib.postgres.fields import ArrayField
+from django.db import models
+from django.db import transaction
+from django.db.models import Case
+from django.db.models import Value
+from django.db.models import When
+from django.utils.timezone import now
+
+# First-Party
+from apps.bhs.generations import Generation
+from apps.bhs.generations import get_scopes
+
+
+class VarianceEngine(object):
+    """
+    Asterisks and Dixon's Q for every song in a round, from one query.
+
+    Official scores are held as a (song, panelist) array; cells without a
+    score are NaN.
+    """
+
+    # An asterisk is any score more than this far from its category average.
+    ASTERISK_DISTANCE = 5
+
+    # Dixon's Q critical values by panel size.
+    CONFIDENCE = {
+        3: 0.941,
+        6: .56,
+        9: .376,
+        12: .437,
+        15: .338,
+    }
+
+    def __init__(self, round):
+        self.round = round
+        Panelist = apps.get_model('rmanager.panelist')
+        Score = apps.get_model('rmanager.score')
+        rows = Score.objects.filter(
+            song__appearance__round=round,
+            panelist__kind=Panelist.KIND.official,
+            points__isnull=False,
+        ).values_list(
+            'song',
+            'panelist',
+            'panelist__category',
+            'points',
+        )
+        rows = list(rows)
+        columns = list(zip(*rows)) or [[]] * 4
+        self.songs = sorted(set(columns[0]))
+        self.panelists = sorted(set(columns[1]))
+        self.song_index = {v: i for i, v in enumerate(self.songs)}
+        self.panelist_index = {v: i for i, v in enumerate(self.panelists)}
+        self.array = np.full((len(self.songs), len(self.panelists)), np.nan)
+        if rows:
+            self.array[
+                [self.song_index[x] for x in columns[0]],
+                [self.panelist_index[x] for x in columns[1]],
+            ] = columns[3]
+        categories = dict(zip(columns[1], columns[2]))
+        self.categories = np.array(
+            [categories[x] for x in self.panelists],
+            dtype=int,
+        )
+
+    def get_asterisks(self):
+        """Boolean (song, category) flags, with the categories in order."""
+        categories = sorted(set(self.categories.tolist()))
+        flags = np.zeros((len(self.songs), len(categories)), dtype=bool)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', category=RuntimeWarning)
+            for i, category in enumerate(categories):
+                array = self.array[:, self.categories == category]
+                average = np.nanmean(array, axis=1, keepdims=True)
+                # Missing scores are NaN, which never compares greater.
+                distance = np.abs(array - average)
+                flags[:, i] = (distance > self.ASTERISK_DISTANCE).any(axis=1)
+        return flags, categories
+
+    def get_dixons(self):
+        """
+        Lists of Dixon's Q categories per song.
+
+        The lowest and highest scores are tested against their neighbours.
+        Panels smaller than three, or of a size without a critical value,
+        aren't tested.
+        """
+        dixons = [[] for _ in self.songs]
+        if not self.panelists:
+            return dixons
+        counts = np.count_nonzero(~np.isnan(self.array), axis=1)
+        # NaNs sort last, so the real scores are the first `count` columns.
+        order = np.argsort(self.array, axis=1)
+        ordered = np.take_along_axis(self.array, order, axis=1)
+        last = np.clip(counts - 1, 0, None)[:, None]
+        low = ordered[:, 0]
+        second = ordered[:, 1] if ordered.shape[1] > 1 else low
+        high = np.take_along_axis(ordered, last, axis=1)[:, 0]
+        penultimate = np.take_along_axis(
+            ordered,
+            np.clip(last - 1, 0, None),
+            axis=1,
+        )[:, 0]
+        low_category = self.categories[order[:, 0]]
+        high_category = self.categories[
+            np.take_along_axis(order, last, axis=1)[:, 0]
+        ]
+        spread = high - low
+        low_distance = second - low
+        high_distance = high - penultimate
+        with np.errstate(invalid='ignore', divide='ignore'):
+            low_q = low_distance / spread
+            high_q = high_distance / spread
+        for i, count in enumerate(counts.tolist()):
+            if count < 3 or not spread[i]:
+                continue
+            # Three-judge panels get the Q test too, as they always have.
+            critical = self.CONFIDENCE.get(count)
+            if critical is None:
+                continue
+            if low_q[i] > critical and low_distance[i] > 4:
+                dixons[i].append(int(low_category[i]))
+            if high_q[i] > critical and high_distance[i] > 4:
+                dixons[i].append(int(high_category[i]))
+        return dixons
+
+    def get_variances(self):
+        """Map each song id to its (asterisks, dixons) category lists."""
+        flags, categories = self.get_asterisks()
+        dixons = self.get_dixons()
+        variances = {}
+        for song_id, i in self.song_index.items():
+            asterisks = [c for c, flag in zip(categories, flags[i]) if flag]
+            variances[song_id] = (asterisks, sorted(set(dixons[i])))
+        return variances
+
+    def save(self, song_ids=None):
+        """
+        Write asterisks and dixons back in a single UPDATE.
+
+        Limited to `song_ids` if given.  Returns the ids of the songs that
+        have a variance.
+        """
+        Song = apps.get_model('rmanager.song')
+        variances = self.get_variances()
+        if song_ids is not None:
+            song_ids = set(song_ids)
+            variances = {k: v for k, v in variances.items() if k in song_ids}
+        if not variances:
+            return set()
+        output_field = ArrayField(base_field=models.IntegerField())
+        Song.objects.filter(
+            id__in=variances.keys(),
+        ).update(
+            asterisks=Case(
+                *[
+                    When(id=k, then=Value(v[0], output_field=output_field))
+                    for k, v in variances.items()
+                ],
+                output_field=output_field
+            ),
+            dixons=Case(
+                *[
+                    When(id=k, then=Value(v[1], output_field=output_field))
+                    for k, v in variances.items()
+                ],
+                output_field=output_field
+            ),
+            # Keyset walkers page by `modified`; see KeysetPagination.
+            modified=now(),
+        )
+        # The UPDATE skips the signals that would bump the generations.
+        scopes = get_scopes(self.round)
+        transaction.on_commit(
+            lambda: Generation().bump(scopes)
+        )
+        return set(k for k, v in variances.items() if v[0] or v[1])
@@ -16,11 +16,21 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 # Django
+from django.core.exceptions import ValidationError
 from django.core.files.base import ContentFile
 from django.db.models import Sum, Q, Avg
 from django.template.loader import render_to_string
 from django.utils.text import slugify
 
+# First-Party
+from apps.bhs.deferred import defer
+from apps.bhs.deferred import wants_async
+from apps.bhs.generations import ConditionalMixin
+from apps.bhs.jobs import get_reference
+from apps.bhs.optimizers import OptimizerMixin
+from apps.bhs.pagination import KeysetPagination
+from apps.bhs.responders import StreamingPDFResponse
+
 # Local
 from .filterbackends import AppearanceFilterBackend
 from .filterbackends import OutcomeFilterBackend
@@ -39,11 +49,12 @@ from .models import Score
 from .models import Song
 
 from .renderers import PDFRenderer
-from .renderers import XLSXRenderer
-from .responders import PDFResponse
-from .responders import XLSXResponse
+from .responders import PendingResponse
 from .renderers import DOCXRenderer
 from .responders import DOCXResponse
+from .reports import ReportPending
+from .reports import get_cached_pdf
+from .reports import has_cached_pdf
 
 from .serializers import AppearanceSerializer
 from .serializers import ContenderSerializer
@@ -53,6 +64,11 @@ from .serializers import RoundSerializer
 from .serializers import ScoreSerializer
 from .serializers import SongSerializer
 
+from .feeds import RoundFeed
+from .pipeline import RoundPipeline
+from .standings import Standings
+from .tasks import save_cached_pdf
+
 
 log = logging.getLogger(__name__)
 
@@ -74,16 +90,11 @@ class IgnoreClientContentNegotiation(BaseContentNegotiation):
         return (renderers[0], renderers[0].media_type)
 
 
-class AppearanceViewSet(viewsets.ModelViewSet):
-    queryset = Appearance.objects.select_related(
+class AppearanceViewSet(OptimizerMixin, viewsets.ModelViewSet):
+    queryset = Appearance.objects.order_by('id')
+    permission_related = [
         'round',
-        'group',
-        'entry',
-    ).prefetch_related(
-        'songs',
-        # 'contenders',
-        'statelogs',
-    ).order_by('id')
+    ]
     serializer_class = AppearanceSerializer
     filterset_class = None
     filter_backends = [
@@ -106,6 +117,27 @@ class AppearanceViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(object)
         return Response(serializer.data)
 
+    @action(methods=['post'], detail=True)
+    def scoresheet(self, request, pk=None, **kwargs):
+        """
+        Sets every score on the Appearance from one payload.
+        """
+        object = self.get_object()
+        scores = request.data.get('scores', [])
+        if not isinstance(scores, list):
+            return Response(
+                {'status': 'Scores must be a list.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            object.set_scoresheet(scores)
+        except ValidationError as e:
+            return Response(
+                e.message_dict,
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(object.get_scoresheet_totals())
+
     @action(methods=['post'], detail=True)
     def start(self, request, pk=None, **kwargs):
         object = self.get_object()
@@ -220,15 +252,19 @@ class AppearanceViewSet(viewsets.ModelViewSet):
     )
     def variance(self, request, pk=None):
         appearance = Appearance.objects.get(pk=pk)
-        if appearance.variance_report:
-            pdf = appearance.variance_report.file
-        else:
-            pdf = appearance.get_variance()
-        file_name = '{0} Variance Report.pdf'.format(appearance)
-        return PDFResponse(
+        key = appearance.get_fingerprint('reports/variance.html')
+        if wants_async(request) and not has_cached_pdf(key):
+            return defer(request, key, save_cached_pdf, get_reference(appearance), key, 'get_variance')
+        try:
+            pdf = get_cached_pdf(key, appearance.get_variance)
+        except ReportPending:
+            return PendingResponse()
+        file_name = '{0} Variance Report'.format(appearance)
+        return StreamingPDFResponse(
+            request,
             pdf,
             file_name=file_name,
-            status=status.HTTP_200_OK
+            etag=key,
         )
 
     @action(
@@ -245,25 +281,27 @@ class AppearanceViewSet(viewsets.ModelViewSet):
         Renders the Competitor Scoring Analysis in PDF
         """
         appearance = Appearance.objects.get(pk=pk)
-        if appearance.csa:
-            pdf = appearance.csa.file
-        else:
-            pdf = appearance.get_csa()
-        file_name = '{0} CSA.pdf'.format(appearance)
-        return PDFResponse(
+        key = appearance.get_fingerprint('reports/csa.html')
+        if wants_async(request) and not has_cached_pdf(key):
+            return defer(request, key, save_cached_pdf, get_reference(appearance), key, 'get_csa')
+        try:
+            pdf = get_cached_pdf(key, appearance.get_csa)
+        except ReportPending:
+            return PendingResponse()
+        file_name = '{0} CSA'.format(appearance)
+        return StreamingPDFResponse(
+            request,
             pdf,
             file_name=file_name,
-            status=status.HTTP_200_OK
+            etag=key,
         )
 
 
-class ContenderViewSet(viewsets.ModelViewSet):
-    queryset = Contender.objects.select_related(
-        'appearance',
-        'outcome',
-    ).prefetch_related(
-        'statelogs',
-    ).order_by('id')
+class ContenderViewSet(OptimizerMixin, viewsets.ModelViewSet):
+    queryset = Contender.objects.order_by('id')
+    permission_related = [
+        'outcome__round',
+    ]
     serializer_class = ContenderSerializer
     filter_backends = [
         DjangoFilterBackend,
@@ -302,14 +340,11 @@ class ContenderViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class OutcomeViewSet(viewsets.ModelViewSet):
-    queryset = Outcome.objects.select_related(
+class OutcomeViewSet(OptimizerMixin, viewsets.ModelViewSet):
+    queryset = Outcome.objects.order_by('id')
+    permission_related = [
         'round',
-        'award',
-    ).prefetch_related(
-        # 'contenders',
-        'statelogs',
-    ).order_by('id')
+    ]
     serializer_class = OutcomeSerializer
     filter_backends = [
         DjangoFilterBackend,
@@ -321,14 +356,11 @@ class OutcomeViewSet(viewsets.ModelViewSet):
     resource_name = "outcome"
 
 
-class PanelistViewSet(viewsets.ModelViewSet):
-    queryset = Panelist.objects.select_related(
+class PanelistViewSet(OptimizerMixin, viewsets.ModelViewSet):
+    queryset = Panelist.objects.order_by('id')
+    permission_related = [
         'round',
-        'person',
-    ).prefetch_related(
-        'scores',
-        'statelogs',
-    ).order_by('id')
+    ]
     serializer_class = PanelistSerializer
     filter_backends = [
         DjangoFilterBackend,
@@ -349,28 +381,27 @@ class PanelistViewSet(viewsets.ModelViewSet):
     )
     def psa(self, request, pk=None):
         panelist = Panelist.objects.get(pk=pk)
-        if panelist.psa:
-            pdf = panelist.psa.file
-        else:
-            pdf = panelist.get_psa()
-        file_name = '{0} PSA.pdf'.format(panelist)
-        return PDFResponse(
+        key = panelist.get_fingerprint('reports/psa.html')
+        if wants_async(request) and not has_cached_pdf(key):
+            return defer(request, key, save_cached_pdf, get_reference(panelist), key, 'get_psa')
+        try:
+            pdf = get_cached_pdf(key, panelist.get_psa)
+        except ReportPending:
+            return PendingResponse()
+        file_name = '{0} PSA'.format(panelist)
+        return StreamingPDFResponse(
+            request,
             pdf,
             file_name=file_name,
-            status=status.HTTP_200_OK
+            etag=key,
         )
 
 
-class RoundViewSet(viewsets.ModelViewSet):
-    queryset = Round.objects.select_related(
+class RoundViewSet(ConditionalMixin, OptimizerMixin, viewsets.ModelViewSet):
+    queryset = Round.objects.order_by('id')
+    permission_related = [
         'session',
-    ).prefetch_related(
-        'appearances',
-        'panelists',
-        'grids',
-        'outcomes',
-        'statelogs',
-    ).distinct().order_by('id')
+    ]
     serializer_class = RoundSerializer
     filterset_class = RoundFilterset
     filter_backends = [
@@ -380,6 +411,7 @@ class RoundViewSet(viewsets.ModelViewSet):
         DRYPermissions,
     ]
     resource_name = "round"
+    generation_scopes = ('rmanager', 'stage')
 
     @action(methods=['get'], detail=True)
     def mock(self, request, pk=None, **kwargs):
@@ -474,6 +506,38 @@ class RoundViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(object)
         return Response(serializer.data)
 
+    @action(methods=['get'], detail=True)
+    def feed(self, request, pk=None, **kwargs):
+        object = self.get_object()
+        try:
+            wait = int(request.query_params.get('wait', 0))
+        except ValueError:
+            return Response(
+                {'status': 'Wait must be a number of seconds.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        cursor, events = RoundFeed(object.id).read(
+            cursor=request.query_params.get('cursor'),
+            wait=wait,
+        )
+        return Response({
+            'cursor': cursor,
+            'events': events,
+        })
+
+    @action(methods=['get'], detail=True)
+    def standings(self, request, pk=None, **kwargs):
+        object = self.get_object()
+        return Response({
+            'round': Standings.for_round(object.id).get_standings(),
+            'session': Standings.for_session(object.session_id).get_standings(),
+        })
+
+    @action(methods=['get'], detail=True)
+    def pipeline(self, request, pk=None, **kwargs):
+        object = self.get_object()
+        return Response(RoundPipeline(object.id).get_progress())
+
     @action(
         methods=['get'],
         detail=True,
@@ -489,15 +553,19 @@ class RoundViewSet(viewsets.ModelViewSet):
             'session__convention',
             'session__convention__venue',
         ).get(pk=pk)
-        if round.oss:
-            pdf = round.oss.file
-        else:
-            pdf = round.get_oss()
-        file_name = '{0} OSS.pdf'.format(round)
-        return PDFResponse(
+        key = round.get_fingerprint('reports/oss.html')
+        if wants_async(request) and not has_cached_pdf(key):
+            return defer(request, key, save_cached_pdf, get_reference(round), key, 'get_oss')
+        try:
+            pdf = get_cached_pdf(key, round.get_oss)
+        except ReportPending:
+            return PendingResponse()
+        file_name = '{0} OSS'.format(round)
+        return StreamingPDFResponse(
+            request,
             pdf,
             file_name=file_name,
-            status=status.HTTP_200_OK
+            etag=key,
         )
 
 
@@ -512,15 +580,19 @@ class RoundViewSet(viewsets.ModelViewSet):
     )
     def legacy(self, request, pk=None):
         round = Round.objects.get(pk=pk)
-        if round.legacy_oss:
-            pdf = round.legacy_oss.file
-        else:
-            pdf = round.get_legacy_oss()
-        file_name = '{0} Legacy OSS.pdf'.format(round)
-        return PDFResponse(
+        key = round.get_fingerprint('reports/legacy_oss.html')
+        if wants_async(request) and not has_cached_pdf(key):
+            return defer(request, key, save_cached_pdf, get_reference(round), key, 'get_legacy_oss')
+        try:
+            pdf = get_cached_pdf(key, round.get_legacy_oss)
+        except ReportPending:
+            return PendingResponse()
+        file_name = '{0} Legacy OSS'.format(round)
+        return StreamingPDFResponse(
+            request,
             pdf,
             file_name=file_name,
-            status=status.HTTP_200_OK
+            etag=key,
         )
 
 
@@ -536,15 +608,19 @@ class RoundViewSet(viewsets.ModelViewSet):
     def legacyoss(self, request, pk=None):
         round = Round.objects.select_related(
         ).get(pk=pk)
-        if round.legacy_oss:
-            pdf = round.legacy_oss.file
-        else:
-            pdf = round.get_legacy_oss()
-        file_name = '{0} Legacy OSS.pdf'.format(round)
-        return PDFResponse(
+        key = round.get_fingerprint('reports/legacy_oss.html')
+        if wants_async(request) and not has_cached_pdf(key):
+            return defer(request, key, save_cached_pdf, get_reference(round), key, 'get_legacy_oss')
+        try:
+            pdf = get_cached_pdf(key, round.get_legacy_oss)
+        except ReportPending:
+            return PendingResponse()
+        file_name = '{0} Legacy OSS'.format(round)
+        return StreamingPDFResponse(
+            request,
             pdf,
             file_name=file_name,
-            status=status.HTTP_200_OK
+            etag=key,
         )
 
 
@@ -567,10 +643,10 @@ class RoundViewSet(viewsets.ModelViewSet):
             round.session.get_kind_display(),
             round.get_kind_display(),
         )
-        return PDFResponse(
+        return StreamingPDFResponse(
+            request,
             pdf,
             file_name=file_name,
-            status=status.HTTP_200_OK
         )
 
 
@@ -587,19 +663,23 @@ class RoundViewSet(viewsets.ModelViewSet):
             'session__convention',
             'session__convention__venue',
         ).get(pk=pk)
-        if round.sa:
-            pdf = round.sa.file
-        else:
-            pdf = round.get_sa()
+        key = round.get_fingerprint('reports/sa.html')
+        if wants_async(request) and not has_cached_pdf(key):
+            return defer(request, key, save_cached_pdf, get_reference(round), key, 'get_sa')
+        try:
+            pdf = get_cached_pdf(key, round.get_sa)
+        except ReportPending:
+            return PendingResponse()
         file_name = '{0} {1} {2} SA'.format(
             round.session.convention,
             round.session.get_kind_display(),
             round.get_kind_display(),
         )
-        return PDFResponse(
+        return StreamingPDFResponse(
+            request,
             pdf,
             file_name=file_name,
-            status=status.HTTP_200_OK
+            etag=key,
         )
 
 
@@ -628,12 +708,12 @@ class RoundViewSet(viewsets.ModelViewSet):
         )
 
 
-class ScoreViewSet(viewsets.ModelViewSet):
-    queryset = Score.objects.select_related(
-        'song',
-        'panelist',
-    ).prefetch_related(
-    ).order_by('id')
+class ScoreViewSet(OptimizerMixin, viewsets.ModelViewSet):
+    queryset = Score.objects.order_by('id')
+    permission_related = [
+        'panelist__person',
+        'song__appearance__round',
+    ]
     serializer_class = ScoreSerializer
     filterset_class = ScoreFilterset
     filter_backends = [
@@ -643,16 +723,15 @@ class ScoreViewSet(viewsets.ModelViewSet):
     permission_classes = [
         DRYPermissions,
     ]
+    pagination_class = KeysetPagination
     resource_name = "score"
 
 
-class SongViewSet(viewsets.ModelViewSet):
-    queryset = Song.objects.select_related(
-        'appearance',
-        'chart',
-    ).prefetch_related(
-        'scores',
-    ).order_by('id')
+class SongViewSet(OptimizerMixin, viewsets.ModelViewSet):
+    queryset = Song.objects.order_by('id')
+    permission_related = [
+        'appearance__round',
+    ]
     serializer_class = SongSerializer
     filterset_class = None
     filter_backends = [
@@ -662,5 +741,6 @@ class SongViewSet(viewsets.ModelViewSet):
     permission_classes = [
         DRYPermissions,
     ]
+    pagination_class = KeysetPagination
     resource_name = "song"
 
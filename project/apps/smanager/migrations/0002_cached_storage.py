@@ -0,0 +1,25 @@
+# Generated by Django 2.1.9 on 2019-07-01 09:41
+
+import apps.bhs.storages
+import apps.smanager.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('smanager', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='session',
+            name='drcj_report',
+            field=models.FileField(blank=True, default='', storage=apps.bhs.storages.CachedStorage(backend='cloudinary_storage.storage.RawMediaCloudinaryStorage'), upload_to=apps.smanager.fields.FileUploadPath()),
+        ),
+        migrations.AlterField(
+            model_name='session',
+            name='legacy_report',
+            field=models.FileField(blank=True, default='', storage=apps.bhs.storages.CachedStorage(backend='cloudinary_storage.storage.RawMediaCloudinaryStorage'), upload_to=apps.smanager.fields.FileUploadPath()),
+        ),
+    ]
@@ -13,7 +13,6 @@ from dry_rest_permissions.generics import allow_staff_or_superuser
 from dry_rest_permissions.generics import authenticated_users
 from model_utils import Choices
 from model_utils.models import TimeStampedModel
-from cloudinary_storage.storage import RawMediaCloudinaryStorage
 from openpyxl import Workbook
 from openpyxl.writer.excel import save_virtual_workbook
 
@@ -27,6 +26,10 @@ from django.db.models import Q
 from django.db.models import Func
 from django.db.models import F
 
+# First-Party
+from apps.bhs.permissions import PermissionContext
+from apps.bhs.storages import CachedStorage
+
 from .fields import FileUploadPath
 from .tasks import build_email
 from .tasks import send_invite_email_from_entry
@@ -137,10 +140,7 @@ class Contest(TimeStampedModel):
     @authenticated_users
     def has_write_permission(request):
         return any([
-            request.user.person.officers.filter(
-                office__lt=300,
-                status__gt=0,
-            ),
+            PermissionContext.for_request(request).has_office(below=300),
         ])
 
 
@@ -149,11 +149,7 @@ class Contest(TimeStampedModel):
     def has_object_write_permission(self, request):
         return any([
             all([
-                self.session.convention.assignments.filter(
-                    person__user=request.user,
-                    status__gt=0,
-                    category__lte=10,
-                ),
+                PermissionContext.for_request(request).is_officer(self.session.convention_id),
                 # self.session.status < self.session.STATUS.opened,
             ]),
         ])
@@ -242,10 +238,7 @@ class Contestant(TimeStampedModel):
     @authenticated_users
     def has_write_permission(request):
         return any([
-            request.user.person.officers.filter(
-                office__lt=500,
-                status__gt=0,
-            ),
+            PermissionContext.for_request(request).has_office(below=500),
         ])
 
     @allow_staff_or_superuser
@@ -253,18 +246,11 @@ class Contestant(TimeStampedModel):
     def has_object_write_permission(self, request):
         return any([
             all([
-                self.contest.session.convention.assignments.filter(
-                    person__user=request.user,
-                    status__gt=0,
-                    category__lte=10,
-                ),
+                PermissionContext.for_request(request).is_officer(self.contest.session.convention_id),
                 self.contest.session.status < self.contest.session.STATUS.packaged,
             ]),
             all([
-                self.entry.group.officers.filter(
-                    person__user=request.user,
-                    status__gt=0,
-                ),
+                PermissionContext.for_request(request).is_group_officer(self.entry.group_id),
                 self.entry.status < self.entry.STATUS.approved,
             ]),
         ])
@@ -441,10 +427,7 @@ class Entry(TimeStampedModel):
     @authenticated_users
     def has_write_permission(request):
         return any([
-            request.user.person.officers.filter(
-                office__lt=500,
-                status__gt=0,
-            ),
+            PermissionContext.for_request(request).has_office(below=500),
         ])
 
     @allow_staff_or_superuser
@@ -453,19 +436,12 @@ class Entry(TimeStampedModel):
         return any([
             # For DRCJs
             all([
-                self.session.convention.assignments.filter(
-                    person__user=request.user,
-                    status__gt=0,
-                    category__lt=10,
-                ),
+                PermissionContext.for_request(request).is_drcj(self.session.convention_id),
                 self.session.status < self.session.STATUS.packaged,
             ]),
             # For Groups
             all([
-                self.group.officers.filter(
-                    person__user=request.user,
-                    status__gt=0,
-                ),
+                PermissionContext.for_request(request).is_group_officer(self.group_id),
                 self.status <= self.STATUS.approved,
             ]),
         ])
@@ -805,14 +781,18 @@ class Session(TimeStampedModel):
         upload_to=FileUploadPath(),
         blank=True,
         default='',
-        storage=RawMediaCloudinaryStorage(),
+        storage=CachedStorage(
+            backend='cloudinary_storage.storage.RawMediaCloudinaryStorage',
+        ),
     )
 
     drcj_report = models.FileField(
         upload_to=FileUploadPath(),
         blank=True,
         default='',
-        storage=RawMediaCloudinaryStorage(),
+        storage=CachedStorage(
+            backend='cloudinary_storage.storage.RawMediaCloudinaryStorage',
+        ),
     )
 
     # FKs
@@ -1387,10 +1367,7 @@ class Session(TimeStampedModel):
     @authenticated_users
     def has_write_permission(request):
         return any([
-            request.user.person.officers.filter(
-                office__lt=300,
-                status__gt=0,
-            ),
+            PermissionContext.for_request(request).has_office(below=300),
         ])
 
 
@@ -1399,11 +1376,7 @@ class Session(TimeStampedModel):
     def has_object_write_permission(self, request):
         return any([
             all([
-                self.convention.assignments.filter(
-                    person__user=request.user,
-                    status__gt=0,
-                    category=self.convention.assignments.model.CATEGORY.drcj,
-                ),
+                PermissionContext.for_request(request).is_drcj(self.convention_id),
                 self.status < self.STATUS.finished,
             ]),
         ])
@@ -1,9 +1,12 @@
 
 # Third-Party
-from dry_rest_permissions.generics import DRYPermissionsField
 from rest_framework.validators import UniqueTogetherValidator
 from rest_framework_json_api import serializers
 
+# First-Party
+from apps.bhs.permissions import PermissionsField
+from apps.bhs.permissions import PermissionsMixin
+
 # Local
 from .fields import TimezoneField
 
@@ -14,8 +17,8 @@ from .models import Session
 
 
 
-class ContestSerializer(serializers.ModelSerializer):
-    permissions = DRYPermissionsField()
+class ContestSerializer(PermissionsMixin, serializers.ModelSerializer):
+    permissions = PermissionsField()
     included_serializers = {
         'contestants': 'apps.smanager.serializers.ContestantSerializer',
     }
@@ -40,8 +43,8 @@ class ContestSerializer(serializers.ModelSerializer):
         ]
 
 
-class ContestantSerializer(serializers.ModelSerializer):
-    permissions = DRYPermissionsField()
+class ContestantSerializer(PermissionsMixin, serializers.ModelSerializer):
+    permissions = PermissionsField()
 
     class Meta:
         model = Contestant
@@ -55,8 +58,8 @@ class ContestantSerializer(serializers.ModelSerializer):
         )
 
 
-class EntrySerializer(serializers.ModelSerializer):
-    permissions = DRYPermissionsField()
+class EntrySerializer(PermissionsMixin, serializers.ModelSerializer):
+    permissions = PermissionsField()
     statelogs = serializers.PrimaryKeyRelatedField(many=True, read_only=True)
     included_serializers = {
         'contestants': 'apps.smanager.serializers.ContestantSerializer',
@@ -101,8 +104,8 @@ class EntrySerializer(serializers.ModelSerializer):
         return data
 
 
-class SessionSerializer(serializers.ModelSerializer):
-    permissions = DRYPermissionsField()
+class SessionSerializer(PermissionsMixin, serializers.ModelSerializer):
+    permissions = PermissionsField()
 
     included_serializers = {
         'contests': 'apps.smanager.serializers.ContestSerializer',
@@ -2,12 +2,14 @@
 import logging
 
 # Third-Party
-from django_rq import job
 from django.core.mail import EmailMessage
 
 # Django
 from django.template.loader import render_to_string
 
+# First-Party
+from apps.bhs.jobs import coalesced_job
+
 
 log = logging.getLogger(__name__)
 
@@ -52,42 +54,50 @@ def build_email(template, context, subject, to, cc=[], bcc=[], attachments=[]):
     return email
 
 
-@job('high')
+@coalesced_job('high')
 def send_invite_email_from_entry(entry):
     return entry.send_invite_email()
 
-@job('high')
+@coalesced_job('high')
 def send_withdraw_email_from_entry(entry):
     return entry.send_withdraw_email()
 
-@job('high')
+@coalesced_job('high')
 def send_submit_email_from_entry(entry):
     return entry.send_submit_email()
 
-@job('high')
+@coalesced_job('high')
 def send_approve_email_from_entry(entry):
     return entry.send_approve_email()
 
-@job('high')
+@coalesced_job('high')
 def send_open_email_from_session(session):
     return session.send_open_email()
 
-@job('high')
+@coalesced_job('high')
 def send_close_email_from_session(session):
     return session.send_close_email()
 
-@job('high')
+@coalesced_job('high')
 def send_verify_email_from_session(session):
     return session.send_verify_email()
 
-@job('high')
+@coalesced_job('high')
 def send_verify_report_email_from_session(session):
     return session.send_verify_report_email()
 
-@job('high')
+@coalesced_job('high')
 def send_package_email_from_session(session):
     return session.send_package_email()
 
-@job('high')
+@coalesced_job('high')
 def send_package_report_email_from_session(session):
     return session.send_package_report_email()
+
+@coalesced_job('high')
+def save_drcj_from_session(session):
+    return session.save_drcj()
+
+@coalesced_job('high')
+def save_legacy_from_session(session):
+    return session.save_legacy()
@@ -21,6 +21,14 @@ from django.db.models import Sum, Q, Avg
 from django.template.loader import render_to_string
 from django.utils.text import slugify
 
+# First-Party
+from apps.bhs.deferred import defer
+from apps.bhs.deferred import wants_async
+from apps.bhs.generations import ConditionalMixin
+from apps.bhs.jobs import get_reference
+from apps.bhs.optimizers import OptimizerMixin
+from apps.bhs.responders import StreamingXLSXResponse
+
 # Local
 from .filtersets import SessionFilterset
 
@@ -28,14 +36,13 @@ from .models import Contest
 from .models import Contestant
 from .models import Entry
 from .models import Session
-from .renderers import PDFRenderer
 from .renderers import XLSXRenderer
-from .responders import PDFResponse
-from .responders import XLSXResponse
 from .serializers import ContestantSerializer
 from .serializers import ContestSerializer
 from .serializers import EntrySerializer
 from .serializers import SessionSerializer
+from .tasks import save_drcj_from_session
+from .tasks import save_legacy_from_session
 
 
 log = logging.getLogger(__name__)
@@ -58,15 +65,11 @@ class IgnoreClientContentNegotiation(BaseContentNegotiation):
         return (renderers[0], renderers[0].media_type)
 
 
-class ContestViewSet(viewsets.ModelViewSet):
-    queryset = Contest.objects.select_related(
+class ContestViewSet(OptimizerMixin, viewsets.ModelViewSet):
+    queryset = Contest.objects.order_by('id')
+    permission_related = [
         'session',
-        'award',
-        'group',
-    ).prefetch_related(
-        'contestants',
-        'statelogs',
-    ).order_by('id')
+    ]
     serializer_class = ContestSerializer
     filterset_class = None
     filter_backends = [
@@ -106,13 +109,12 @@ class ContestViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class ContestantViewSet(viewsets.ModelViewSet):
-    queryset = Contestant.objects.select_related(
+class ContestantViewSet(OptimizerMixin, viewsets.ModelViewSet):
+    queryset = Contestant.objects.order_by('id')
+    permission_related = [
+        'contest__session',
         'entry',
-        'contest',
-    ).prefetch_related(
-        'statelogs',
-    ).order_by('id')
+    ]
     serializer_class = ContestantSerializer
     filter_backends = [
         DjangoFilterBackend,
@@ -151,14 +153,11 @@ class ContestantViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class EntryViewSet(viewsets.ModelViewSet):
-    queryset = Entry.objects.select_related(
+class EntryViewSet(OptimizerMixin, viewsets.ModelViewSet):
+    queryset = Entry.objects.order_by('id')
+    permission_related = [
         'session',
-        'group',
-    ).prefetch_related(
-        'contestants',
-        'statelogs',
-    ).order_by('id')
+    ]
     serializer_class = EntrySerializer
     filter_backends = [
         DjangoFilterBackend,
@@ -239,15 +238,8 @@ class EntryViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class SessionViewSet(viewsets.ModelViewSet):
-    queryset = Session.objects.select_related(
-        'convention',
-    ).prefetch_related(
-        'contests',
-        'entries',
-        'rounds',
-        'statelogs',
-    ).order_by('id')
+class SessionViewSet(ConditionalMixin, OptimizerMixin, viewsets.ModelViewSet):
+    queryset = Session.objects.order_by('id')
     serializer_class = SessionSerializer
     filterset_class = SessionFilterset
     filter_backends = [
@@ -257,6 +249,7 @@ class SessionViewSet(viewsets.ModelViewSet):
         DRYPermissions,
     ]
     resource_name = "session"
+    generation_scopes = ('smanager', 'rmanager')
 
     @action(methods=['post'], detail=True)
     def build(self, request, pk=None, **kwargs):
@@ -351,18 +344,25 @@ class SessionViewSet(viewsets.ModelViewSet):
     )
     def legacy(self, request, pk=None):
         session = Session.objects.get(pk=pk)
+        if wants_async(request) and not session.legacy_report:
+            key = 'session_{0}_legacy'.format(session.id)
+            return defer(request, key, save_legacy_from_session, get_reference(session))
         if session.legacy_report:
-            xlsx = session.legacy_report.file
+            # Streamed from storage; the session is saved with the report.
+            xlsx = session.legacy_report
+            last_modified = session.modified
         else:
             xlsx = session.get_legacy()
+            last_modified = None
         file_name = '{0} {1} Session Legacy Report'.format(
             session.convention,
             session.get_kind_display(),
         )
-        return XLSXResponse(
+        return StreamingXLSXResponse(
+            request,
             xlsx,
             file_name=file_name,
-            status=status.HTTP_200_OK
+            last_modified=last_modified,
         )
 
     @action(
@@ -374,16 +374,23 @@ class SessionViewSet(viewsets.ModelViewSet):
     )
     def drcj(self, request, pk=None):
         session = Session.objects.get(pk=pk)
+        if wants_async(request) and not session.drcj_report:
+            key = 'session_{0}_drcj'.format(session.id)
+            return defer(request, key, save_drcj_from_session, get_reference(session))
         if session.drcj_report:
-            xlsx = session.drcj_report.file
+            # Streamed from storage; the session is saved with the report.
+            xlsx = session.drcj_report
+            last_modified = session.modified
         else:
             xlsx = session.get_drcj()
+            last_modified = None
         file_name = '{0} {1} Session DRCJ Report'.format(
             session.convention,
             session.get_kind_display(),
         )
-        return XLSXResponse(
+        return StreamingXLSXResponse(
+            request,
             xlsx,
             file_name=file_name,
-            status=status.HTTP_200_OK
+            last_modified=last_modified,
         )
@@ -1,14 +1,16 @@
-from dry_rest_permissions.generics import DRYPermissionsField
 from rest_framework_json_api import serializers
 
+from apps.bhs.permissions import PermissionsField
+from apps.bhs.permissions import PermissionsMixin
+
 from .fields import TimezoneField
 
 from .models import Grid
 from .models import Venue
 
 
-class GridSerializer(serializers.ModelSerializer):
-    permissions = DRYPermissionsField()
+class GridSerializer(PermissionsMixin, serializers.ModelSerializer):
+    permissions = PermissionsField()
 
     class Meta:
         model = Grid
@@ -33,9 +35,9 @@ class GridSerializer(serializers.ModelSerializer):
         ]
 
 
-class VenueSerializer(serializers.ModelSerializer):
+class VenueSerializer(PermissionsMixin, serializers.ModelSerializer):
     timezone = TimezoneField(allow_null=True)
-    permissions = DRYPermissionsField()
+    permissions = PermissionsField()
 
     class Meta:
         model = Venue
@@ -154,6 +154,19 @@ RQ_QUEUES = {
 }
 RQ_SHOW_ADMIN_LINK = True
 
+# Reports
+REPORT_PROCESSES = os.cpu_count() or 1
+# Longest a single render may hold its lock, and how long other requests
+# for the same report wait on it before answering 202.
+REPORT_LOCK_TIMEOUT = 60 * 5
+REPORT_WAIT = 15
+
+# Round feed
+# Longest a feed read may block, in seconds.  The web workers are
+# synchronous (see the Procfile), so a blocked read holds one for all of
+# its wait; keep it short and let clients poll again.
+FEED_WAIT = 5
+
 # Auth0
 AUTH0_CLIENT_ID = get_env_variable("AUTH0_CLIENT_ID")
 AUTH0_CLIENT_SECRET = get_env_variable("AUTH0_CLIENT_SECRET")
@@ -188,7 +201,15 @@ ALGOLIA = {
 
 # Cloudinary
 CLOUDINARY_URL = get_env_variable("CLOUDINARY_URL")
-DEFAULT_FILE_STORAGE = 'cloudinary_storage.storage.MediaCloudinaryStorage'
+DEFAULT_FILE_STORAGE = 'apps.bhs.storages.CachedStorage'
+
+# Local disk cache in front of Cloudinary; see CachedStorage.
+MEDIA_CACHE = {
+    'BACKEND': 'cloudinary_storage.storage.MediaCloudinaryStorage',
+    'LOCATION': os.path.join(BASE_DIR, 'mediacache'),
+    'MAX_SIZE': 512 * 1024 * 1024,
+    'MAX_AGE': 60,
+}
 
 # Rest Framework (JSONAPI)
 REST_FRAMEWORK = {
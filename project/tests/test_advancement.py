@@ -0,0 +1,128 @@
+# Third-Party
+import pytest
+
+# First-Party
+from apps.rmanager.advancement import AdvancementEngine
+from apps.rmanager.models import Appearance
+from apps.rmanager.models import AppearanceAggregate
+from apps.rmanager.models import Round
+from factories import AppearanceFactory
+from factories import ConventionFactory
+from factories import RoundFactory
+from factories import SessionFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def make_round(district, spots, standings):
+    """
+    A round with one verified multi-round appearance per standing.
+
+    Each standing is (tot_points, sng_points, per_points, tot_score).
+    """
+    convention = ConventionFactory(district=district)
+    session = SessionFactory(convention=convention)
+    round = RoundFactory(
+        session=session,
+        kind=Round.KIND.semis,
+        spots=spots,
+    )
+    for num, (tot, sng, per, score) in enumerate(standings, start=1):
+        appearance = AppearanceFactory(
+            round=round,
+            num=num,
+            status=Appearance.STATUS.verified,
+            is_single=False,
+        )
+        AppearanceAggregate.objects.create(
+            appearance=appearance,
+            tot_points=tot,
+            sng_points=sng,
+            per_points=per,
+            tot_score=score,
+        )
+    # Neither of these is ever in the draw.
+    AppearanceFactory(round=round, num=90, status=Appearance.STATUS.verified, is_single=True)
+    AppearanceFactory(round=round, num=91, status=Appearance.STATUS.new, is_single=False)
+    return round
+
+
+def old_advancers(round):
+    """The advancers and mic tester as Round.complete used to pick them."""
+    multis = round.appearances.filter(
+        status=Appearance.STATUS.verified,
+        is_single=False,
+    )
+    ordering = (
+        '-aggregate__tot_points',
+        '-aggregate__sng_points',
+        '-aggregate__per_points',
+    )
+    spots = round.spots
+    if not spots:
+        return set(x.id for x in multis), None
+    if round.session.convention.district == 'BHS':
+        ordered = list(multis.order_by(*ordering))
+        advancers = [x.id for x in ordered[:spots]]
+        mt = ordered[spots].id if len(ordered) > spots else None
+        return set(advancers), mt
+    automatics = multis.filter(aggregate__tot_score__gte=73.0)
+    advancers = [x.id for x in automatics]
+    remains = list(multis.exclude(id__in=advancers).order_by(*ordering))
+    diff = spots - len(advancers)
+    if diff > 0:
+        advancers += [x.id for x in remains[:diff]]
+        remains = remains[diff:]
+    mt = remains[0].id if remains else None
+    return set(advancers), mt
+
+
+def get_nums(round, ids):
+    nums = dict(round.appearances.values_list('id', 'num'))
+    return sorted(nums[x] for x in ids)
+
+
+# Totals tie between 2 and 3, broken by singing; totals and singing tie
+# between 4 and 5, broken by performance.
+STANDINGS = [
+    (1500, 500, 500, 75.0),
+    (1400, 480, 460, 74.0),
+    (1400, 490, 450, 74.0),
+    (1300, 440, 430, 72.0),
+    (1300, 440, 440, 72.0),
+    (1200, 400, 400, 66.0),
+]
+
+
+@pytest.mark.parametrize('district, spots, advancers, mt', [
+    ('BHS', 0, [1, 2, 3, 4, 5, 6], None),
+    ('BHS', 2, [1, 3], 2),
+    ('BHS', 4, [1, 2, 3, 5], 4),
+    ('BHS', 6, [1, 2, 3, 4, 5, 6], None),
+    # Three automatics take more than the two spots.
+    ('FWD', 2, [1, 2, 3], 5),
+    ('FWD', 4, [1, 2, 3, 5], 4),
+])
+def test_matches_old_advancers(district, spots, advancers, mt):
+    round = make_round(district, spots, STANDINGS)
+    engine = AdvancementEngine(round)
+    new_advancers, new_mt = engine.get_advancers()
+    old = old_advancers(round)
+    assert (set(new_advancers), new_mt) == old
+    assert get_nums(round, new_advancers) == advancers
+    assert get_nums(round, [new_mt] if new_mt else []) == ([mt] if mt else [])
+
+
+def test_save_writes_draws_and_modified():
+    round = make_round('BHS', 2, STANDINGS)
+    round.appearances.update(draw=7)
+    before = dict(round.appearances.values_list('id', 'modified'))
+    draws = AdvancementEngine(round).save()
+    rows = dict(round.appearances.values_list('num', 'draw'))
+    assert sorted([rows[1], rows[3]]) == [1, 2]
+    assert rows[2] == 0
+    # Everyone else is reset.
+    assert [rows[x] for x in [4, 5, 6, 90, 91]] == [None] * 5
+    assert len(draws) == 3
+    for appearance_id, modified in round.appearances.values_list('id', 'modified'):
+        assert modified > before[appearance_id]
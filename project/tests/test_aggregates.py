@@ -0,0 +1,174 @@
+# Third-Party
+import pytest
+
+# Django
+from django.db.models import Avg
+from django.db.models import Q
+from django.db.models import StdDev
+from django.db.models import Sum
+
+# First-Party
+from apps.rmanager.models import Appearance
+from apps.rmanager.models import AppearanceAggregate
+from apps.rmanager.models import GroupAggregate
+from apps.rmanager.models import Panelist
+from apps.rmanager.models import Round
+from apps.rmanager.models import Score
+from apps.rmanager.models import Song
+from apps.rmanager.models import SongAggregate
+from factories import AppearanceFactory
+from factories import GroupFactory
+from factories import PanelistFactory
+from factories import RoundFactory
+from factories import ScoreFactory
+from factories import SessionFactory
+from factories import SongFactory
+
+pytestmark = pytest.mark.django_db
+
+CATEGORIES = {
+    'mus': Panelist.CATEGORY.music,
+    'per': Panelist.CATEGORY.performance,
+    'sng': Panelist.CATEGORY.singing,
+}
+
+
+@pytest.fixture
+def session():
+    """Two rounds of two groups, with a practice judge and a blank score."""
+    session = SessionFactory()
+    groups = [GroupFactory(), GroupFactory()]
+    points = iter(range(60, 1000))
+    for round_num, kind in enumerate([Round.KIND.semis, Round.KIND.finals], start=1):
+        round = RoundFactory(session=session, num=round_num, kind=kind)
+        panelists = [
+            PanelistFactory(round=round, num=num, category=category)
+            for num, category in enumerate([
+                Panelist.CATEGORY.music,
+                Panelist.CATEGORY.music,
+                Panelist.CATEGORY.performance,
+                Panelist.CATEGORY.singing,
+            ], start=1)
+        ]
+        panelists.append(PanelistFactory(
+            round=round,
+            num=5,
+            category=Panelist.CATEGORY.singing,
+            kind=Panelist.KIND.practice,
+        ))
+        for num, group in enumerate(groups, start=1):
+            appearance = AppearanceFactory(round=round, num=num, group=group)
+            for song_num in [1, 2]:
+                song = SongFactory(appearance=appearance, num=song_num)
+                for panelist in panelists:
+                    ScoreFactory(
+                        song=song,
+                        panelist=panelist,
+                        points=next(points) % 40 + 50,
+                    )
+    # Left blank; counts and averages must skip it.
+    blank = Score.objects.filter(
+        song__appearance__round__session=session,
+        panelist__kind=Panelist.KIND.official,
+    ).order_by('id').first()
+    Score.objects.filter(id=blank.id).update(points=None)
+    return session
+
+
+def get_old_totals(path):
+    """Sums and averages as the reports used to compute them on the fly."""
+    official = Q(**{'{0}panelist__kind'.format(path): Panelist.KIND.official})
+    points = '{0}points'.format(path)
+    annotations = {
+        'tot_points': Sum(points, filter=official),
+        'tot_score': Avg(points, filter=official),
+    }
+    for prefix, category in CATEGORIES.items():
+        category_filter = official & Q(**{
+            '{0}panelist__category'.format(path): category,
+        })
+        annotations['{0}_points'.format(prefix)] = Sum(points, filter=category_filter)
+        annotations['{0}_score'.format(prefix)] = Avg(points, filter=category_filter)
+    return annotations
+
+
+def assert_matches(stored, old):
+    for name, value in old.items():
+        if isinstance(value, float):
+            assert stored[name] == pytest.approx(value), name
+        else:
+            assert stored[name] == value, name
+
+
+def assert_songs_match(session):
+    annotations = get_old_totals('scores__')
+    annotations['tot_dev'] = StdDev(
+        'scores__points',
+        filter=Q(scores__panelist__kind=Panelist.KIND.official),
+    )
+    songs = Song.objects.filter(
+        appearance__round__session=session,
+    ).annotate(**annotations).values('id', *annotations.keys())
+    stored = {
+        x['song']: x
+        for x in SongAggregate.objects.filter(
+            song__appearance__round__session=session,
+        ).values('song', *annotations.keys())
+    }
+    assert len(stored) == 8
+    for song in songs:
+        assert_matches(stored[song.pop('id')], song)
+
+
+def test_song_aggregates(session):
+    assert_songs_match(session)
+
+
+def test_appearance_aggregates(session):
+    annotations = get_old_totals('songs__scores__')
+    appearances = Appearance.objects.filter(
+        round__session=session,
+    ).annotate(**annotations).values('id', *annotations.keys())
+    stored = {
+        x['appearance']: x
+        for x in AppearanceAggregate.objects.filter(
+            appearance__round__session=session,
+        ).values('appearance', *annotations.keys())
+    }
+    assert len(stored) == 4
+    for appearance in appearances:
+        assert_matches(stored[appearance.pop('id')], appearance)
+
+
+def test_group_aggregates(session):
+    annotations = get_old_totals('')
+    groups = Score.objects.filter(
+        song__appearance__round__session=session,
+    ).values('song__appearance__group').annotate(**annotations)
+    stored = {
+        x['group']: x
+        for x in GroupAggregate.objects.filter(
+            session=session,
+        ).values('group', *annotations.keys())
+    }
+    assert len(stored) == 2
+    for group in groups:
+        assert_matches(stored[group.pop('song__appearance__group')], group)
+
+
+def test_refresh_rewrites_existing_rows(session):
+    song_ids = list(
+        Song.objects.filter(
+            appearance__round__session=session,
+        ).values_list('id', flat=True)
+    )
+    before = dict(SongAggregate.objects.values_list('song', 'modified'))
+    # Out of step, as after a write that skipped the signals.
+    SongAggregate.objects.update(tot_points=0, tot_score=None)
+    SongAggregate.objects.refresh(song_ids)
+    assert SongAggregate.objects.count() == 8
+    assert not SongAggregate.objects.filter(tot_points=0).exists()
+    assert not SongAggregate.objects.filter(tot_score__isnull=True).exists()
+    for song_id, modified in SongAggregate.objects.values_list('song', 'modified'):
+        assert modified > before[song_id]
+    assert_songs_match(session)
@@ -0,0 +1,53 @@
+# Third-Party
+import pytest
+
+# First-Party
+from apps.rmanager.cubes import SessionScoreCube
+from apps.rmanager.models import Panelist
+from factories import AppearanceFactory
+from factories import GroupFactory
+from factories import PanelistFactory
+from factories import RoundFactory
+from factories import ScoreFactory
+from factories import SessionFactory
+from factories import SongFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def session():
+    """One round with a high and a low scoring group."""
+    session = SessionFactory()
+    round = RoundFactory(session=session)
+    panelists = [
+        PanelistFactory(round=round, num=num, category=category)
+        for num, category in enumerate([
+            Panelist.CATEGORY.music,
+            Panelist.CATEGORY.performance,
+            Panelist.CATEGORY.singing,
+        ], start=1)
+    ]
+    session.scored = []
+    for num, points in enumerate([80, 70], start=1):
+        group = GroupFactory()
+        appearance = AppearanceFactory(round=round, num=num, group=group)
+        song = SongFactory(appearance=appearance, num=1)
+        for panelist in panelists:
+            ScoreFactory(song=song, panelist=panelist, points=points)
+        session.scored.append(group.id)
+    return session
+
+
+def test_unscored_groups_rank_first(session):
+    # As NULLs sort under `ORDER BY tot DESC` in Postgres.
+    high, low = session.scored
+    unscored = GroupFactory().id
+    cube = SessionScoreCube(session)
+    group_ids = [low, unscored, high]
+    assert cube.get_ranking(group_ids) == [unscored, high, low]
+    assert cube.get_ranks(group_ids=group_ids) == {
+        unscored: 1,
+        high: 2,
+        low: 3,
+    }
@@ -0,0 +1,62 @@
+# Third-Party
+import django_rq
+import pytest
+from rq import SimpleWorker
+from rq import get_current_job
+
+# First-Party
+from apps.bhs.jobs import coalesced_job
+from apps.bhs.jobs import get_reference
+from factories import PersonFactory
+
+# The worker reads the row outside the test's transaction.
+pytestmark = pytest.mark.django_db(transaction=True)
+
+QUEUE = 'low'
+
+# Job ids that ran, and whether to trigger again from inside the job.
+runs = []
+retrigger = []
+
+
+@coalesced_job(QUEUE)
+def touch_person(person):
+    runs.append(get_current_job().id)
+    if retrigger:
+        retrigger.pop()
+        # Arrives mid-run; must queue one more pass.
+        touch_person.delay(person)
+    return
+
+
+@pytest.fixture
+def queue():
+    queue = django_rq.get_queue(QUEUE)
+    queue.empty()
+    del runs[:]
+    del retrigger[:]
+    yield queue
+    queue.empty()
+
+
+def work(queue):
+    SimpleWorker([queue], connection=queue.connection).work(burst=True)
+
+
+def test_waiting_triggers_are_coalesced(queue):
+    person = PersonFactory()
+    touch_person.delay(person)
+    assert touch_person.delay(person) is None
+    assert queue.count == 1
+    work(queue)
+    assert len(runs) == 1
+
+
+def test_trigger_while_running_queues_another_job(queue):
+    person = PersonFactory()
+    first = touch_person.delay(get_reference(person))
+    retrigger.append(True)
+    work(queue)
+    assert len(runs) == 2
+    assert runs[0] == first.id
+    assert runs[1] != first.id
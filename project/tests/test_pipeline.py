@@ -0,0 +1,92 @@
+# Standard Library
+import uuid
+
+# Third-Party
+import pytest
+
+# First-Party
+from apps.rmanager.pipeline import RoundPipeline
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    """A pipeline whose jobs are recorded rather than queued."""
+    pipeline = RoundPipeline(uuid.uuid4())
+    pipeline.queued = []
+
+    def enqueue(run, stage, depends_on=None):
+        pipeline.set_stage(stage, run=run, status='queued')
+        pipeline.queued.append((run, stage))
+        return stage
+
+    monkeypatch.setattr(pipeline, 'enqueue', enqueue)
+    for stage in RoundPipeline.STAGES:
+        monkeypatch.setattr(pipeline, 'run_{0}'.format(stage), lambda: None)
+    yield pipeline
+    pipeline.connection.delete(pipeline.key)
+
+
+def test_emails_wait_for_every_report(pipeline):
+    run = pipeline.start()
+    pipeline.request_emails()
+    for stage in RoundPipeline.REPORT_STAGES:
+        assert (run, 'emails') not in pipeline.queued
+        pipeline.run(run, stage)
+    assert pipeline.queued.count((run, 'emails')) == 1
+    # Asking again doesn't send them twice.
+    pipeline.request_emails()
+    assert pipeline.queued.count((run, 'emails')) == 1
+
+
+def test_failed_report_is_surfaced_and_restarted(pipeline, monkeypatch):
+    run = pipeline.start()
+    pipeline.request_emails()
+
+    def fail():
+        raise RuntimeError
+    monkeypatch.setattr(pipeline, 'run_csa', fail)
+    with pytest.raises(RuntimeError):
+        pipeline.run(run, 'csa')
+    pipeline.run(run, 'round')
+    pipeline.run(run, 'psa')
+    progress = pipeline.get_progress()
+    assert progress['failed'] == ['csa']
+    assert (run, 'emails') not in pipeline.queued
+
+    # Asking for the emails again starts over, and still sends them.
+    restart = pipeline.request_emails()
+    assert restart != run
+    progress = pipeline.get_progress()
+    assert progress['emails_requested']
+    assert progress['failed'] == []
+    monkeypatch.setattr(pipeline, 'run_csa', lambda: None)
+    for stage in RoundPipeline.REPORT_STAGES:
+        pipeline.run(restart, stage)
+    assert (restart, 'emails') in pipeline.queued
+
+
+def test_superseded_run_leaves_the_new_run_alone(pipeline, monkeypatch):
+    old = pipeline.start()
+    pipeline.run(old, 'aggregates')
+    new = []
+
+    def restart():
+        # Verified again while the old run is still rendering.
+        new.append(pipeline.start(emails=True))
+    monkeypatch.setattr(pipeline, 'run_round', restart)
+    pipeline.run(old, 'round')
+    new = new[0]
+    progress = pipeline.get_progress()
+    assert progress['run'] == new
+    assert progress['stages'][1]['status'] == 'queued'
+    assert int(pipeline.connection.hget(pipeline.key, 'reports_remaining')) == 3
+
+    # Leftover jobs from the old run stand down.
+    pipeline.run(old, 'csa')
+    assert pipeline.get_progress()['stages'][2]['status'] == 'queued'
+
+    monkeypatch.setattr(pipeline, 'run_round', lambda: None)
+    for stage in RoundPipeline.REPORT_STAGES:
+        pipeline.run(new, stage)
+    assert (old, 'emails') not in pipeline.queued
+    assert pipeline.queued.count((new, 'emails')) == 1
@@ -0,0 +1,84 @@
+# Third-Party
+import pytest
+from django_fsm_log.models import StateLog
+
+# First-Party
+from apps.bhs.generations import get_scopes
+from apps.rmanager import models
+from apps.rmanager.models import Appearance
+from apps.rmanager.models import Panelist
+from apps.rmanager.models import Score
+from factories import AppearanceFactory
+from factories import PanelistFactory
+from factories import RoundFactory
+
+# The side effects wait for the commit, so let each write commit.
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+class Recorder(object):
+    calls = []
+
+    def __init__(self, *args):
+        self.args = args
+
+    def __getattr__(self, name):
+        def method(*args, **kwargs):
+            self.calls.append((self.args, name, args, kwargs))
+        return method
+
+
+@pytest.fixture
+def recorder(monkeypatch):
+    Recorder.calls = []
+    monkeypatch.setattr(models, 'RoundFeed', Recorder)
+    monkeypatch.setattr(models, 'Generation', Recorder)
+    return Recorder
+
+
+def test_provision_publishes_and_bumps(recorder):
+    round = RoundFactory()
+    for num, category in enumerate([
+        Panelist.CATEGORY.ca,
+        Panelist.CATEGORY.music,
+        Panelist.CATEGORY.singing,
+    ], start=1):
+        PanelistFactory(round=round, num=num, category=category)
+    appearances = [AppearanceFactory(round=round, num=num) for num in [1, 2]]
+    # Already built; left alone.
+    AppearanceFactory(round=round, num=3, status=Appearance.STATUS.built)
+    ids = [x.id for x in appearances]
+    Recorder.calls = []
+
+    provisioned = round.provision()
+
+    assert sorted(x.id for x in provisioned) == sorted(ids)
+    assert set(
+        Appearance.objects.filter(id__in=ids).values_list('status', flat=True)
+    ) == {Appearance.STATUS.built}
+    # Two songs apiece, scored by everyone but the CA.
+    assert Score.objects.filter(song__appearance__in=ids).count() == 2 * 2 * 2
+    assert StateLog.objects.filter(
+        object_id__in=[str(x) for x in ids],
+        transition='build',
+    ).count() == 2
+    # What post_transition would have done for each appearance.
+    feeds = [x for x in Recorder.calls if x[0] == (round.id,)]
+    assert len(feeds) == 1
+    _, name, args, kwargs = feeds[0]
+    assert name == 'publish_many'
+    assert sorted(x[1] for x in args[0]) == sorted(ids)
+    assert set(x[0] for x in args[0]) == {'appearance'}
+    assert kwargs == {
+        'status': Appearance.STATUS.built,
+        'transition': 'build',
+    }
+    assert ((), 'bump', (get_scopes(round),), {}) in Recorder.calls
+
+
+def test_provision_without_new_appearances(recorder):
+    round = RoundFactory()
+    AppearanceFactory(round=round, num=1, status=Appearance.STATUS.built)
+    Recorder.calls = []
+    assert round.provision() == []
+    assert Recorder.calls == []
@@ -0,0 +1,117 @@
+# Third-Party
+import pytest
+
+# Django
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+# First-Party
+from apps.rmanager import reports
+from apps.rmanager.models import Panelist
+from apps.rmanager.models import Round
+from apps.rmanager.reports import Report
+from apps.rmanager.reports import count_pages
+from apps.rmanager.reports import fit_pdf
+from factories import AppearanceFactory
+from factories import ContenderFactory
+from factories import OutcomeFactory
+from factories import PanelistFactory
+from factories import RoundFactory
+from factories import ScoreFactory
+from factories import SongFactory
+
+pytestmark = pytest.mark.django_db
+
+# Queries allowed to build the OSS context, regardless of round size.
+OSS_QUERY_BUDGET = 20
+
+
+def build_round(size):
+    round = RoundFactory()
+    outcome = OutcomeFactory(round=round)
+    panelists = [
+        PanelistFactory(round=round, num=i, category=category)
+        for i, category in enumerate([
+            Panelist.CATEGORY.ca,
+            Panelist.CATEGORY.music,
+            Panelist.CATEGORY.performance,
+            Panelist.CATEGORY.singing,
+        ], start=1)
+    ]
+    for i in range(size):
+        appearance = AppearanceFactory(round=round, num=i + 1)
+        ContenderFactory(appearance=appearance, outcome=outcome)
+        for num in [1, 2]:
+            song = SongFactory(appearance=appearance, num=num)
+            for panelist in panelists[1:]:
+                ScoreFactory(song=song, panelist=panelist)
+    return Round.objects.get(id=round.id)
+
+
+def count_oss_queries(round):
+    with CaptureQueriesContext(connection) as context:
+        round.get_oss_context()
+    return len(context.captured_queries)
+
+
+def test_oss_context_query_count():
+    small = count_oss_queries(build_round(5))
+    large = count_oss_queries(build_round(50))
+    assert large == small
+    assert large <= OSS_QUERY_BUDGET
+
+
+
+def make_pdf(pages):
+    return b'<< /Type /Pages /Count 2 >>' + b'<< /Type /Page >>' * pages
+
+
+@pytest.fixture
+def fits(monkeypatch):
+    """
+    Fake the conversion so that a report fits on one page at and below
+    the given zoom; returns the zooms probed.
+    """
+    def install(limit):
+        zooms = []
+
+        def convert(rendered, options):
+            zooms.append(options['zoom'])
+            return make_pdf(1 if options['zoom'] <= limit else 2), 0
+
+        monkeypatch.setattr(reports, 'render_to_string', lambda *args: '')
+        monkeypatch.setattr(reports, 'convert', convert)
+        return zooms
+    return install
+
+
+def test_count_pages():
+    assert count_pages(make_pdf(0)) == 0
+    assert count_pages(make_pdf(3)) == 3
+    assert count_pages(b'/Type/Page/Type /Pages') == 1
+
+
+@pytest.mark.parametrize('zoom', [None, 0.6, 0.73, 0.9])
+def test_fit_pdf_finds_the_largest_zoom(fits, zoom):
+    probes = fits(0.73)
+    content, found = fit_pdf(Report('oss.html', {}, {}), zoom=zoom)
+    assert found == 0.73
+    assert count_pages(content.read()) == 1
+    # Always re-probed from the top, never at the same zoom twice.
+    assert probes[0] == 1.0
+    assert len(probes) == len(set(probes))
+
+
+def test_fit_pdf_grows_back(fits):
+    # Fitted at 0.6 before; the report has since shrunk.
+    probes = fits(1.0)
+    content, found = fit_pdf(Report('oss.html', {}, {}), zoom=0.6)
+    assert found == 1.0
+    assert probes == [1.0]
+
+
+def test_fit_pdf_falls_back_to_the_minimum(fits):
+    fits(0.1)
+    content, found = fit_pdf(Report('oss.html', {}, {}), minimum=0.5)
+    assert found == 0.5
+    assert count_pages(content.read()) == 2
@@ -0,0 +1,118 @@
+# Third-Party
+import pytest
+
+# Django
+from django.core.exceptions import ValidationError
+
+# First-Party
+from apps.rmanager.models import Panelist
+from apps.rmanager.models import Round
+from apps.rmanager.models import Score
+from apps.rmanager.models import SongAggregate
+from factories import AppearanceFactory
+from factories import PanelistFactory
+from factories import ScoreFactory
+from factories import SongFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def appearance():
+    appearance = AppearanceFactory()
+    panelists = [
+        PanelistFactory(round=appearance.round, num=i, category=category)
+        for i, category in enumerate([
+            Panelist.CATEGORY.music,
+            Panelist.CATEGORY.singing,
+        ], start=1)
+    ]
+    for num in [1, 2]:
+        song = SongFactory(appearance=appearance, num=num)
+        for panelist in panelists:
+            ScoreFactory(song=song, panelist=panelist, points=70)
+    return appearance
+
+
+def get_rows(appearance, points=75):
+    return [
+        {'song': x.song_id, 'panelist': x.panelist_id, 'points': points}
+        for x in Score.objects.filter(song__appearance=appearance)
+    ]
+
+
+def assert_unchanged(appearance):
+    assert set(
+        Score.objects.filter(
+            song__appearance=appearance,
+        ).values_list('points', flat=True)
+    ) == {70}
+
+
+@pytest.mark.parametrize('points, message', [
+    ('ninety', 'Points must be a number.'),
+    (True, 'Points must be a number.'),
+    (101, 'Points must be between 0 - 100'),
+    (-1, 'Points must be between 0 - 100'),
+])
+def test_rejects_bad_points(appearance, points, message):
+    rows = get_rows(appearance)
+    rows[-1]['points'] = points
+    with pytest.raises(ValidationError) as error:
+        appearance.set_scoresheet(rows)
+    assert error.value.message_dict['scores'] == [
+        'Row {0}: {1}'.format(len(rows), message),
+    ]
+    assert_unchanged(appearance)
+
+
+def test_rejects_unknown_and_duplicate_cells(appearance):
+    rows = get_rows(appearance)
+    other = ScoreFactory(points=70)
+    rows.append({'song': other.song_id, 'panelist': other.panelist_id, 'points': 75})
+    rows.append(dict(rows[0]))
+    with pytest.raises(ValidationError) as error:
+        appearance.set_scoresheet(rows)
+    assert error.value.message_dict['scores'] == [
+        'Row 5: No score for that song and panelist.',
+        'Row 6: Duplicate score.',
+    ]
+    assert_unchanged(appearance)
+
+
+def test_rejects_verified_round(appearance):
+    Round.objects.filter(id=appearance.round_id).update(status=Round.STATUS.verified)
+    appearance.round.refresh_from_db()
+    with pytest.raises(ValidationError):
+        appearance.set_scoresheet(get_rows(appearance))
+    assert_unchanged(appearance)
+
+
+def test_writes_points_and_modified(appearance):
+    before = dict(
+        Score.objects.filter(song__appearance=appearance).values_list('id', 'modified')
+    )
+    rows = get_rows(appearance)
+    rows[0]['points'] = None
+    updates = appearance.set_scoresheet(rows)
+    assert len(updates) == 4
+    scores = Score.objects.filter(song__appearance=appearance)
+    for score in scores:
+        assert score.points == updates[score.id]
+        assert score.modified > before[score.id]
+    # The aggregates are refreshed with the write.
+    totals = dict(
+        SongAggregate.objects.filter(
+            song__appearance=appearance,
+        ).values_list('song__num', 'tot_points')
+    )
+    assert sorted(totals.values()) == [75, 150]
+
+
+def test_clears_every_score(appearance):
+    updates = appearance.set_scoresheet(get_rows(appearance, points=None))
+    assert set(updates.values()) == {None}
+    assert not Score.objects.filter(
+        song__appearance=appearance,
+        points__isnull=False,
+    ).exists()
@@ -0,0 +1,53 @@
+# Standard Library
+import uuid
+
+# Third-Party
+import pytest
+
+# First-Party
+from apps.rmanager.standings import Standings
+
+
+@pytest.fixture
+def standings():
+    standings = Standings.for_round(uuid.uuid4())
+    yield standings
+    standings.clear()
+
+
+def totals(tot, sng, per):
+    return {
+        'tot_points': tot,
+        'sng_points': sng,
+        'per_points': per,
+        'mus_points': tot - sng - per,
+        'tot_score': None,
+    }
+
+
+def test_ranking_order(standings):
+    standings.update({
+        'a': totals(600, 200, 200),
+        'b': totals(620, 200, 210),
+        # Tied on total; singing breaks it.
+        'c': totals(600, 210, 190),
+        # Tied on total and singing; performance breaks it.
+        'd': totals(600, 210, 195),
+        # Dead heat with `a`.
+        'e': totals(600, 200, 200),
+    })
+    ranked = [(x['id'], x['rank']) for x in standings.get_standings()]
+    assert [x[0] for x in ranked[:3]] == ['b', 'd', 'c']
+    assert sorted(ranked[3:]) == [('a', 4), ('e', 4)]
+
+
+def test_ranking_after_update(standings):
+    standings.update({
+        'a': totals(600, 200, 200),
+        'b': totals(590, 200, 200),
+    })
+    standings.update({
+        'b': totals(610, 200, 200),
+    })
+    assert [x['id'] for x in standings.get_standings()] == ['b', 'a']
+    assert [x['rank'] for x in standings.get_standings(start=1)] == [2]
@@ -0,0 +1,46 @@
+# Third-Party
+import pytest
+
+# Django
+from django.core.files.base import ContentFile
+
+# First-Party
+from apps.bhs.storages import CachedStorage
+
+
+@pytest.fixture
+def storage(tmp_path, settings):
+    settings.MEDIA_ROOT = str(tmp_path / 'media')
+    return CachedStorage(
+        backend='django.core.files.storage.FileSystemStorage',
+        location=str(tmp_path / 'cache'),
+        max_size=10,
+        max_age=0,
+    )
+
+
+def test_write_through(storage):
+    name = storage.save('reports/a.pdf', ContentFile(b'abcd'))
+    assert storage.backend.exists(name)
+    assert storage.read_meta(name)['size'] == 4
+    with storage.open(name) as f:
+        assert f.read() == b'abcd'
+
+
+def test_stale_copy_is_refetched(storage):
+    name = storage.save('reports/a.pdf', ContentFile(b'abcd'))
+    storage.backend.delete(name)
+    storage.backend.save(name, ContentFile(b'efghij'))
+    with storage.open(name) as f:
+        assert f.read() == b'efghij'
+
+
+def test_least_recently_used_is_evicted(storage):
+    first = storage.save('reports/a.pdf', ContentFile(b'aaaa'))
+    second = storage.save('reports/b.pdf', ContentFile(b'bbbb'))
+    storage.open(first).close()
+    storage.save('reports/c.pdf', ContentFile(b'cccc'))
+    assert storage.read_meta(first) is not None
+    assert storage.read_meta(second) is None
+    with storage.open(second) as f:
+        assert f.read() == b'bbbb'
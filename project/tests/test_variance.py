@@ -0,0 +1,106 @@
+# Third-Party
+import pytest
+
+# First-Party
+from apps.rmanager.models import Panelist
+from apps.rmanager.models import Song
+from apps.rmanager.variance import VarianceEngine
+from factories import AppearanceFactory
+from factories import PanelistFactory
+from factories import ScoreFactory
+from factories import SongFactory
+
+pytestmark = pytest.mark.django_db
+
+MUS = Panelist.CATEGORY.music
+PER = Panelist.CATEGORY.performance
+SNG = Panelist.CATEGORY.singing
+
+
+def make_songs(categories, sheets):
+    """One song per row of `sheets`, scored by a panel of `categories`."""
+    appearance = AppearanceFactory()
+    panelists = [
+        PanelistFactory(round=appearance.round, num=i, category=category)
+        for i, category in enumerate(categories, start=1)
+    ]
+    songs = []
+    for num, points in enumerate(sheets, start=1):
+        song = SongFactory(appearance=appearance, num=num)
+        for panelist, x in zip(panelists, points):
+            ScoreFactory(song=song, panelist=panelist, points=x)
+        songs.append(song)
+    return appearance.round, songs
+
+
+def get_flags(songs):
+    return [
+        (x.asterisks, x.dixons)
+        for x in Song.objects.filter(
+            id__in=[x.id for x in songs],
+        ).order_by('num')
+    ]
+
+
+def test_three_judge_panel():
+    round, songs = make_songs(
+        [MUS, PER, SNG],
+        [
+            [70, 70, 70],
+            # A ten-point gap isn't enough for Q at .941 ...
+            [60, 70, 71],
+            # ... but a twenty-point one is.
+            [50, 70, 71],
+            [71, 70, 91],
+        ],
+    )
+    flagged = VarianceEngine(round).save()
+    assert flagged == {songs[2].id, songs[3].id}
+    assert get_flags(songs) == [
+        ([], []),
+        ([], []),
+        ([], [MUS]),
+        ([], [SNG]),
+    ]
+
+
+def test_six_judge_panel():
+    round, songs = make_songs(
+        [MUS, MUS, PER, PER, SNG, SNG],
+        [
+            [70, 70, 70, 70, 70, 70],
+            # Music is split by twelve; the low score is an outlier too.
+            [60, 72, 70, 70, 71, 71],
+            # Five from the category average is still within bounds.
+            [65, 75, 70, 70, 70, 70],
+        ],
+    )
+    flagged = VarianceEngine(round).save()
+    assert flagged == {songs[1].id}
+    assert get_flags(songs) == [
+        ([], []),
+        ([MUS], [MUS]),
+        ([], []),
+    ]
+
+
+def test_untabulated_panel_gets_asterisks_only():
+    round, songs = make_songs(
+        [MUS, MUS, SNG, SNG],
+        [[50, 70, 71, 71]],
+    )
+    VarianceEngine(round).save()
+    assert get_flags(songs) == [([MUS], [])]
+
+
+def test_save_clears_stale_flags_and_advances_modified():
+    round, songs = make_songs(
+        [MUS, PER, SNG],
+        [[70, 70, 70]],
+    )
+    Song.objects.filter(id=songs[0].id).update(asterisks=[MUS], dixons=[MUS])
+    before = Song.objects.get(id=songs[0].id).modified
+    assert VarianceEngine(round).save() == set()
+    song = Song.objects.get(id=songs[0].id)
+    assert (song.asterisks, song.dixons) == ([], [])
+    assert song.modified > before
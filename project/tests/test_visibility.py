@@ -0,0 +1,101 @@
+# Third-Party
+import pytest
+
+# Django
+from django.db import transaction
+
+# First-Party
+from apps.bhs.models import Member
+from apps.rmanager.managers import VisibilityManager
+from factories import MemberFactory
+from factories import PanelistFactory
+from factories import PersonFactory
+from factories import RoundFactory
+from factories import UserFactory
+
+# The refreshes wait for the commit, so let each write commit.
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+@pytest.fixture
+def refreshes(monkeypatch):
+    calls = []
+
+    def refresh(self, user_ids=None, round_ids=None):
+        if user_ids:
+            calls.append(('users', set(user_ids)))
+        if round_ids:
+            calls.append(('rounds', set(round_ids)))
+    monkeypatch.setattr(VisibilityManager, 'refresh', refresh)
+    return calls
+
+
+def test_unchanged_member_is_skipped(refreshes):
+    user = UserFactory()
+    member = MemberFactory(person=PersonFactory(user=user))
+    assert refreshes == [('users', {user.id})]
+    del refreshes[:]
+    member.part = member.PART.bass
+    member.save()
+    assert refreshes == []
+    member.status = member.STATUS.inactive
+    member.save()
+    assert refreshes == [('users', {user.id})]
+
+
+def test_moved_member_refreshes_both_users(refreshes):
+    old, new = UserFactory(), UserFactory()
+    member = MemberFactory(person=PersonFactory(user=old))
+    del refreshes[:]
+    member.person = PersonFactory(user=new)
+    member.save()
+    assert refreshes == [('users', {old.id, new.id})]
+
+
+def test_panelist_saves_are_coalesced(refreshes):
+    round = RoundFactory()
+    users = [UserFactory() for _ in range(3)]
+    del refreshes[:]
+    with transaction.atomic():
+        for num, user in enumerate(users, start=1):
+            PanelistFactory(round=round, num=num, person=PersonFactory(user=user))
+        assert refreshes == []
+    assert refreshes == [('users', set(x.id for x in users))]
+
+
+def test_rolled_back_batch_is_dropped(refreshes):
+    user = UserFactory()
+    person = PersonFactory(user=user)
+    member = MemberFactory(person=person)
+    del refreshes[:]
+    with pytest.raises(RuntimeError):
+        with transaction.atomic():
+            member.status = member.STATUS.inactive
+            member.save()
+            raise RuntimeError
+    member = Member.objects.get(id=member.id)
+    member.status = member.STATUS.inactive
+    member.save()
+    assert refreshes == [('users', {user.id})]
+
+
+def test_rollback_then_transaction_still_refreshes(refreshes):
+    users = [UserFactory(), UserFactory()]
+    round = RoundFactory()
+    del refreshes[:]
+    with pytest.raises(RuntimeError):
+        with transaction.atomic():
+            PanelistFactory(round=round, num=1, person=PersonFactory(user=users[0]))
+            raise RuntimeError
+    with transaction.atomic():
+        PanelistFactory(round=round, num=2, person=PersonFactory(user=users[1]))
+    assert refreshes == [('users', {users[1].id})]
+
+
+def test_relinked_person_refreshes_both_users(refreshes):
+    old, new = UserFactory(), UserFactory()
+    person = PersonFactory(user=old)
+    del refreshes[:]
+    person.user = new
+    person.save()
+    assert refreshes == [('users', {old.id, new.id})]